@@ -0,0 +1,158 @@
+"""Measure JSON decode time and peak memory for large Jira response pages.
+
+Compares the previous path (``response.text`` followed by ``response.json()``,
+which builds a str copy of the body before parsing) with decoding once from
+bytes using each installed backend, and with the typed msgspec decoders for
+page shapes that have one.
+
+Usage:
+    python -m benchmarks.bench_decode --issues 5000 --repeat 5
+"""
+
+import argparse
+import gc
+import json
+import logging
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from benchmarks.fake_jira import BASE_URL, FakeJira
+from jira_mcp import decoding
+from jira_mcp.records import RECORD_FIELDS
+
+
+def _text_then_json(content: bytes) -> Any:
+    # A fresh response each call, since httpx caches the decoded text
+    response = httpx.Response(200, content=content, headers={"Content-Type": "application/json"})
+    return response.json() if response.text else {}
+
+
+def _decoders(schema: Optional[str]) -> Dict[str, Callable[[bytes], Any]]:
+    """Decoders to compare for one page shape, by label."""
+    decoders: Dict[str, Callable[[bytes], Any]] = {
+        "text + json()": _text_then_json,
+        "bytes: json": json.loads,
+    }
+    if decoding._installed("orjson"):
+        decoders["bytes: orjson"] = decoding._build_loads("orjson")
+    if decoding._installed("msgspec"):
+        decoders["bytes: msgspec"] = decoding._build_loads("msgspec")
+        typed = decoding._build_typed_decoders().get(schema) if schema else None
+        if typed is not None:
+            decoders["bytes: msgspec typed"] = typed
+    return decoders
+
+
+def _measure(decode: Callable[[bytes], Any], content: bytes, repeat: int) -> Dict[str, float]:
+    """Best-of-repeat decode time, then peak traced memory of a single decode."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(content)
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    decode(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": best * 1000, "peak": peak}
+
+
+def _cloud_shaped(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the URLs and details Jira Cloud puts on every user, status, type and priority."""
+    fields = dict(issue["fields"])
+    for name in ("assignee", "reporter"):
+        user = fields.get(name)
+        if user:
+            avatar = f"https://avatar-management.example/{user['accountId']}"
+            fields[name] = {
+                **user,
+                "self": f"{BASE_URL}/rest/api/3/user?accountId={user['accountId']}",
+                "avatarUrls": {size: f"{avatar}/{size}" for size in ("48x48", "24x24", "16x16")},
+                "active": True,
+                "timeZone": "Europe/Berlin",
+                "accountType": "atlassian",
+            }
+    for name in ("status", "issuetype", "priority"):
+        value = fields.get(name)
+        if value:
+            fields[name] = {
+                **value,
+                "self": f"{BASE_URL}/rest/api/3/{name}/{value.get('id', 1)}",
+                "iconUrl": f"{BASE_URL}/images/icons/{name}/{value['name'].lower()}.svg",
+                "description": f"The {value['name']} {name}",
+            }
+    expand = "operations,versionedRepresentations,editmeta,changelog"
+    return {**issue, "expand": expand, "fields": fields}
+
+
+def _pages(issues: int) -> List[Dict[str, Any]]:
+    """Large response bodies as served by FakeJira."""
+    fake = FakeJira(issues=issues, projects=1, history=12)
+    client = fake.client()
+
+    params = {"jql": "project = PROJ0", "maxResults": issues, "fields": "*all"}
+    search = client._request("GET", "/search/jql", params=params)
+    params = {"jql": "project = PROJ0", "maxResults": issues, "fields": ",".join(RECORD_FIELDS)}
+    records = client._request("GET", "/search/jql", params=params).json()
+    records["issues"] = [_cloud_shaped(issue) for issue in records["issues"]]
+    histories = [history for values in fake.changelogs.values() for history in values]
+    changelog = {
+        "startAt": 0,
+        "maxResults": len(histories),
+        "total": len(histories),
+        "isLast": True,
+        "values": histories,
+    }
+    return [
+        {"page": f"/search/jql ({issues} issues)", "schema": None, "content": search.content},
+        {
+            "page": "/search/jql (record fields)",
+            "schema": "search",
+            "content": json.dumps(records).encode(),
+        },
+        {
+            "page": f"/changelog ({len(histories)} histories)",
+            "schema": "changelog",
+            "content": json.dumps(changelog).encode(),
+        },
+    ]
+
+
+def run(issues: int, repeat: int) -> List[Dict[str, Any]]:
+    """Measure every decoder on every page."""
+    results = []
+    for page in _pages(issues):
+        for label, decode in _decoders(page["schema"]).items():
+            measured = _measure(decode, page["content"], repeat)
+            results.append(
+                {"page": page["page"], "bytes": len(page["content"]), "decoder": label, **measured}
+            )
+    return results
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Compare JSON decoding of large Jira pages")
+    parser.add_argument("--issues", type=int, default=5000, help="Issues per page (default: 5000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per decoder (default: 5)")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    results = run(args.issues, args.repeat)
+
+    print(f"{'page':<30} {'body MB':>8} {'decoder':<22} {'best ms':>8} {'peak MB':>8}")
+    for r in results:
+        print(
+            f"{r['page']:<30} {r['bytes'] / 1e6:>8.1f} {r['decoder']:<22} "
+            f"{r['ms']:>8.1f} {r['peak'] / 1e6:>8.1f}"
+        )
+    print(f"\nActive backend: {decoding.BACKEND} (typed decoders: {decoding.TYPED})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Measure what a log call costs the thread that makes it.
+
+Compares the previous setup (f-string messages, formatted and written to
+stderr synchronously by ``logging.basicConfig``'s handler) with lazy
+``%``-style arguments, the queue handler from ``jira_mcp.logs`` and event
+sampling. Output goes to os.devnull, or to a sink that sleeps on every write
+with ``--write-delay`` to stand in for a slow or full stderr pipe.
+
+Only the calling thread is timed; records handed to the queue are written by
+the listener thread afterwards.
+
+Usage:
+    python -m benchmarks.bench_logging --calls 20000
+    python -m benchmarks.bench_logging --calls 2000 --write-delay 0.0001
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from jira_mcp import logs
+from jira_mcp.logs import SAMPLED
+
+JQL = 'project = PROJ AND status in ("In Progress", "In Review") ORDER BY updated DESC'
+
+logger = logging.getLogger("jira_mcp.jira_client")
+
+
+class _SlowSink(io.TextIOBase):
+    """Text stream that discards writes after sleeping for a fixed delay."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def write(self, s: str) -> int:
+        time.sleep(self.delay)
+        return len(s)
+
+
+def _eager(page: int) -> None:
+    logger.info(f"Searching issues with JQL: {JQL} (page {page})")
+
+
+def _lazy(page: int) -> None:
+    logger.info("Searching issues with JQL: %s (page %s)", JQL, page)
+
+
+def _lazy_sampled(page: int) -> None:
+    logger.info("Searching issues with JQL: %s (page %s)", JQL, page, extra=SAMPLED)
+
+
+def _eager_debug(page: int) -> None:
+    logger.debug(f"Getting changelog for {JQL} from {page}")
+
+
+def _lazy_debug(page: int) -> None:
+    logger.debug("Getting changelog for %s from %s", JQL, page)
+
+
+# (label, log call, configure_logging arguments; None: the previous basicConfig setup)
+CASES: List[Dict[str, Any]] = [
+    {"case": "basicConfig, f-string", "call": _eager, "setup": None},
+    {"case": "disabled level, f-string", "call": _eager_debug, "setup": {}},
+    {"case": "disabled level, lazy", "call": _lazy_debug, "setup": {}},
+    {"case": "sync handler, f-string", "call": _eager, "setup": {"use_queue": False}},
+    {"case": "sync handler, lazy", "call": _lazy, "setup": {"use_queue": False}},
+    {"case": "queue handler, lazy", "call": _lazy, "setup": {}},
+    {"case": "queue handler, json", "call": _lazy, "setup": {"fmt": "json"}},
+    {"case": "queue, sampled 1 in 10", "call": _lazy_sampled, "setup": {"sample_every": 10}},
+]
+
+
+def _measure(
+    call: Callable[[int], None], setup: Optional[Dict[str, Any]], calls: int, sink: Any
+) -> float:
+    """Microseconds per call in the calling thread, with logging set up as given."""
+    with contextlib.redirect_stderr(sink):
+        if setup is None:
+            logging.basicConfig(level=logging.INFO, format=logs.TEXT_FORMAT, force=True)
+        else:
+            logs.configure_logging(**setup)
+        try:
+            started = time.perf_counter()
+            for page in range(calls):
+                call(page)
+            elapsed = time.perf_counter() - started
+        finally:
+            # Drains the queue, so a slow sink does not spill into the next case
+            logs.stop_listener()
+    return elapsed / calls * 1e6
+
+
+def run(calls: int, write_delay: float) -> List[Dict[str, Any]]:
+    """Measure every case."""
+    results = []
+    with open(os.devnull, "w") as devnull:
+        sink = _SlowSink(write_delay) if write_delay else devnull
+        for case in CASES:
+            per_call = _measure(case["call"], case["setup"], calls, sink)
+            results.append({"case": case["case"], "us": per_call})
+    return results
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Compare the per-call cost of logging setups")
+    parser.add_argument(
+        "--calls", type=int, default=20000, help="Log calls per case (default: 20000)"
+    )
+    parser.add_argument(
+        "--write-delay",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="Sleep this long on every write to simulate a slow stderr (default: 0)",
+    )
+    args = parser.parse_args()
+
+    results = run(args.calls, args.write_delay)
+
+    print(f"{'case':<26} {'us/call':>8}")
+    for r in results:
+        print(f"{r['case']:<26} {r['us']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
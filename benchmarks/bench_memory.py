@@ -0,0 +1,90 @@
+"""Measure memory held by search results as raw dicts versus IssueRecords.
+
+Issues are fetched from FakeJira through the real client (so every issue is
+decoded from its own JSON response, as with a live Jira), retained in a list,
+and measured with tracemalloc.
+
+Usage:
+    python -m benchmarks.bench_memory --issues 10000
+"""
+
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fake_jira import FakeJira
+from jira_mcp.records import RECORD_FIELDS, iter_records
+from jira_mcp.server import format_issue_summary
+
+
+def _retained(build: Callable[[], List[Any]]) -> Dict[str, Any]:
+    """Build a list and report the memory it keeps alive after collection."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    items = build()
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for item in items:
+        format_issue_summary(item)
+    format_ms = (time.perf_counter() - started) * 1000
+    return {
+        "items": items,
+        "retained": retained,
+        "peak": peak,
+        "build_s": elapsed,
+        "format_ms": format_ms,
+    }
+
+
+def run(issues: int) -> List[Dict[str, Any]]:
+    """Measure both representations for the same result set."""
+    fake = FakeJira(issues=issues, projects=1)
+    client = fake.client()
+    jql = "project = PROJ0"
+
+    results = []
+    for label, build in (
+        ("raw dicts", lambda: list(client.iter_issues(jql, fields=RECORD_FIELDS, limit=issues))),
+        ("IssueRecord", lambda: list(iter_records(client, jql, limit=issues))),
+    ):
+        measured = _retained(build)
+        count = len(measured.pop("items"))
+        results.append({"representation": label, "issues": count, **measured})
+    return results
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Compare memory of raw issues vs IssueRecords")
+    parser.add_argument("--issues", type=int, default=10000, help="Issues to hold (default: 10000)")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    results = run(args.issues)
+
+    print(
+        f"{'representation':<14} {'issues':>7} {'retained MB':>12} {'per 10k MB':>11} "
+        f"{'bytes/issue':>12} {'peak MB':>9} {'build s':>8} {'format ms':>10}"
+    )
+    for r in results:
+        per_issue = r["retained"] / r["issues"] if r["issues"] else 0.0
+        print(
+            f"{r['representation']:<14} {r['issues']:>7} {r['retained'] / 1e6:>12.2f} "
+            f"{per_issue * 10000 / 1e6:>11.2f} {per_issue:>12.0f} {r['peak'] / 1e6:>9.2f} "
+            f"{r['build_s']:>8.2f} {r['format_ms']:>10.1f}"
+        )
+    if len(results) == 2 and results[1]["retained"]:
+        ratio = results[0]["retained"] / results[1]["retained"]
+        print(f"\nIssueRecord uses {ratio:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
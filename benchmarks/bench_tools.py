@@ -0,0 +1,303 @@
+"""Benchmark every MCP tool against the local FakeJira stand-in.
+
+Runs each tool with representative arguments and reports throughput and
+p50/p99 end-to-end latency, plus per-endpoint HTTP statistics from the
+built-in metrics registry.
+
+Usage:
+    python -m benchmarks.bench_tools --issues 2000 --latency 0.02 --iterations 50
+    python -m benchmarks.bench_tools --tools jira_search jira_get_issue --json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.fake_jira import STATUSES, FakeJira
+from jira_mcp import server
+from jira_mcp.attachments import default_upload_dir
+from jira_mcp.jobs import manager as job_manager
+from jira_mcp.metrics import registry
+from jira_mcp.stats import StreamingHistogram
+
+# Representative arguments per tool; called with the fake dataset and iteration number
+ToolArguments = Callable[[FakeJira, int], Dict[str, Any]]
+
+
+def _issue_key(fake: FakeJira, i: int) -> str:
+    keys = list(fake.issues)
+    return keys[i % len(keys)]
+
+
+def _next_status(fake: FakeJira, key: str) -> str:
+    current = fake.issues[key]["fields"]["status"]["name"]
+    return STATUSES[(STATUSES.index(current) + 1) % len(STATUSES)]
+
+
+def _attachment_file() -> str:
+    """A 4 MiB file to upload, created on first use in the upload directory."""
+    name = "jira-mcp-bench-attachment.bin"
+    path = os.path.join(default_upload_dir(), name)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(os.urandom(4 * 1024 * 1024))
+    return name
+
+
+def _attachment_id(fake: FakeJira) -> str:
+    if not fake.attachments:
+        key = next(iter(fake.issues))
+        fake.add_attachment(key, "seed.bin", iter([os.urandom(4 * 1024 * 1024)]))
+    return next(iter(fake.attachments))
+
+
+SCENARIOS: Dict[str, ToolArguments] = {
+    "jira_search": lambda fake, i: {"jql": "project = PROJ0 ORDER BY updated DESC"},
+    "jira_get_issue": lambda fake, i: {"issue_key": _issue_key(fake, i)},
+    "jira_create_issue": lambda fake, i: {
+        "project_key": "PROJ1",
+        "summary": f"Benchmark issue {i}",
+        "issue_type": "Task",
+        "description": "Created by the benchmark harness",
+    },
+    "jira_find_similar": lambda fake, i: {
+        "project_key": "PROJ0",
+        "summary": fake.issues[_issue_key(fake, i)]["fields"]["summary"],
+    },
+    "jira_update_issue": lambda fake, i: {
+        "issue_key": _issue_key(fake, i),
+        "summary": f"Updated summary {i}",
+        "labels": ["bench"],
+    },
+    "jira_update_issues": lambda fake, i: {
+        "jql": "project = PROJ0",
+        "add_labels": [f"bench-{i % 2}"],
+        "remove_labels": [f"bench-{(i + 1) % 2}"],
+    },
+    "jira_add_comment": lambda fake, i: {
+        "issue_key": _issue_key(fake, i),
+        "comment": f"Comment {i}",
+    },
+    "jira_transition_issue": lambda fake, i: {
+        "issue_key": _issue_key(fake, i),
+        "transition_name": _next_status(fake, _issue_key(fake, i)),
+    },
+    "jira_list_projects": lambda fake, i: {},
+    "jira_link_issues": lambda fake, i: {
+        "inward_issue": _issue_key(fake, i),
+        "outward_issue": _issue_key(fake, i + 1),
+    },
+    "jira_get_epic_issues": lambda fake, i: {"epic_key": _issue_key(fake, i)},
+    "jira_get_transitions": lambda fake, i: {"issue_key": _issue_key(fake, i)},
+    "jira_search_users": lambda fake, i: {"query": f"user {i % 10}"},
+    "jira_assign_issue": lambda fake, i: {
+        "issue_key": _issue_key(fake, i),
+        "account_id": f"user-{i % 5}",
+    },
+    "jira_update_issue_dates": lambda fake, i: {
+        "issue_key": _issue_key(fake, i),
+        "duedate": "2030-01-01",
+    },
+    "jira_cycle_time": lambda fake, i: {"jql": "project = PROJ2", "max_issues": 200},
+    "jira_log_work": lambda fake, i: {
+        "entries": [
+            {
+                "issue_key": _issue_key(fake, i * 10 + n),
+                "time_spent": f"{n + 1}h",
+                "started": "2030-01-02",
+            }
+            for n in range(10)
+        ]
+    },
+    "jira_time_report": lambda fake, i: {
+        "jql": "project = PROJ0",
+        "since": "2000-01-01",
+        "until": "2100-01-01",
+        "max_issues": 200,
+    },
+    "jira_board_issues": lambda fake, i: {"project_key": "PROJ0", "backlog": bool(i % 2)},
+    "jira_sprint_report": lambda fake, i: {"project_key": "PROJ1"},
+    "jira_export": lambda fake, i: {
+        "jql": "project = PROJ0",
+        "format": "csv" if i % 2 else "ndjson",
+        "path": f"jira-mcp-bench-export-{i % 2}",
+        "overwrite": True,
+    },
+    "jira_attach_file": lambda fake, i: {
+        "issue_key": _issue_key(fake, i),
+        "file_path": _attachment_file(),
+    },
+    "jira_download_attachment": lambda fake, i: {
+        "attachment_id": _attachment_id(fake),
+        "path": "jira-mcp-bench-download.bin",
+        "overwrite": True,
+    },
+    "jira_batch": lambda fake, i: {
+        "operations": [
+            {
+                "id": "epic",
+                "tool": "jira_create_issue",
+                "arguments": {"project_key": "PROJ1", "summary": f"Epic {i}", "issue_type": "Epic"},
+            },
+            *(
+                {
+                    "id": f"story{n}",
+                    "tool": "jira_create_issue",
+                    "arguments": {
+                        "project_key": "PROJ1",
+                        "summary": f"Story {i}.{n}",
+                        "issue_type": "Story",
+                        "parent": "$epic.key",
+                    },
+                }
+                for n in range(3)
+            ),
+            {
+                "tool": "jira_link_issues",
+                "arguments": {
+                    "inward_issue": "$story0.key",
+                    "outward_issue": "$story1.key",
+                    "link_type": "Blocks",
+                },
+            },
+            {
+                "tool": "jira_add_comment",
+                "arguments": {"issue_key": "$epic.key", "comment": "Plan"},
+            },
+        ]
+    },
+    "jira_changes_since": lambda fake, i: {"jql": "project = PROJ1", "since": "-7d"},
+    "jira_job_status": lambda fake, i: {},
+    "jira_cancel_job": lambda fake, i: {"job_id": job_manager.submit("bench", lambda: "").id},
+    "jira_server_stats": lambda fake, i: {},
+}
+
+
+async def bench_tool(name: str, fake: FakeJira, iterations: int) -> Dict[str, Any]:
+    """
+    Call one tool repeatedly and measure it.
+
+    Args:
+        name: Tool name
+        fake: FakeJira instance backing the client
+        iterations: Number of calls
+
+    Returns:
+        Dictionary with calls, errors, throughput and latency percentiles (ms)
+    """
+    histogram = StreamingHistogram(growth=1.01)
+    errors = 0
+    requests_before = fake.request_count
+    started = time.perf_counter()
+
+    for i in range(iterations):
+        arguments = SCENARIOS[name](fake, i)
+        call_started = time.perf_counter()
+        result = await server.handle_tool_call(name, arguments)
+        histogram.add(time.perf_counter() - call_started)
+        if result and result[0].text.startswith(("Error", "Unknown tool")):
+            errors += 1
+
+    elapsed = time.perf_counter() - started
+    return {
+        "tool": name,
+        "calls": iterations,
+        "errors": errors,
+        "http_requests": fake.request_count - requests_before,
+        "throughput": iterations / elapsed if elapsed else 0.0,
+        "p50_ms": (histogram.quantile(0.5) or 0.0) * 1000,
+        "p99_ms": (histogram.quantile(0.99) or 0.0) * 1000,
+        "max_ms": (histogram.max or 0.0) * 1000,
+    }
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    """Format benchmark results as an aligned table."""
+    header = (
+        f"{'tool':<26} {'calls':>6} {'err':>4} {'http':>6} "
+        f"{'ops/s':>9} {'p50 ms':>9} {'p99 ms':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['tool']:<26} {r['calls']:>6} {r['errors']:>4} {r['http_requests']:>6} "
+            f"{r['throughput']:>9.1f} {r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+async def run(
+    tools: Optional[List[str]],
+    iterations: int,
+    fake: FakeJira,
+    tuning: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Run the selected tool benchmarks (default: every tool with a scenario)."""
+    server.jira_client = fake.client(**(tuning or {}))
+    registry.reset()
+
+    available = [tool.name for tool in server.TOOLS]
+    missing = [name for name in available if name not in SCENARIOS]
+    if missing:
+        print(f"No benchmark scenario for: {', '.join(missing)}", file=sys.stderr)
+
+    selected = tools or [name for name in available if name in SCENARIOS]
+    results = []
+    for name in selected:
+        results.append(await bench_tool(name, fake, iterations))
+    return results
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark jira-mcp tools against a fake Jira")
+    parser.add_argument("--issues", type=int, default=1000, help="Dataset size (default: 1000)")
+    parser.add_argument("--projects", type=int, default=3, help="Number of projects (default: 3)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency in seconds")
+    parser.add_argument("--rate-limit", type=float, help="Requests per second before 429s")
+    parser.add_argument(
+        "--capacity", type=int, help="Requests the fake serves at once; others queue"
+    )
+    parser.add_argument(
+        "--fixed-concurrency",
+        action="store_true",
+        help="Disable the adaptive concurrency limit (fan-outs use the fixed concurrency)",
+    )
+    parser.add_argument("--iterations", type=int, default=20, help="Calls per tool (default: 20)")
+    parser.add_argument("--tools", nargs="*", help="Only benchmark these tools")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--http-stats", action="store_true", help="Also print per-endpoint stats")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    fake = FakeJira(
+        issues=args.issues,
+        projects=args.projects,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        capacity=args.capacity,
+    )
+    tuning = {"adaptive_concurrency": False} if args.fixed_concurrency else {}
+    results = asyncio.run(run(args.tools, args.iterations, fake, tuning))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_results(results))
+    if args.http_stats:
+        print()
+        print(registry.format_summary())
+        print()
+        print(server.jira_client.limiter.format_summary())
+
+
+if __name__ == "__main__":
+    main()
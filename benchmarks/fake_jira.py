@@ -0,0 +1,967 @@
+"""Local Jira Cloud stand-in for offline benchmarks.
+
+FakeJira serves the REST API v3 and agile API endpoints that JiraClient uses
+from an in-memory, deterministically generated dataset, through an
+``httpx.MockTransport``. Latency, jitter, rate limiting and dataset size are
+configurable, so client and tool performance can be measured without an
+Atlassian site.
+
+Usage:
+    fake = FakeJira(issues=5000, latency=0.02)
+    client = fake.client()
+    client.search_issues("project = PROJ0")
+"""
+
+import json
+import random
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from jira_mcp.settings import InstanceConfig
+from jira_mcp.jira_client import JiraClient
+
+BASE_URL = "https://fake-jira.example.com"
+API_PREFIX = "/rest/api/3"
+AGILE_PREFIX = "/rest/agile/1.0"
+
+# Attachment content is served from here, after a redirect, as Jira's media service does
+MEDIA_PREFIX = "/media/file"
+
+# Uploaded attachments up to this size are kept in memory, larger ones in temp files
+SPOOL_MAX_BYTES = 1024 * 1024
+
+STATUSES = ["To Do", "In Progress", "In Review", "Done"]
+ISSUE_TYPES = ["Task", "Bug", "Story", "Epic"]
+PRIORITIES = ["Highest", "High", "Medium", "Low", "Lowest"]
+
+# Board columns and the statuses mapped to them, and the estimation field boards use
+COLUMNS = [
+    ("To Do", ["To Do"]),
+    ("In Progress", ["In Progress"]),
+    ("Review", ["In Review"]),
+    ("Done", ["Done"]),
+]
+STORY_POINTS_FIELD = "customfield_10016"
+SPRINT_DAYS = 14
+WORDS = (
+    "login page crash timeout export report api cache sync dashboard search filter "
+    "webhook billing invoice upload attachment mobile layout performance memory leak "
+    "database migration permission token refresh notification email queue retry"
+).split()
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+_CLAUSE = re.compile(
+    r'(\w+)\s*(=|in)\s*(\([^)]*\)|"[^"]*"|[^\s()]+)',
+    re.IGNORECASE,
+)
+_UPDATED_SINCE = re.compile(r'\bupdated\s*>=\s*("[^"]*"|\S+)', re.IGNORECASE)
+_RELATIVE = re.compile(r"^-(\d+)([wdhm])$")
+
+
+def _timestamp(value: datetime) -> str:
+    """Format a datetime the way Jira does."""
+    return value.strftime("%Y-%m-%dT%H:%M:%S.000%z")
+
+
+def _epoch_ms(timestamp: str) -> int:
+    """Convert a Jira timestamp to epoch milliseconds."""
+    return int(datetime.strptime(timestamp, TIMESTAMP_FORMAT).timestamp() * 1000)
+
+
+def _parse_duration(value: str) -> int:
+    """Parse Jira duration notation ('1w 2d 3h 30m') into seconds (8h days, 5d weeks)."""
+    units = {"w": 5 * 8 * 3600, "d": 8 * 3600, "h": 3600, "m": 60}
+    parts = re.findall(r"(\d+(?:\.\d+)?)\s*([wdhm])", value.lower())
+    return int(sum(float(amount) * units[unit] for amount, unit in parts))
+
+
+def _jql_date(value: str, now: datetime) -> datetime:
+    """Parse a JQL date: relative ('-1h'), 'yyyy/MM/dd HH:mm' or 'yyyy-MM-dd', in UTC."""
+    value = value.strip('"')
+    relative = _RELATIVE.match(value)
+    if relative:
+        unit = {"w": "weeks", "d": "days", "h": "hours", "m": "minutes"}[relative.group(2)]
+        return now - timedelta(**{unit: int(relative.group(1))})
+    for fmt in ("%Y/%m/%d %H:%M", "%Y-%m-%d %H:%M", "%Y/%m/%d", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid JQL date {value}")
+
+
+def _status(name: str) -> Dict[str, Any]:
+    """Build a status object with its category."""
+    category = "done" if name == "Done" else "new" if name == STATUSES[0] else "indeterminate"
+    return {"id": str(STATUSES.index(name) + 1), "name": name, "statusCategory": {"key": category}}
+
+
+def _status_change(old: str, new: str) -> Dict[str, Any]:
+    """A changelog item for a status transition, with the ids Jira includes."""
+    return {
+        "field": "status",
+        "fieldtype": "jira",
+        "fieldId": "status",
+        "from": str(STATUSES.index(old) + 1),
+        "fromString": old,
+        "to": str(STATUSES.index(new) + 1),
+        "toString": new,
+    }
+
+
+def _key_order(key: str) -> Tuple[str, int]:
+    """Sort key putting issue keys in Jira's order (project, then number)."""
+    project, _, number = key.rpartition("-")
+    return project, int(number)
+
+
+def _adf(text: str) -> Dict[str, Any]:
+    """Wrap plain text in a minimal ADF document."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+
+
+class _StreamingTransport(httpx.MockTransport):
+    """MockTransport that leaves request bodies unread, so uploads arrive as streams."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.handler(request)
+
+
+class RateLimiter:
+    """Token bucket that answers 429 once the request budget is exhausted."""
+
+    def __init__(self, per_second: float, burst: Optional[int] = None):
+        self.per_second = per_second
+        self.capacity = float(burst or max(1, int(per_second)))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Optional[float]:
+        """Take a token; returns None if allowed, else seconds until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.per_second)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return None
+            return (1 - self.tokens) / self.per_second
+
+
+class FakeJira:
+    """In-memory Jira Cloud REST API v3 served through httpx.MockTransport."""
+
+    def __init__(
+        self,
+        issues: int = 500,
+        projects: int = 3,
+        users: int = 20,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: Optional[float] = None,
+        capacity: Optional[int] = None,
+        history: int = 4,
+        seed: int = 0,
+    ):
+        """
+        Generate a dataset.
+
+        Args:
+            issues: Number of issues to generate
+            projects: Number of projects to spread them across
+            users: Number of users
+            latency: Base server latency per request, in seconds
+            jitter: Maximum extra random latency per request, in seconds
+            rate_limit: Requests per second before answering 429 (optional)
+            capacity: Requests served at once; further requests queue, so latency
+                grows with concurrency beyond it (optional, default: unlimited)
+            history: Maximum number of status transitions per issue
+            seed: Random seed for a reproducible dataset
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.capacity = threading.Semaphore(capacity) if capacity else None
+        # Set to simulate an outage: every request is answered with 503
+        self.unavailable = False
+        self.request_count = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        now = datetime.now(timezone.utc)
+        self.users = [
+            {
+                "accountId": f"user-{i}",
+                "displayName": f"User {i}",
+                "emailAddress": f"user{i}@example.com",
+                "active": True,
+            }
+            for i in range(users)
+        ]
+        self.projects = [
+            {
+                "id": str(10000 + i),
+                "key": f"PROJ{i}",
+                "name": f"Project {i}",
+                "projectTypeKey": "software",
+            }
+            for i in range(projects)
+        ]
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.changelogs: Dict[str, List[Dict[str, Any]]] = {}
+        self.comments: Dict[str, List[Dict[str, Any]]] = {}
+        self.worklogs: Dict[str, List[Dict[str, Any]]] = {}
+        self.links: List[Dict[str, Any]] = []
+        # Attachment ID -> (metadata, content)
+        self.attachments: Dict[str, Tuple[Dict[str, Any], IO[bytes]]] = {}
+        self._counters = {project["key"]: 0 for project in self.projects}
+
+        for i in range(issues):
+            project = self.projects[i % projects]["key"]
+            created = now - timedelta(days=self._rng.uniform(1, 365))
+            self._generate_issue(project, created, now, history)
+
+        # One scrum board per project; sprint ID -> (sprint, issue keys in rank order)
+        self.boards = [
+            {
+                "id": i + 1,
+                "name": f"{project['key']} board",
+                "type": "scrum",
+                "location": {"projectKey": project["key"]},
+            }
+            for i, project in enumerate(self.projects)
+        ]
+        self.sprints: Dict[int, Tuple[Dict[str, Any], List[str]]] = {}
+        self._generate_sprints(now, random.Random(seed + 1))
+
+    # Dataset generation
+
+    def _next_key(self, project: str) -> str:
+        self._counters[project] += 1
+        return f"{project}-{self._counters[project]}"
+
+    def _generate_issue(self, project: str, created: datetime, now: datetime, history: int) -> None:
+        rng = self._rng
+        key = self._next_key(project)
+        transitions = rng.randint(0, min(history, len(STATUSES) - 1))
+        status = STATUSES[0]
+        at = created
+        histories = []
+        for step in range(transitions):
+            next_at = at + timedelta(hours=rng.uniform(1, 240))
+            if next_at >= now:
+                break
+            at = next_at
+            new_status = STATUSES[step + 1]
+            histories.append(
+                {
+                    "id": str(len(histories) + 1),
+                    "author": rng.choice(self.users),
+                    "created": _timestamp(at),
+                    "items": [_status_change(status, new_status)],
+                }
+            )
+            status = new_status
+
+        summary = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))).capitalize()
+        assignee = rng.choice(self.users + [None])
+        self.issues[key] = {
+            "id": str(10000 + len(self.issues)),
+            "key": key,
+            "self": f"{BASE_URL}{API_PREFIX}/issue/{key}",
+            "fields": {
+                "summary": summary,
+                "description": _adf(summary + ". " + " ".join(rng.choices(WORDS, k=30))),
+                "status": _status(status),
+                "issuetype": {"name": rng.choice(ISSUE_TYPES)},
+                "priority": {"name": rng.choice(PRIORITIES)},
+                "assignee": assignee,
+                "reporter": rng.choice(self.users),
+                "project": {"key": project},
+                "labels": rng.sample(WORDS, rng.randint(0, 3)),
+                "created": _timestamp(created),
+                "updated": _timestamp(at),
+                "resolutiondate": _timestamp(at) if status == "Done" else None,
+                "issuelinks": [],
+            },
+        }
+        self.changelogs[key] = histories
+        self.comments[key] = [
+            {
+                "id": str(n + 1),
+                "author": rng.choice(self.users),
+                "body": _adf(" ".join(rng.choice(WORDS) for _ in range(20))),
+                "created": _timestamp(created + timedelta(hours=n + 1)),
+            }
+            for n in range(rng.randint(0, 8))
+        ]
+        # Some issues exceed the 20 worklogs Jira embeds in search results
+        self.worklogs[key] = sorted(
+            (
+                self._worklog(
+                    rng.choice(self.users),
+                    created + (now - created) * rng.random(),
+                    rng.randint(1, 16) * 900,
+                )
+                for _ in range(rng.choice((0, 0, 1, 3, 5, 12, 30)))
+            ),
+            key=lambda worklog: worklog["started"],
+        )
+
+    def _generate_sprints(self, now: datetime, rng: random.Random) -> None:
+        """Give each board four closed sprints, an active one and a future one, and fill them."""
+        for board in self.boards:
+            sprints = []
+            for n in range(6):
+                start = now + timedelta(days=SPRINT_DAYS * (n - 4) - SPRINT_DAYS // 2)
+                end = start + timedelta(days=SPRINT_DAYS)
+                state = "closed" if n < 4 else "active" if n == 4 else "future"
+                sprint = {
+                    "id": board["id"] * 100 + n + 1,
+                    "name": f"{board['location']['projectKey']} Sprint {n + 1}",
+                    "state": state,
+                    "originBoardId": board["id"],
+                    "goal": "",
+                }
+                if state != "future":
+                    sprint["startDate"] = _timestamp(start)
+                    sprint["endDate"] = _timestamp(end)
+                if state == "closed":
+                    sprint["completeDate"] = _timestamp(end)
+                sprints.append((sprint, start, min(end, now)))
+                self.sprints[sprint["id"]] = (sprint, [])
+
+            project = board["location"]["projectKey"]
+            for key, issue in self.issues.items():
+                if issue["fields"]["project"]["key"] != project:
+                    continue
+                fields = issue["fields"]
+                fields[STORY_POINTS_FIELD] = rng.choice([1, 2, 3, 5, 8, 13, None])
+                draw = rng.random()
+                if draw < 0.6:
+                    # Backlog, unless done (then left in no sprint at all)
+                    continue
+                # Mostly the active sprint, some in the future one, the rest in closed ones
+                index = 4 if draw < 0.8 else 5 if draw < 0.85 else rng.randrange(4)
+                sprint, start, end = sprints[index]
+                self.sprints[sprint["id"]][1].append(key)
+                if fields["status"]["name"] == "Done" and sprint["state"] != "future":
+                    resolved = _timestamp(start + (end - start) * rng.random())
+                    fields["resolutiondate"] = resolved
+                    fields["updated"] = max(fields["updated"], resolved)
+
+    def _worklog(self, author: Dict[str, Any], started: datetime, seconds: int) -> Dict[str, Any]:
+        return {
+            "id": str(self._rng.randint(10000, 99999)),
+            "author": author,
+            "started": _timestamp(started),
+            "timeSpentSeconds": seconds,
+        }
+
+    # Transport
+
+    def transport(self) -> httpx.MockTransport:
+        """Return an httpx transport serving this fake."""
+        return _StreamingTransport(self.handle)
+
+    def client(self, instance_name: str = "fake", **tuning: Any) -> JiraClient:
+        """Return a JiraClient wired to this fake (tuning: InstanceConfig tuning knobs)."""
+        config = InstanceConfig(
+            instance_name=instance_name,
+            url=BASE_URL,
+            email="bench@example.com",
+            api_token="fake-token",
+            **tuning,
+        )
+        return JiraClient(config, transport=self.transport())
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Serve a single request."""
+        with self._lock:
+            self.request_count += 1
+
+        if self.unavailable:
+            return self._error(503, "Service unavailable")
+
+        if self.rate_limiter is not None:
+            retry_after = self.rate_limiter.acquire()
+            if retry_after is not None:
+                return httpx.Response(
+                    429,
+                    headers={"Retry-After": f"{max(1, round(retry_after))}"},
+                    json={"errorMessages": ["Rate limit exceeded"]},
+                )
+
+        if self.capacity is None:
+            return self._serve(request)
+        with self.capacity:
+            return self._serve(request)
+
+    def _serve(self, request: httpx.Request) -> httpx.Response:
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        path = request.url.path
+        if path.startswith(MEDIA_PREFIX + "/"):
+            return self._media(request, path[len(MEDIA_PREFIX) + 1:])
+        if path.startswith(AGILE_PREFIX):
+            routes = self._agile_routes
+            path = path[len(AGILE_PREFIX):]
+        elif path.startswith(API_PREFIX):
+            routes = self._routes
+            path = path[len(API_PREFIX):]
+        else:
+            return self._error(404, f"Unknown path {path}")
+
+        for method, pattern, handler in routes:
+            if request.method != method:
+                continue
+            match = pattern.fullmatch(path)
+            if match:
+                try:
+                    return handler(self, request, *match.groups())
+                except KeyError as e:
+                    return self._error(404, f"Issue does not exist: {e}")
+        return self._error(404, f"No route for {request.method} {path}")
+
+    @staticmethod
+    def _error(status: int, message: str) -> httpx.Response:
+        return httpx.Response(status, json={"errorMessages": [message], "errors": {}})
+
+    @staticmethod
+    def _body(request: httpx.Request) -> Dict[str, Any]:
+        content = request.read()
+        return json.loads(content) if content else {}
+
+    # Query evaluation
+
+    def _matches(self, issue: Dict[str, Any], clauses: List[Tuple[str, str, str]]) -> bool:
+        fields = issue["fields"]
+        for name, op, value in clauses:
+            if op == "in":
+                values = {v.strip().strip('"') for v in value.strip("()").split(",")}
+            else:
+                values = {value.strip('"')}
+            if name == "project":
+                actual = fields["project"]["key"]
+            elif name == "key":
+                actual = issue["key"]
+            elif name == "parent":
+                actual = (fields.get("parent") or {}).get("key")
+            elif name == "status":
+                actual = fields["status"]["name"]
+            elif name == "assignee":
+                actual = (fields.get("assignee") or {}).get("accountId")
+            elif name == "issuetype":
+                actual = fields["issuetype"]["name"]
+            else:
+                continue
+            if actual not in values:
+                return False
+        return True
+
+    def _search(self, jql: str) -> List[Dict[str, Any]]:
+        where, *order = re.split(r"\border\s+by\b", jql, maxsplit=1, flags=re.IGNORECASE)
+        clauses = [
+            (m.group(1).lower(), m.group(2).lower(), m.group(3)) for m in _CLAUSE.finditer(where)
+        ]
+        matches = [issue for issue in self.issues.values() if self._matches(issue, clauses)]
+
+        # Only `updated >= date` and `ORDER BY updated [ASC|DESC][, key ASC]` are understood
+        # beyond equality clauses; Jira timestamps in one offset compare correctly as strings
+        since = _UPDATED_SINCE.search(where)
+        if since:
+            start = _timestamp(_jql_date(since.group(1), datetime.now(timezone.utc)))
+            matches = [issue for issue in matches if issue["fields"]["updated"] >= start]
+        if order and order[0].strip().lower().startswith("updated"):
+            descending = order[0].strip().lower().endswith("desc")
+            if re.search(r",\s*key\b", order[0], flags=re.IGNORECASE):
+                matches.sort(key=lambda issue: _key_order(issue["key"]))
+            matches.sort(key=lambda issue: issue["fields"]["updated"], reverse=descending)
+        return matches
+
+    @staticmethod
+    def _project_fields(issue: Dict[str, Any], fields: Optional[str]) -> Dict[str, Any]:
+        if not fields or fields in ("*all", "*navigable"):
+            return issue
+        wanted = {f.strip() for f in fields.split(",")}
+        excluded = {f[1:] for f in wanted if f.startswith("-")}
+        if wanted & {"*all", "*navigable"} or (excluded and len(excluded) == len(wanted)):
+            projected = {k: v for k, v in issue["fields"].items() if k not in excluded}
+        else:
+            projected = {k: v for k, v in issue["fields"].items() if k in wanted}
+        return {**issue, "fields": projected}
+
+    def _with_worklog(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach the worklog page Jira embeds in issues (the first 20 worklogs)."""
+        worklogs = self.worklogs[issue["key"]]
+        page = {"startAt": 0, "maxResults": 20, "total": len(worklogs), "worklogs": worklogs[:20]}
+        return {**issue, "fields": {**issue["fields"], "worklog": page}}
+
+    # Endpoint handlers
+
+    def _myself(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={**self.users[0], "timeZone": "UTC"})
+
+    def _server_info(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"baseUrl": BASE_URL, "version": "1001.0.0", "deploymentType": "Cloud"}
+        )
+
+    def _search_jql(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        matches = self._search(params.get("jql", ""))
+        max_results = min(int(params.get("maxResults", 50)), 5000)
+        offset = int(params.get("nextPageToken") or 0)
+        page = matches[offset:offset + max_results]
+        is_last = offset + max_results >= len(matches)
+        body: Dict[str, Any] = {
+            "issues": [
+                self._project_fields(self._with_worklog(issue), params.get("fields"))
+                for issue in page
+            ],
+            "isLast": is_last,
+        }
+        if not is_last:
+            body["nextPageToken"] = str(offset + max_results)
+        return httpx.Response(200, json=body)
+
+    def _get_issue(self, request: httpx.Request, key: str) -> httpx.Response:
+        issue = self.issues[key]
+        comments = self.comments[key]
+        comment_page = {"comments": comments, "total": len(comments), "startAt": 0}
+        issue = self._with_worklog(issue)
+        issue = {**issue, "fields": {**issue["fields"], "comment": comment_page}}
+        fields = request.url.params.get("fields")
+        return httpx.Response(200, json=self._project_fields(issue, fields))
+
+    def _create_issue(self, request: httpx.Request) -> httpx.Response:
+        fields = self._body(request).get("fields", {})
+        project = fields.get("project", {}).get("key")
+        if project not in self._counters:
+            return httpx.Response(
+                400, json={"errorMessages": [], "errors": {"project": "valid project is required"}}
+            )
+        now = datetime.now(timezone.utc)
+        key = self._next_key(project)
+        self.issues[key] = {
+            "id": str(10000 + len(self.issues)),
+            "key": key,
+            "self": f"{BASE_URL}{API_PREFIX}/issue/{key}",
+            "fields": {
+                "status": _status(STATUSES[0]),
+                "priority": {"name": "Medium"},
+                "assignee": None,
+                "reporter": self.users[0],
+                "labels": [],
+                "issuelinks": [],
+                "created": _timestamp(now),
+                "updated": _timestamp(now),
+                "resolutiondate": None,
+                **fields,
+            },
+        }
+        self.changelogs[key] = []
+        self.comments[key] = []
+        self.worklogs[key] = []
+        issue = self.issues[key]
+        return httpx.Response(201, json={"id": issue["id"], "key": key, "self": issue["self"]})
+
+    def _update_issue(self, request: httpx.Request, key: str) -> httpx.Response:
+        issue = self.issues[key]
+        issue["fields"].update(self._body(request).get("fields", {}))
+        issue["fields"]["updated"] = _timestamp(datetime.now(timezone.utc))
+        return httpx.Response(204)
+
+    def _get_transitions(self, request: httpx.Request, key: str) -> httpx.Response:
+        current = self.issues[key]["fields"]["status"]["name"]
+        transitions = [
+            {"id": str(11 + i), "name": status, "to": {"name": status}}
+            for i, status in enumerate(STATUSES)
+            if status != current
+        ]
+        return httpx.Response(200, json={"transitions": transitions})
+
+    def _do_transition(self, request: httpx.Request, key: str) -> httpx.Response:
+        transition_id = self._body(request).get("transition", {}).get("id")
+        index = int(transition_id) - 11 if transition_id and transition_id.isdigit() else -1
+        if not 0 <= index < len(STATUSES):
+            return self._error(400, f"Transition id '{transition_id}' is not valid for this issue")
+        issue = self.issues[key]
+        now = datetime.now(timezone.utc)
+        old, new = issue["fields"]["status"]["name"], STATUSES[index]
+        issue["fields"]["status"] = _status(new)
+        issue["fields"]["updated"] = _timestamp(now)
+        issue["fields"]["resolutiondate"] = _timestamp(now) if new == "Done" else None
+        self.changelogs[key].append(
+            {
+                "id": str(len(self.changelogs[key]) + 1),
+                "author": self.users[0],
+                "created": _timestamp(now),
+                "items": [_status_change(old, new)],
+            }
+        )
+        return httpx.Response(204)
+
+    def _changelog(self, request: httpx.Request, key: str) -> httpx.Response:
+        histories = self.changelogs[key]
+        start_at = int(request.url.params.get("startAt", 0))
+        max_results = int(request.url.params.get("maxResults", 100))
+        values = histories[start_at:start_at + max_results]
+        return httpx.Response(
+            200,
+            json={
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(histories),
+                "isLast": start_at + max_results >= len(histories),
+                "values": values,
+            },
+        )
+
+    def _get_comments(self, request: httpx.Request, key: str) -> httpx.Response:
+        params = request.url.params
+        comments = self.comments[key]
+        if params.get("orderBy", "created").lstrip("+") == "-created":
+            comments = comments[::-1]
+        start_at = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 5000)), 5000)
+        return httpx.Response(
+            200,
+            json={
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(comments),
+                "comments": comments[start_at:start_at + max_results],
+            },
+        )
+
+    def _add_comment(self, request: httpx.Request, key: str) -> httpx.Response:
+        comments = self.comments[key]
+        comment = {
+            "id": str(len(comments) + 1),
+            "author": self.users[0],
+            "body": self._body(request).get("body"),
+            "created": _timestamp(datetime.now(timezone.utc)),
+        }
+        comments.append(comment)
+        self.issues[key]["fields"]["updated"] = comment["created"]
+        return httpx.Response(201, json=comment)
+
+    def _get_worklogs(self, request: httpx.Request, key: str) -> httpx.Response:
+        params = request.url.params
+        worklogs = self.worklogs[key]
+        if "startedAfter" in params or "startedBefore" in params:
+            after = int(params.get("startedAfter", 0))
+            before = int(params.get("startedBefore", 2**62))
+            worklogs = [w for w in worklogs if after <= _epoch_ms(w["started"]) < before]
+        start_at = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 5000)), 5000)
+        return httpx.Response(
+            200,
+            json={
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(worklogs),
+                "worklogs": worklogs[start_at:start_at + max_results],
+            },
+        )
+
+    def _add_worklog(self, request: httpx.Request, key: str) -> httpx.Response:
+        worklogs = self.worklogs[key]
+        body = self._body(request)
+        seconds = body.get("timeSpentSeconds") or _parse_duration(body.get("timeSpent", ""))
+        if not seconds:
+            return httpx.Response(
+                400, json={"errorMessages": [], "errors": {"timeLogged": "Time spent is invalid"}}
+            )
+        started = (
+            datetime.strptime(body["started"], TIMESTAMP_FORMAT)
+            if body.get("started")
+            else datetime.now(timezone.utc)
+        )
+        worklog = self._worklog(self.users[0], started, seconds)
+        worklogs.append(worklog)
+        return httpx.Response(201, json=worklog)
+
+    def _assign(self, request: httpx.Request, key: str) -> httpx.Response:
+        account_id = self._body(request).get("accountId")
+        user = next((u for u in self.users if u["accountId"] == account_id), None)
+        if account_id and user is None:
+            return self._error(404, f"User {account_id} does not exist")
+        self.issues[key]["fields"]["assignee"] = user
+        self.issues[key]["fields"]["updated"] = _timestamp(datetime.now(timezone.utc))
+        return httpx.Response(204)
+
+    def _user_search(self, request: httpx.Request) -> httpx.Response:
+        query = request.url.params.get("query", "").lower()
+        max_results = int(request.url.params.get("maxResults", 50))
+        users = [
+            u for u in self.users
+            if query in u["displayName"].lower() or query in u["emailAddress"].lower()
+        ]
+        return httpx.Response(200, json=users[:max_results])
+
+    def _list_projects(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=self.projects)
+
+    def _link(self, request: httpx.Request) -> httpx.Response:
+        body = self._body(request)
+        inward = body.get("inwardIssue", {}).get("key")
+        outward = body.get("outwardIssue", {}).get("key")
+        if inward not in self.issues or outward not in self.issues:
+            return self._error(404, "Issue does not exist")
+        link = {
+            "id": str(len(self.links) + 1),
+            "type": body.get("type", {}),
+            "inwardIssue": {"key": inward},
+            "outwardIssue": {"key": outward},
+        }
+        self.links.append(link)
+        self.issues[inward]["fields"]["issuelinks"].append(link)
+        self.issues[outward]["fields"]["issuelinks"].append(link)
+        return httpx.Response(201)
+
+    def add_attachment(self, key: str, filename: str, chunks: Iterator[bytes]) -> Dict[str, Any]:
+        """Store an attachment on an issue (also used to seed benchmarks)."""
+        content: IO[bytes] = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        for chunk in chunks:
+            content.write(chunk)
+        with self._lock:
+            attachment_id = str(20000 + len(self.attachments))
+            attachment = {
+                "id": attachment_id,
+                "self": f"{BASE_URL}{API_PREFIX}/attachment/{attachment_id}",
+                "filename": filename,
+                "author": self.users[0],
+                "created": _timestamp(datetime.now(timezone.utc)),
+                "size": content.tell(),
+                "mimeType": "application/octet-stream",
+                "content": f"{BASE_URL}{API_PREFIX}/attachment/content/{attachment_id}",
+            }
+            self.attachments[attachment_id] = (attachment, content)
+        self.issues[key]["fields"].setdefault("attachment", []).append(attachment)
+        return attachment
+
+    def _upload(self, request: httpx.Request, key: str) -> httpx.Response:
+        if key not in self.issues:
+            raise KeyError(key)
+        if request.headers.get("X-Atlassian-Token") != "no-check":
+            return self._error(403, "XSRF check failed")
+        match = re.search(r"boundary=([^;\s]+)", request.headers.get("Content-Type", ""))
+        if not match:
+            return self._error(415, "Expected a multipart/form-data body")
+        closing = f"\r\n--{match.group(1)}--\r\n".encode()
+
+        # Parse the single file part as it streams in, holding back what may be the closing line
+        stream = iter(request.stream)
+        head = b""
+        for chunk in stream:
+            head += chunk
+            if b"\r\n\r\n" in head:
+                break
+        else:
+            return self._error(400, "Malformed multipart body")
+        head, held = head.split(b"\r\n\r\n", 1)
+        filename = re.search(rb'filename="([^"]*)"', head)
+
+        def content() -> Iterator[bytes]:
+            nonlocal held
+            for chunk in stream:
+                held += chunk
+                if len(held) > len(closing):
+                    yield held[:-len(closing)]
+                    held = held[-len(closing):]
+            if held.endswith(closing):
+                yield held[:-len(closing)]
+
+        name = filename.group(1).decode() if filename else "upload"
+        attachment = self.add_attachment(key, name, content())
+        return httpx.Response(200, json=[attachment])
+
+    def _get_attachment(self, request: httpx.Request, attachment_id: str) -> httpx.Response:
+        return httpx.Response(200, json=self.attachments[attachment_id][0])
+
+    def _attachment_content(self, request: httpx.Request, attachment_id: str) -> httpx.Response:
+        if attachment_id not in self.attachments:
+            raise KeyError(attachment_id)
+        location = f"{BASE_URL}{MEDIA_PREFIX}/{attachment_id}"
+        return httpx.Response(303, headers={"Location": location})
+
+    def _media(self, request: httpx.Request, attachment_id: str) -> httpx.Response:
+        if attachment_id not in self.attachments:
+            return self._error(404, f"No file {attachment_id}")
+        content = self.attachments[attachment_id][1]
+
+        def chunks() -> Iterator[bytes]:
+            offset = 0
+            while True:
+                with self._lock:
+                    content.seek(offset)
+                    chunk = content.read(SPOOL_MAX_BYTES)
+                if not chunk:
+                    return
+                offset += len(chunk)
+                yield chunk
+
+        return httpx.Response(200, content=chunks())
+
+    # Agile API
+
+    @staticmethod
+    def _values_page(request: httpx.Request, values: List[Any]) -> httpx.Response:
+        params = request.url.params
+        start_at = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), 50)
+        page = values[start_at:start_at + max_results]
+        return httpx.Response(
+            200,
+            json={
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(values),
+                "isLast": start_at + max_results >= len(values),
+                "values": page,
+            },
+        )
+
+    def _issues_page(self, request: httpx.Request, keys: List[str]) -> httpx.Response:
+        params = request.url.params
+        if params.get("jql"):
+            wanted = {issue["key"] for issue in self._search(params["jql"])}
+            keys = [key for key in keys if key in wanted]
+        start_at = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), 50)
+        issues = [
+            self._project_fields(self.issues[key], params.get("fields"))
+            for key in keys[start_at:start_at + max_results]
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(keys),
+                "issues": issues,
+            },
+        )
+
+    def _board(self, board_id: str) -> Dict[str, Any]:
+        for board in self.boards:
+            if str(board["id"]) == board_id:
+                return board
+        raise KeyError(f"board {board_id}")
+
+    def _list_boards(self, request: httpx.Request) -> httpx.Response:
+        project = request.url.params.get("projectKeyOrId")
+        boards = [b for b in self.boards if not project or b["location"]["projectKey"] == project]
+        return self._values_page(request, boards)
+
+    def _get_board(self, request: httpx.Request, board_id: str) -> httpx.Response:
+        return httpx.Response(200, json=self._board(board_id))
+
+    def _board_configuration(self, request: httpx.Request, board_id: str) -> httpx.Response:
+        board = self._board(board_id)
+        columns = [
+            {
+                "name": name,
+                "statuses": [{"id": str(STATUSES.index(status) + 1)} for status in statuses],
+            }
+            for name, statuses in COLUMNS
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "id": board["id"],
+                "name": board["name"],
+                "columnConfig": {"columns": columns, "constraintType": "none"},
+                "estimation": {
+                    "type": "field",
+                    "field": {"fieldId": STORY_POINTS_FIELD, "displayName": "Story Points"},
+                },
+            },
+        )
+
+    def _board_sprints(self, request: httpx.Request, board_id: str) -> httpx.Response:
+        board = self._board(board_id)
+        states = request.url.params.get("state")
+        sprints = [
+            sprint
+            for sprint, _ in self.sprints.values()
+            if sprint["originBoardId"] == board["id"]
+            and (not states or sprint["state"] in states.split(","))
+        ]
+        return self._values_page(request, sprints)
+
+    def _get_sprint(self, request: httpx.Request, sprint_id: str) -> httpx.Response:
+        return httpx.Response(200, json=self.sprints[int(sprint_id)][0])
+
+    def _sprint_issues(
+        self, request: httpx.Request, board_id: str, sprint_id: str
+    ) -> httpx.Response:
+        self._board(board_id)
+        return self._issues_page(request, self.sprints[int(sprint_id)][1])
+
+    def _backlog(self, request: httpx.Request, board_id: str) -> httpx.Response:
+        board = self._board(board_id)
+        planned = {
+            key
+            for sprint, keys in self.sprints.values()
+            if sprint["originBoardId"] == board["id"] and sprint["state"] != "closed"
+            for key in keys
+        }
+        project = board["location"]["projectKey"]
+        keys = [
+            key
+            for key, issue in self.issues.items()
+            if issue["fields"]["project"]["key"] == project
+            and key not in planned
+            and issue["fields"]["status"]["name"] != "Done"
+        ]
+        return self._issues_page(request, keys)
+
+    _routes: List[Tuple[str, "re.Pattern[str]", Callable[..., httpx.Response]]] = [
+        ("GET", re.compile(r"/myself"), _myself),
+        ("GET", re.compile(r"/serverInfo"), _server_info),
+        ("GET", re.compile(r"/search/jql"), _search_jql),
+        ("POST", re.compile(r"/issue"), _create_issue),
+        ("GET", re.compile(r"/issue/([^/]+)"), _get_issue),
+        ("PUT", re.compile(r"/issue/([^/]+)"), _update_issue),
+        ("GET", re.compile(r"/issue/([^/]+)/transitions"), _get_transitions),
+        ("POST", re.compile(r"/issue/([^/]+)/transitions"), _do_transition),
+        ("GET", re.compile(r"/issue/([^/]+)/changelog"), _changelog),
+        ("GET", re.compile(r"/issue/([^/]+)/comment"), _get_comments),
+        ("POST", re.compile(r"/issue/([^/]+)/comment"), _add_comment),
+        ("PUT", re.compile(r"/issue/([^/]+)/assignee"), _assign),
+        ("GET", re.compile(r"/issue/([^/]+)/worklog"), _get_worklogs),
+        ("POST", re.compile(r"/issue/([^/]+)/worklog"), _add_worklog),
+        ("GET", re.compile(r"/user/search"), _user_search),
+        ("GET", re.compile(r"/project"), _list_projects),
+        ("POST", re.compile(r"/issueLink"), _link),
+        ("POST", re.compile(r"/issue/([^/]+)/attachments"), _upload),
+        ("GET", re.compile(r"/attachment/(\d+)"), _get_attachment),
+        ("GET", re.compile(r"/attachment/content/(\d+)"), _attachment_content),
+    ]
+
+    _agile_routes: List[Tuple[str, "re.Pattern[str]", Callable[..., httpx.Response]]] = [
+        ("GET", re.compile(r"/board"), _list_boards),
+        ("GET", re.compile(r"/board/(\d+)"), _get_board),
+        ("GET", re.compile(r"/board/(\d+)/configuration"), _board_configuration),
+        ("GET", re.compile(r"/board/(\d+)/sprint"), _board_sprints),
+        ("GET", re.compile(r"/board/(\d+)/sprint/(\d+)/issue"), _sprint_issues),
+        ("GET", re.compile(r"/board/(\d+)/backlog"), _backlog),
+        ("GET", re.compile(r"/sprint/(\d+)"), _get_sprint),
+    ]
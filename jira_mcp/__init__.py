@@ -4,11 +4,35 @@ __version__ = "1.0.0"
 __author__ = "Ben Vierck"
 __email__ = "ben@positronic.ai"
 
-from jira_mcp.config import JiraInstanceConfig, get_instance_config
-from jira_mcp.jira_client import JiraClient
+from typing import Any
 
 __all__ = [
     "JiraInstanceConfig",
     "get_instance_config",
+    "InstanceConfig",
+    "load_instance_config",
+    "load_config_file",
     "JiraClient",
 ]
+
+# Public names are imported on first access so that `import jira_mcp.server`
+# does not pay for pydantic models and httpx before the server is answering.
+_LAZY_EXPORTS = {
+    "JiraInstanceConfig": "jira_mcp.config",
+    "get_instance_config": "jira_mcp.config",
+    "InstanceConfig": "jira_mcp.settings",
+    "load_instance_config": "jira_mcp.settings",
+    "load_config_file": "jira_mcp.settings",
+    "JiraClient": "jira_mcp.jira_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'jira_mcp' has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
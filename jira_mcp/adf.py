@@ -0,0 +1,63 @@
+"""Atlassian Document Format and issue field helpers shared by the tools.
+
+Kept free of the MCP server so that library modules (batch, updates, export,
+similar) can use them without importing jira_mcp.server.
+"""
+
+from typing import Any, Dict
+
+
+def extract_text_from_adf(adf: Dict[str, Any]) -> str:
+    """Extract plain text from Atlassian Document Format."""
+    if not isinstance(adf, dict):
+        return str(adf)
+
+    text_parts = []
+
+    def extract(node):
+        if isinstance(node, dict):
+            if node.get("type") == "text":
+                text_parts.append(node.get("text", ""))
+            if "content" in node:
+                for child in node["content"]:
+                    extract(child)
+        elif isinstance(node, list):
+            for item in node:
+                extract(item)
+
+    extract(adf)
+    return " ".join(text_parts)
+
+
+def build_update_fields(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Translate jira_update_issue arguments into the REST API's fields payload.
+
+    Args:
+        arguments: Tool arguments; summary, description, priority, labels and parent are used
+
+    Returns:
+        Fields dictionary for JiraClient.update_issue (empty if nothing is set)
+    """
+    fields: Dict[str, Any] = {}
+
+    if "summary" in arguments:
+        fields["summary"] = arguments["summary"]
+    if "description" in arguments:
+        fields["description"] = {
+            "type": "doc",
+            "version": 1,
+            "content": [
+                {
+                    "type": "paragraph",
+                    "content": [{"type": "text", "text": arguments["description"]}],
+                }
+            ],
+        }
+    if "priority" in arguments:
+        fields["priority"] = {"name": arguments["priority"]}
+    if "labels" in arguments:
+        fields["labels"] = arguments["labels"]
+    if "parent" in arguments:
+        fields["parent"] = {"key": arguments["parent"]}
+    return fields
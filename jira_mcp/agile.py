@@ -0,0 +1,373 @@
+"""Board columns and sprint burndown summaries from the agile API (/rest/agile/1.0).
+
+A board's configuration maps each of its columns to the statuses shown in it
+and names the field holding estimates (story points by default). The client
+caches it for METADATA_TTL seconds, so reports after the first only request
+the sprint and its issues. Issue pages are read concurrently once the first
+page has given the total (see JiraClient._agile_issues).
+
+An issue counts as done when it sits in the board's last column, or, if its
+status is on no column, when its status category is Done.
+"""
+
+import logging
+from collections import OrderedDict
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from jira_mcp.cycle_time import parse_jira_datetime
+from jira_mcp.jira_client import JiraClient, map_bounded
+
+logger = logging.getLogger(__name__)
+
+# Fields read for every board issue; the board's estimation field is added
+BOARD_ISSUE_FIELDS = [
+    "summary",
+    "status",
+    "issuetype",
+    "priority",
+    "assignee",
+    "created",
+    "resolutiondate",
+]
+
+# Column shown for issues whose status is on none of the board's columns
+UNMAPPED_COLUMN = "(not on board)"
+
+
+class BoardColumns:
+    """A board's columns, the statuses mapped to them and its estimation field."""
+
+    __slots__ = ("names", "by_status", "estimation_field", "estimation_name")
+
+    def __init__(
+        self,
+        names: List[str],
+        by_status: Dict[str, str],
+        estimation_field: Optional[str] = None,
+        estimation_name: Optional[str] = None,
+    ):
+        self.names = names
+        self.by_status = by_status
+        self.estimation_field = estimation_field
+        self.estimation_name = estimation_name
+
+    @classmethod
+    def from_configuration(cls, config: Dict[str, Any]) -> "BoardColumns":
+        """Build from a board configuration as returned by the agile API."""
+        names: List[str] = []
+        by_status: Dict[str, str] = {}
+        for column in (config.get("columnConfig") or {}).get("columns", []):
+            names.append(column["name"])
+            for status in column.get("statuses", []):
+                by_status[str(status.get("id"))] = column["name"]
+        estimation = config.get("estimation") or {}
+        field = (estimation.get("field") or {}) if estimation.get("type") == "field" else {}
+        return cls(names, by_status, field.get("fieldId"), field.get("displayName"))
+
+    @property
+    def unit(self) -> str:
+        """What estimates count: the estimation field's name, or issues."""
+        if not self.estimation_field:
+            return "issues"
+        return self.estimation_name or "points"
+
+    def column_of(self, issue: Dict[str, Any]) -> str:
+        """The column an issue is shown in."""
+        status = issue.get("fields", {}).get("status") or {}
+        return self.by_status.get(str(status.get("id")), UNMAPPED_COLUMN)
+
+    def is_done(self, issue: Dict[str, Any]) -> bool:
+        """Whether an issue is in the last column (or in a Done status off the board)."""
+        column = self.column_of(issue)
+        if column != UNMAPPED_COLUMN:
+            return bool(self.names) and column == self.names[-1]
+        status = issue.get("fields", {}).get("status") or {}
+        return (status.get("statusCategory") or {}).get("key") == "done"
+
+    def estimate(self, issue: Dict[str, Any]) -> float:
+        """An issue's estimate (0 if unestimated), or 1 on boards that count issues."""
+        if not self.estimation_field:
+            return 1.0
+        value = issue.get("fields", {}).get(self.estimation_field)
+        return float(value) if isinstance(value, (int, float)) else 0.0
+
+    @property
+    def fields(self) -> List[str]:
+        """Fields to request for board issues."""
+        return BOARD_ISSUE_FIELDS + ([self.estimation_field] if self.estimation_field else [])
+
+
+def board_columns(client: JiraClient, board_id: int) -> BoardColumns:
+    """A board's columns, from its cached configuration."""
+    return BoardColumns.from_configuration(client.get_board_configuration(board_id))
+
+
+def resolve_board(
+    client: JiraClient, board_id: Optional[int] = None, project_key: Optional[str] = None
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Find the board to report on.
+
+    Args:
+        client: JiraClient instance
+        board_id: Board ID (optional if project_key is given)
+        project_key: Project whose board to use; its first scrum board is preferred
+
+    Returns:
+        Tuple of (board, the project's other boards)
+
+    Raises:
+        ValueError: If neither argument is given, or the project has no board
+    """
+    if board_id is not None:
+        return client.get_board(board_id), []
+    if not project_key:
+        raise ValueError("Either board_id or project_key is required")
+    boards = client.list_boards(project_key)
+    if not boards:
+        raise ValueError(f"Project {project_key} has no agile board")
+    board = next((b for b in boards if b.get("type") == "scrum"), boards[0])
+    return board, [b for b in boards if b is not board]
+
+
+def pick_sprint(
+    client: JiraClient, board_id: int, sprint_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    The sprint to show: the given one, else the board's active sprint, else its last closed one.
+
+    Raises:
+        ValueError: If the board has no active or closed sprint
+    """
+    if sprint_id is not None:
+        return client.get_sprint(sprint_id)
+    active = client.list_sprints(board_id, state="active")
+    if active:
+        return active[0]
+    closed = client.list_sprints(board_id, state="closed")
+    if closed:
+        return closed[-1]
+    raise ValueError(f"Board {board_id} has no active or closed sprint")
+
+
+def _concurrently(*tasks: Callable[[], Any]) -> List[Any]:
+    """Run independent requests at once; results in task order, first error raised."""
+    results: Dict[int, Any] = {}
+    for index, result, error in map_bounded(
+        lambda index: tasks[index](), range(len(tasks)), max_workers=len(tasks)
+    ):
+        if error is not None:
+            raise error
+        results[index] = result
+    return [results[index] for index in range(len(tasks))]
+
+
+class BoardIssues:
+    """A board's issues from one sprint or its backlog, grouped by column."""
+
+    def __init__(
+        self,
+        board: Dict[str, Any],
+        columns: BoardColumns,
+        source: str,
+        issues: List[Dict[str, Any]],
+        other_boards: Optional[List[Dict[str, Any]]] = None,
+    ):
+        self.board = board
+        self.columns = columns
+        self.source = source
+        self.other_boards = other_boards or []
+        self.total = len(issues)
+        self.by_column: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict(
+            (name, []) for name in columns.names
+        )
+        for issue in issues:
+            self.by_column.setdefault(columns.column_of(issue), []).append(issue)
+
+
+def get_board_issues(
+    client: JiraClient,
+    board_id: Optional[int] = None,
+    project_key: Optional[str] = None,
+    sprint_id: Optional[int] = None,
+    backlog: bool = False,
+    jql: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> BoardIssues:
+    """
+    Read a sprint's or the backlog's issues and group them by board column.
+
+    Args:
+        client: JiraClient instance
+        board_id: Board ID (optional if project_key is given)
+        project_key: Project whose board to use (optional if board_id is given)
+        sprint_id: Sprint to show (default: the board's active sprint)
+        backlog: Show the backlog instead of a sprint (default: False)
+        jql: JQL narrowing the issues (optional)
+        limit: Maximum number of issues (optional)
+
+    Returns:
+        BoardIssues
+
+    Raises:
+        ValueError: If the board or sprint cannot be determined
+    """
+    board, others = resolve_board(client, board_id, project_key)
+    board_id = board["id"]
+    if backlog:
+        columns = board_columns(client, board_id)
+        source = "Backlog"
+        issues = client.get_backlog_issues(board_id, columns.fields, jql, limit)
+    else:
+        columns, sprint = _concurrently(
+            lambda: board_columns(client, board_id),
+            lambda: pick_sprint(client, board_id, sprint_id),
+        )
+        source = f"Sprint {sprint.get('name')} ({sprint.get('state')})"
+        issues = client.get_sprint_issues(board_id, sprint["id"], columns.fields, jql, limit)
+    return BoardIssues(board, columns, source, issues, others)
+
+
+class SprintReport:
+    """Scope, progress and a day-by-day burndown of one sprint."""
+
+    def __init__(self, board: Dict[str, Any], sprint: Dict[str, Any], columns: BoardColumns):
+        self.board = board
+        self.sprint = sprint
+        self.columns = columns
+        self.issue_count = 0
+        self.done_count = 0
+        self.total = 0.0
+        self.done = 0.0
+        self.unestimated = 0
+        # Column -> [issues, estimate]
+        self.by_column: "OrderedDict[str, List[float]]" = OrderedDict(
+            (name, [0, 0.0]) for name in columns.names
+        )
+        # Assignee -> [open issues, open estimate]
+        self.remaining_by_assignee: Dict[str, List[float]] = {}
+        # (day, remaining at its end, ideal remaining at its end)
+        self.burndown: List[Tuple[datetime, float, float]] = []
+        self.start: Optional[datetime] = None
+        self.end: Optional[datetime] = None
+        self.elapsed_days = 0.0
+        self.days_left = 0.0
+
+    @property
+    def remaining(self) -> float:
+        return self.total - self.done
+
+    @property
+    def projected_remaining(self) -> Optional[float]:
+        """Estimate left at the end date at the burn rate so far (active sprints only)."""
+        if self.sprint.get("state") != "active" or self.elapsed_days <= 0:
+            return None
+        rate = self.done / self.elapsed_days
+        return max(0.0, self.remaining - rate * self.days_left)
+
+
+def build_sprint_report(
+    board: Dict[str, Any],
+    sprint: Dict[str, Any],
+    columns: BoardColumns,
+    issues: List[Dict[str, Any]],
+    now: datetime,
+) -> SprintReport:
+    """
+    Summarize a sprint's issues.
+
+    The burndown counts an issue as burnt on the day of its resolution date
+    (at the sprint start if resolved before it, now if done without one). Scope
+    is the sprint's current issues, so issues removed during the sprint are
+    not shown.
+
+    Args:
+        board: Board dictionary
+        sprint: Sprint dictionary with startDate and endDate (and completeDate once closed)
+        columns: The board's columns
+        issues: The sprint's issues, with the board's estimation field
+        now: Reference time for an active sprint
+
+    Returns:
+        SprintReport
+    """
+    report = SprintReport(board, sprint, columns)
+    burnt: List[Tuple[datetime, float]] = []
+    for issue in issues:
+        fields = issue.get("fields", {})
+        estimate = columns.estimate(issue)
+        if columns.estimation_field and fields.get(columns.estimation_field) is None:
+            report.unestimated += 1
+        report.issue_count += 1
+        report.total += estimate
+        counts = report.by_column.setdefault(columns.column_of(issue), [0, 0.0])
+        counts[0] += 1
+        counts[1] += estimate
+
+        if columns.is_done(issue):
+            report.done_count += 1
+            report.done += estimate
+            resolved = fields.get("resolutiondate")
+            burnt.append((parse_jira_datetime(resolved) if resolved else now, estimate))
+        else:
+            name = (fields.get("assignee") or {}).get("displayName") or "Unassigned"
+            totals = report.remaining_by_assignee.setdefault(name, [0, 0.0])
+            totals[0] += 1
+            totals[1] += estimate
+
+    if not (sprint.get("startDate") and sprint.get("endDate")):
+        return report
+    start = report.start = parse_jira_datetime(sprint["startDate"])
+    end = report.end = parse_jira_datetime(sprint["endDate"])
+    stop = now
+    if sprint.get("completeDate"):
+        stop = min(parse_jira_datetime(sprint["completeDate"]), now)
+    report.elapsed_days = max(0.0, (min(stop, end) - start).total_seconds() / 86400)
+    report.days_left = max(0.0, (end - max(stop, start)).total_seconds() / 86400)
+
+    length = (end - start).total_seconds() or 1.0
+    day = start.astimezone(timezone.utc).date()
+    last = min(stop, end).astimezone(timezone.utc).date()
+    while day <= last:
+        day_end = datetime.combine(day + timedelta(days=1), time(), tzinfo=timezone.utc)
+        remaining = report.total - sum(points for at, points in burnt if at < day_end)
+        progress = min(1.0, max(0.0, (day_end - start).total_seconds() / length))
+        ideal = report.total * (1 - progress)
+        report.burndown.append((day_end - timedelta(days=1), remaining, ideal))
+        day += timedelta(days=1)
+    return report
+
+
+def compute_sprint_report(
+    client: JiraClient,
+    board_id: Optional[int] = None,
+    project_key: Optional[str] = None,
+    sprint_id: Optional[int] = None,
+) -> SprintReport:
+    """
+    Fetch a sprint and its issues and summarize them.
+
+    The board configuration (usually cached) and the sprint are requested at
+    once, then the sprint's issue pages concurrently.
+
+    Args:
+        client: JiraClient instance
+        board_id: Board ID (optional if project_key is given)
+        project_key: Project whose board to use (optional if board_id is given)
+        sprint_id: Sprint to report on (default: the active sprint, else the last closed one)
+
+    Returns:
+        SprintReport
+
+    Raises:
+        ValueError: If the board or sprint cannot be determined
+    """
+    board, _ = resolve_board(client, board_id, project_key)
+    columns, sprint = _concurrently(
+        lambda: board_columns(client, board["id"]),
+        lambda: pick_sprint(client, board["id"], sprint_id),
+    )
+    logger.info("Computing sprint report for sprint %s on board %s", sprint["id"], board["id"])
+    issues = client.get_sprint_issues(board["id"], sprint["id"], columns.fields)
+    return build_sprint_report(board, sprint, columns, issues, datetime.now(timezone.utc))
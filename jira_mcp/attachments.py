@@ -0,0 +1,120 @@
+"""Stream attachments between local files and Jira issues.
+
+Uploads are sent as a multipart body produced chunk by chunk from the open
+file, and downloads are written to disk as the chunks arrive, so a transfer
+holds about one chunk (TRANSFER_CHUNK_SIZE) in memory whatever the file size.
+Each client runs at most ``max_transfers`` transfers at once; further ones wait
+for a free slot (see JiraClient._stream).
+
+Inside a background job, progress is reported per chunk, so a job's done/total
+counts mebibytes.
+
+The tools only read uploads from JIRA_MCP_UPLOAD_DIR (default: the export
+directory) and only write downloads inside JIRA_MCP_EXPORT_DIR, so a caller
+cannot send arbitrary files on the server host to Jira or overwrite them.
+"""
+
+import logging
+import math
+import mimetypes
+import os
+from typing import Any, Dict, Iterator, Optional
+
+from jira_mcp.export import default_export_dir
+from jira_mcp.jira_client import TRANSFER_CHUNK_SIZE, JiraClient
+from jira_mcp.jobs import report_progress, set_total
+
+logger = logging.getLogger(__name__)
+
+
+def default_upload_dir() -> str:
+    """Directory jira_attach_file reads from (JIRA_MCP_UPLOAD_DIR or the export directory)."""
+    return os.getenv("JIRA_MCP_UPLOAD_DIR") or default_export_dir()
+
+
+def upload_attachment(
+    client: JiraClient, issue_key: str, path: str, filename: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Attach a local file to an issue.
+
+    Args:
+        client: JiraClient instance
+        issue_key: Issue key (e.g., 'PROJ-123')
+        path: File to upload
+        filename: Name the attachment gets in Jira (default: the file's name)
+
+    Returns:
+        The created attachment (id, filename, size, mimeType, ...)
+
+    Raises:
+        ValueError: If path is not a readable file
+    """
+    if not os.path.isfile(path):
+        raise ValueError(f"{path} is not a file")
+    size = os.path.getsize(path)
+    filename = filename or os.path.basename(path)
+    mime_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    set_total(max(1, math.ceil(size / TRANSFER_CHUNK_SIZE)))
+
+    def chunks() -> Iterator[bytes]:
+        with open(path, "rb") as f:
+            while chunk := f.read(TRANSFER_CHUNK_SIZE):
+                yield chunk
+                report_progress()
+
+    attachments = client.add_attachment(issue_key, filename, size, chunks, mime_type)
+    logger.info("Attached %s to %s (%s bytes)", path, issue_key, size)
+    return attachments[0] if attachments else {"filename": filename, "size": size}
+
+
+def download_attachment(
+    client: JiraClient, attachment_id: str, path: str, overwrite: bool = False
+) -> Dict[str, Any]:
+    """
+    Save an attachment to a local file.
+
+    The file is written under a temporary name and moved into place once
+    complete, so a failed or cancelled download never leaves a partial file at
+    the destination.
+
+    Args:
+        client: JiraClient instance
+        attachment_id: Attachment ID (e.g., '10001')
+        path: Destination file, or an existing directory to save it in under
+            the attachment's own filename
+        overwrite: Replace an existing file (default: False)
+
+    Returns:
+        The attachment's metadata, plus 'path' (where it was saved) and 'written' (bytes)
+
+    Raises:
+        ValueError: If the destination exists and overwrite is not set
+    """
+    attachment = client.get_attachment(attachment_id)
+    if os.path.isdir(path):
+        name = os.path.basename(attachment.get("filename") or "") or f"attachment-{attachment_id}"
+        path = os.path.join(path, name)
+    if os.path.exists(path) and not overwrite:
+        raise ValueError(f"{path} already exists (pass overwrite to replace it)")
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    partial_path = f"{path}.part"
+    if attachment.get("size") is not None:
+        set_total(max(1, math.ceil(attachment["size"] / TRANSFER_CHUNK_SIZE)))
+
+    written = 0
+    try:
+        with open(partial_path, "wb") as f:
+            for chunk in client.iter_attachment(attachment_id):
+                f.write(chunk)
+                written += len(chunk)
+                report_progress()
+        os.replace(partial_path, path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    logger.info("Downloaded attachment %s to %s (%s bytes)", attachment_id, path, written)
+    return {**attachment, "path": path, "written": written}
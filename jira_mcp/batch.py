@@ -0,0 +1,363 @@
+"""Run a plan of Jira operations as a dependency graph, concurrently.
+
+Each operation names a tool and its arguments, and may reference the result
+of an earlier operation with ``$<id>.<field>``, e.g. ``{"parent": "$epic.key"}``.
+References (plus explicit ``depends_on``) define a DAG. Operations whose
+dependencies have finished run concurrently on the shared client; an operation
+whose dependency failed is skipped, while unrelated branches carry on.
+
+The whole plan is checked before anything runs: unknown tools, malformed
+arguments, references to unknown operations and dependency cycles are
+reported without sending a single request. An operation that references
+earlier results is validated once its references are resolved, since a
+reference may stand for an integer, a list or an enum value.
+"""
+
+import contextvars
+import logging
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from jira_mcp.adf import build_update_fields
+from jira_mcp.jira_client import JiraClient
+from jira_mcp.jobs import report_progress, set_total
+from jira_mcp.validation import Validator
+
+logger = logging.getLogger(__name__)
+
+# Largest plan accepted in one call
+MAX_BATCH_OPERATIONS = 100
+
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+# `$id.field`; a value that is only a reference keeps the referenced value's type
+_REFERENCE = re.compile(r"\$([A-Za-z_][\w-]*)\.(\w+)")
+
+
+def _create_issue(client: JiraClient, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    from jira_mcp import similar
+
+    project_key = arguments["project_key"]
+    summary = arguments["summary"]
+    description = arguments.get("description")
+    if arguments.get("check_duplicates"):
+        matches = similar.find_similar(
+            client, project_key, summary, description, min_score=similar.DUPLICATE_THRESHOLD
+        )
+        if matches is None:
+            logger.info("Duplicate check skipped; %s is still being indexed", project_key)
+        elif matches:
+            keys = ", ".join(match.key for match in matches)
+            raise ValueError(f"Not created: possible duplicates exist ({keys})")
+
+    result = client.create_issue(
+        project_key=project_key,
+        summary=summary,
+        issue_type=arguments["issue_type"],
+        description=description,
+        priority=arguments.get("priority"),
+        labels=arguments.get("labels"),
+        parent=arguments.get("parent"),
+    )
+    key = result.get("key")
+    similar.note_created(project_key, key, summary, description)
+    return {"key": key, "id": result.get("id"), "url": f"{client.base_url}/browse/{key}"}
+
+
+def _update_issue(client: JiraClient, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    client.update_issue(arguments["issue_key"], build_update_fields(arguments))
+    return {"key": arguments["issue_key"]}
+
+
+def _add_comment(client: JiraClient, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    result = client.add_comment(arguments["issue_key"], arguments["comment"])
+    return {"key": arguments["issue_key"], "id": result.get("id")}
+
+
+def _transition_issue(client: JiraClient, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    client.transition_issue(arguments["issue_key"], arguments["transition_name"])
+    return {"key": arguments["issue_key"], "status": arguments["transition_name"]}
+
+
+def _link_issues(client: JiraClient, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    link_type = arguments.get("link_type", "Relates")
+    client.link_issues(arguments["inward_issue"], arguments["outward_issue"], link_type)
+    return {
+        "inward": arguments["inward_issue"],
+        "outward": arguments["outward_issue"],
+        "type": link_type,
+    }
+
+
+def _assign_issue(client: JiraClient, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    client.assign_issue(arguments["issue_key"], arguments.get("account_id"))
+    return {"key": arguments["issue_key"], "account_id": arguments.get("account_id")}
+
+
+def _get_issue(client: JiraClient, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    from jira_mcp.records import RECORD_FIELDS, IssueRecord
+
+    record = IssueRecord.from_json(client.get_issue(arguments["issue_key"], fields=RECORD_FIELDS))
+    return {name: getattr(record, name) for name in IssueRecord.__slots__}
+
+
+def _search_users(client: JiraClient, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    users = client.search_users(arguments["query"], arguments.get("max_results", 1))
+    if not users:
+        raise ValueError(f"No users found matching: {arguments['query']}")
+    return {
+        "account_id": users[0].get("accountId"),
+        "display_name": users[0].get("displayName"),
+        "count": len(users),
+    }
+
+
+# Tool name -> operation returning a flat result whose fields other operations can reference
+OPERATIONS: Dict[str, Callable[[JiraClient, Dict[str, Any]], Dict[str, Any]]] = {
+    "jira_create_issue": _create_issue,
+    "jira_update_issue": _update_issue,
+    "jira_add_comment": _add_comment,
+    "jira_transition_issue": _transition_issue,
+    "jira_link_issues": _link_issues,
+    "jira_assign_issue": _assign_issue,
+    "jira_get_issue": _get_issue,
+    "jira_search_users": _search_users,
+}
+
+
+class Operation:
+    """One step of a batch plan and its outcome."""
+
+    __slots__ = (
+        "id", "tool", "arguments", "depends_on", "validator", "state", "result", "error",
+        "elapsed",
+    )
+
+    def __init__(
+        self,
+        op_id: str,
+        tool: str,
+        arguments: Dict[str, Any],
+        depends_on: Set[str],
+        validator: Optional[Validator] = None,
+    ):
+        self.id = op_id
+        self.tool = tool
+        self.arguments = arguments
+        self.depends_on = depends_on
+        # Checks the resolved arguments of an operation that references other results
+        self.validator = validator
+        self.state: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.elapsed = 0.0
+
+
+def _references(value: Any) -> Set[str]:
+    """IDs of all operations referenced anywhere in an argument value."""
+    if isinstance(value, str):
+        return {match.group(1) for match in _REFERENCE.finditer(value)}
+    if isinstance(value, list):
+        return set().union(*(_references(item) for item in value)) if value else set()
+    if isinstance(value, dict):
+        return set().union(*(_references(item) for item in value.values())) if value else set()
+    return set()
+
+
+def resolve_references(value: Any, results: Dict[str, Dict[str, Any]]) -> Any:
+    """
+    Substitute ``$id.field`` references with fields of earlier results.
+
+    Args:
+        value: Argument value (strings, lists and dicts are searched)
+        results: Result of each finished operation, by operation ID
+
+    Returns:
+        The value with references replaced
+
+    Raises:
+        ValueError: If a referenced field is missing from the result
+    """
+    if isinstance(value, list):
+        return [resolve_references(item, results) for item in value]
+    if isinstance(value, dict):
+        return {key: resolve_references(item, results) for key, item in value.items()}
+    if not isinstance(value, str) or "$" not in value:
+        return value
+
+    def lookup(match: "re.Match[str]") -> Any:
+        op_id, field = match.group(1), match.group(2)
+        result = results[op_id]
+        if field not in result:
+            raise ValueError(
+                f"${op_id}.{field}: no field '{field}' (available: {', '.join(sorted(result))})"
+            )
+        return result[field]
+
+    whole = _REFERENCE.fullmatch(value)
+    if whole:
+        return lookup(whole)
+    return _REFERENCE.sub(lambda match: str(lookup(match)), value)
+
+
+def plan_batch(
+    operations: List[Dict[str, Any]], validators: Optional[Dict[str, Validator]] = None
+) -> List[Operation]:
+    """
+    Check a batch and build its operations, without running anything.
+
+    Args:
+        operations: Items with tool, arguments and optional id and depends_on
+        validators: Argument validator for each tool name (default: no argument checks)
+
+    Returns:
+        Operations in the order given
+
+    Raises:
+        ValueError: Listing every problem found in the plan
+    """
+    if not operations:
+        raise ValueError("Batch has no operations")
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        raise ValueError(f"Batch has {len(operations)} operations (maximum {MAX_BATCH_OPERATIONS})")
+
+    problems: List[str] = []
+    planned: List[Operation] = []
+    for index, spec in enumerate(operations):
+        op_id = spec.get("id") or f"op{index + 1}"
+        tool = spec["tool"]
+        arguments = spec.get("arguments") or {}
+        if any(op.id == op_id for op in planned):
+            problems.append(f"{op_id}: duplicate operation id")
+        references = _references(arguments)
+        validator = (validators or {}).get(tool)
+        if tool not in OPERATIONS:
+            problems.append(f"{op_id}: tool '{tool}' cannot be used in a batch")
+        elif validator is not None and not references:
+            problems.extend(f"{op_id}: {p}" for p in validator(arguments))
+            validator = None
+        depends_on = references | set(spec.get("depends_on") or ())
+        planned.append(Operation(op_id, tool, arguments, depends_on, validator))
+
+    ids = {op.id for op in planned}
+    for op in planned:
+        for missing in sorted(op.depends_on - ids):
+            problems.append(f"{op.id}: depends on unknown operation '{missing}'")
+        if op.id in op.depends_on:
+            problems.append(f"{op.id}: depends on itself")
+    if not problems:
+        cycle = _find_cycle(planned)
+        if cycle:
+            problems.append(f"dependency cycle: {' → '.join(cycle)}")
+
+    if problems:
+        raise ValueError("Invalid batch:\n" + "\n".join(f"  - {p}" for p in problems))
+    return planned
+
+
+def _find_cycle(operations: List[Operation]) -> Optional[List[str]]:
+    """Return one dependency cycle as a list of IDs, or None if the graph is acyclic."""
+    by_id = {op.id: op for op in operations}
+    state: Dict[str, int] = {}  # 1 = on the current path, 2 = done
+    path: List[str] = []
+
+    def visit(op_id: str) -> Optional[List[str]]:
+        state[op_id] = 1
+        path.append(op_id)
+        for dep in sorted(by_id[op_id].depends_on):
+            if state.get(dep) == 1:
+                return path[path.index(dep):] + [dep]
+            if dep not in state:
+                cycle = visit(dep)
+                if cycle:
+                    return cycle
+        path.pop()
+        state[op_id] = 2
+        return None
+
+    for op in operations:
+        if op.id not in state:
+            cycle = visit(op.id)
+            if cycle:
+                return cycle
+    return None
+
+
+def run_batch(
+    client: JiraClient, operations: List[Operation], concurrency: Optional[int] = None
+) -> List[Operation]:
+    """
+    Execute a planned batch, running every operation as soon as its dependencies succeed.
+
+    Args:
+        client: JiraClient instance
+        operations: Operations from plan_batch
+        concurrency: Maximum number of operations in flight
+            (default: the client's configured concurrency)
+
+    Returns:
+        The same operations, each with its state, result or error filled in
+    """
+    max_workers = max(1, concurrency or client.concurrency)
+    by_id = {op.id: op for op in operations}
+    results: Dict[str, Dict[str, Any]] = {}
+    waiting = list(operations)
+    running: Dict[Future, Operation] = {}
+    set_total(len(operations))
+
+    def execute(op: Operation) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            arguments = resolve_references(op.arguments, results)
+            if op.validator is not None:
+                problems = op.validator(arguments)
+                if problems:
+                    raise ValueError(f"Invalid arguments: {'; '.join(problems)}")
+            return OPERATIONS[op.tool](client, arguments)
+        finally:
+            op.elapsed = time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while waiting or running:
+            # Skip operations whose dependencies failed; start those that are ready
+            progressed = True
+            while progressed:
+                progressed = False
+                for op in list(waiting):
+                    blocked = [
+                        dep for dep in op.depends_on if by_id[dep].state in (FAILED, SKIPPED)
+                    ]
+                    if blocked:
+                        waiting.remove(op)
+                        op.state = SKIPPED
+                        op.error = f"depends on {', '.join(sorted(blocked))}, which did not succeed"
+                        report_progress(error=f"{op.id}: skipped")
+                        progressed = True
+                    elif op.depends_on <= results.keys() and len(running) < max_workers:
+                        waiting.remove(op)
+                        context = contextvars.copy_context()
+                        running[pool.submit(context.run, execute, op)] = op
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                op = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    op.state = SUCCEEDED
+                    op.result = future.result()
+                    results[op.id] = op.result
+                    report_progress(partial=f"{op.id}: {op.tool} done")
+                else:
+                    op.state = FAILED
+                    op.error = str(error)
+                    logger.warning("Batch operation %s (%s) failed: %s", op.id, op.tool, error)
+                    report_progress(error=f"{op.id}: {error}")
+
+    return operations
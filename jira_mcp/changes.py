@@ -0,0 +1,357 @@
+"""Incremental change feeds: which issues changed since the last poll, and how.
+
+A ChangeFeed remembers, for one JQL scope, a watermark (the latest ``updated``
+time it has seen) and a compact snapshot (IssueRecord) of every issue it has
+reported. Each poll asks Jira only for issues updated since the watermark and
+diffs them field by field against their snapshots, so repeated polling costs
+one small query and returns only what actually changed.
+
+JQL compares dates at minute resolution in the Jira user's time zone, so a
+poll re-reads the watermark's minute; issues whose ``updated`` time has not
+moved are recognized from their snapshot and skipped. Skipped issues do not
+count against the poll's limit, and results are ordered by (updated, key),
+so a poll pages past any number of issues sharing the watermark's minute
+instead of returning the same ones again.
+
+Feeds are kept per MCP session and per JQL scope, and are dropped together
+with their session.
+
+Changes can also be pushed (see jira_mcp.webhooks). Pushed events patch the
+snapshots of issues a feed already follows and queue the change for its next
+poll. A feed without a JQL scope follows every issue, so while webhooks keep
+arriving it is answered from pushed events alone, without querying Jira.
+"""
+
+import logging
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import date, datetime, timezone, tzinfo
+from typing import Any, Iterator, List, Optional, Tuple
+
+from jira_mcp.cycle_time import parse_jira_datetime
+from jira_mcp.jira_client import JiraClient
+from jira_mcp.records import IssueRecord, iter_records
+
+logger = logging.getLogger(__name__)
+
+# Window used by a feed's first poll (JQL relative date)
+DEFAULT_SINCE = "-1h"
+
+# Snapshots kept per feed; the least recently changed issues are forgotten first
+MAX_SNAPSHOTS = 5000
+
+# Feeds kept per session (one per distinct JQL scope); the least recently used go first
+MAX_FEEDS_PER_SESSION = 32
+
+# IssueRecord fields compared between polls. `updated` is the trigger rather than a change,
+# and the account ID and status category follow the assignee and status already shown.
+DIFF_FIELDS = tuple(
+    name
+    for name in IssueRecord.__slots__
+    if name not in ("key", "id", "updated", "assignee_id", "status_category")
+)
+
+_RELATIVE_DATE = re.compile(r"^-\d+[wdhm]$")
+
+
+class IssueChange:
+    """An issue reported by a poll: new to the feed, changed, or deleted."""
+
+    __slots__ = ("record", "changes", "notes", "is_new", "is_deleted")
+
+    def __init__(
+        self,
+        record: IssueRecord,
+        changes: List[Tuple[str, Any, Any]],
+        notes: Optional[List[str]] = None,
+        is_new: bool = False,
+        is_deleted: bool = False,
+    ):
+        self.record = record
+        self.changes = changes
+        self.notes = notes or []
+        self.is_new = is_new
+        self.is_deleted = is_deleted
+
+
+class _Pending:
+    """A change queued for the next poll, diffed against the snapshot it started from."""
+
+    __slots__ = ("base", "notes", "deleted")
+
+    def __init__(self, base: Optional[IssueRecord]):
+        self.base = base
+        self.notes: List[str] = []
+        self.deleted = False
+
+
+def diff_records(old: IssueRecord, new: IssueRecord) -> List[Tuple[str, Any, Any]]:
+    """
+    Compare two snapshots of an issue.
+
+    Args:
+        old: Previous snapshot
+        new: Current snapshot
+
+    Returns:
+        List of (field, old value, new value) for every field in DIFF_FIELDS that differs
+    """
+    return [
+        (name, getattr(old, name), getattr(new, name))
+        for name in DIFF_FIELDS
+        if getattr(old, name) != getattr(new, name)
+    ]
+
+
+def since_clause(since: str) -> str:
+    """
+    Convert a user-supplied window start to a JQL date value.
+
+    Args:
+        since: JQL relative date ('-1h', '-30m', '-2d', '-1w') or 'YYYY-MM-DD'
+
+    Returns:
+        Value usable after ``updated >=``
+
+    Raises:
+        ValueError: If since is neither form
+    """
+    if _RELATIVE_DATE.match(since):
+        return since
+    try:
+        return f'"{date.fromisoformat(since).isoformat()}"'
+    except ValueError:
+        raise ValueError(
+            f"Invalid since '{since}' (expected e.g. '-1h', '-2d' or 'YYYY-MM-DD')"
+        ) from None
+
+
+def user_timezone(client: JiraClient) -> tzinfo:
+    """The Jira user's time zone, in which JQL interprets dates (UTC if unknown)."""
+    try:
+        name = client.current_user().get("timeZone")
+        if name:
+            from zoneinfo import ZoneInfo
+
+            return ZoneInfo(name)
+    except Exception as e:
+        logger.warning("Could not determine the Jira user's time zone, assuming UTC: %s", e)
+    return timezone.utc
+
+
+class ChangeFeed:
+    """Watermark, issue snapshots and queued changes for one JQL scope."""
+
+    def __init__(self, jql: Optional[str] = None):
+        """
+        Initialize an empty feed.
+
+        Args:
+            jql: JQL restricting the issues followed (optional; all issues if omitted)
+        """
+        self.jql = jql
+        self.watermark: Optional[datetime] = None
+        self.synced_at: Optional[float] = None
+        self.snapshots: "OrderedDict[str, IssueRecord]" = OrderedDict()
+        self.pending: "OrderedDict[str, _Pending]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def query(self, since: str, tz: tzinfo) -> str:
+        """Build the JQL for the next poll, oldest updates first."""
+        if self.watermark is None:
+            start = since_clause(since)
+        else:
+            start = f'"{self.watermark.astimezone(tz).strftime("%Y/%m/%d %H:%M")}"'
+        scope = f"({self.jql}) AND " if self.jql else ""
+        return f"{scope}updated >= {start} ORDER BY updated ASC, key ASC"
+
+    def _queue(self, issue_key: str) -> _Pending:
+        pending = self.pending.get(issue_key)
+        if pending is None:
+            pending = self.pending[issue_key] = _Pending(self.snapshots.get(issue_key))
+        return pending
+
+    def observe(self, record: IssueRecord, note: Optional[str] = None) -> bool:
+        """
+        Fold the current state of one issue into the feed (caller holds the lock).
+
+        Args:
+            record: Current state of the issue
+            note: Description of the event, shown with the change (optional)
+
+        Returns:
+            True if a change was queued: the issue is new to the feed, was updated
+            since its snapshot, or a note was given
+        """
+        if record.updated:
+            updated = parse_jira_datetime(record.updated)
+            if self.watermark is None or updated > self.watermark:
+                self.watermark = updated
+
+        previous = self.snapshots.get(record.key)
+        if previous is not None and previous.updated == record.updated and note is None:
+            return False
+
+        pending = self._queue(record.key)
+        pending.deleted = False
+        if note is not None:
+            pending.notes.append(note)
+        self.snapshots.pop(record.key, None)
+        self.snapshots[record.key] = record
+        while len(self.snapshots) > MAX_SNAPSHOTS:
+            evicted, _ = self.snapshots.popitem(last=False)
+            self.pending.pop(evicted, None)
+        return True
+
+    def note(self, issue_key: str, note: str) -> bool:
+        """Queue an event on a followed issue, keeping its snapshot (caller holds the lock)."""
+        if issue_key not in self.snapshots:
+            return False
+        self._queue(issue_key).notes.append(note)
+        return True
+
+    def forget(self, issue_key: str, note: Optional[str] = None) -> bool:
+        """Drop a followed issue and queue its deletion (caller holds the lock)."""
+        if issue_key not in self.snapshots:
+            return False
+        pending = self._queue(issue_key)
+        pending.deleted = True
+        if note is not None:
+            pending.notes.append(note)
+        self.snapshots.pop(issue_key)
+        return True
+
+    def covered_by_push(self) -> bool:
+        """Whether pushed events alone describe every change since the last query."""
+        return (
+            self.jql is None
+            and push_active()
+            and self.synced_at is not None
+            and push_started is not None
+            and push_started <= self.synced_at
+        )
+
+    def drain(self) -> List[IssueChange]:
+        """Turn queued changes into IssueChanges and clear the queue (caller holds the lock)."""
+        changes = []
+        for key, pending in self.pending.items():
+            current = self.snapshots.get(key)
+            record = current or pending.base
+            if record is None:
+                continue
+            if pending.deleted:
+                changes.append(IssueChange(record, [], pending.notes, is_deleted=True))
+            elif pending.base is None:
+                changes.append(IssueChange(record, [], pending.notes, is_new=True))
+            else:
+                diff = diff_records(pending.base, record) if current else []
+                changes.append(IssueChange(record, diff, pending.notes))
+        self.pending.clear()
+        return changes
+
+    def poll(
+        self, client: JiraClient, since: str = DEFAULT_SINCE, limit: int = 100
+    ) -> Tuple[List[IssueChange], bool]:
+        """
+        Fetch issues updated since the watermark and diff them against their snapshots.
+
+        Changes pushed since the previous poll are included. When push delivery
+        covers the feed, no request is made.
+
+        Args:
+            client: JiraClient instance
+            since: Window for the first poll, as accepted by since_clause
+            limit: Maximum number of changed issues to report in this poll; unchanged
+                issues re-read from the watermark's minute do not count
+
+        Returns:
+            Tuple of (changes in update order, whether more updates may be pending)
+        """
+        with self.lock:
+            if self.covered_by_push():
+                logger.debug("Change feed covered by webhooks; not querying Jira")
+                return self.drain(), False
+
+            jql = self.query(since, user_timezone(client))
+            logger.info("Polling changes: %s", jql)
+            self.synced_at = time.time()
+            queued = 0
+            for record in iter_records(client, jql):
+                if self.observe(record):
+                    queued += 1
+                    if queued >= limit:
+                        return self.drain(), True
+            return self.drain(), False
+
+
+_sessions: "weakref.WeakKeyDictionary[Any, OrderedDict[str, ChangeFeed]]" = (
+    weakref.WeakKeyDictionary()
+)
+_sessionless: "OrderedDict[str, ChangeFeed]" = OrderedDict()
+_registry_lock = threading.Lock()
+
+# Pushed events (see jira_mcp.webhooks): when the first and the latest arrived (time.time())
+push_started: Optional[float] = None
+last_push: Optional[float] = None
+
+# Without a pushed event for this long, feeds stop trusting push delivery and query Jira,
+# so a disabled or misconfigured webhook never silences them
+PUSH_IDLE_TIMEOUT = 900.0
+
+
+def get_feed(session: Any, jql: Optional[str]) -> ChangeFeed:
+    """
+    Return the feed for a session and JQL scope, creating it on first use.
+
+    Args:
+        session: MCP session object (feeds are dropped when it is garbage collected),
+            or None outside a session
+        jql: JQL scope of the feed (optional)
+
+    Returns:
+        The ChangeFeed
+    """
+    scope = (jql or "").strip()
+    with _registry_lock:
+        if session is None:
+            feeds = _sessionless
+        else:
+            feeds = _sessions.setdefault(session, OrderedDict())
+        feed = feeds.pop(scope, None) or ChangeFeed(scope or None)
+        feeds[scope] = feed
+        while len(feeds) > MAX_FEEDS_PER_SESSION:
+            feeds.popitem(last=False)
+        return feed
+
+
+def reset_feed(session: Any, jql: Optional[str]) -> None:
+    """Forget the watermark and snapshots of a session's feed for a JQL scope."""
+    scope = (jql or "").strip()
+    with _registry_lock:
+        feeds = _sessionless if session is None else _sessions.get(session, {})
+        feeds.pop(scope, None)
+
+
+def all_feeds() -> Iterator[ChangeFeed]:
+    """Every live feed, across all sessions."""
+    with _registry_lock:
+        feeds = list(_sessionless.values())
+        for session_feeds in list(_sessions.values()):
+            feeds.extend(session_feeds.values())
+    return iter(feeds)
+
+
+def record_push() -> None:
+    """Record that a pushed event has arrived."""
+    global push_started, last_push
+    last_push = time.time()
+    if push_started is None:
+        push_started = last_push
+
+
+def push_active() -> bool:
+    """Whether pushed events are currently being received."""
+    return last_push is not None and time.time() - last_push < PUSH_IDLE_TIMEOUT
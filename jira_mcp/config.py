@@ -3,10 +3,9 @@
 import os
 from typing import Optional
 from pydantic import BaseModel, Field, HttpUrl
-from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Defined in settings so the pydantic-free loader does not import this module
+from jira_mcp.settings import load_env  # noqa: F401
 
 
 class JiraInstanceConfig(BaseModel):
@@ -16,6 +15,30 @@ class JiraInstanceConfig(BaseModel):
     url: HttpUrl = Field(description="Jira instance URL (e.g., https://lit-ai.atlassian.net)")
     email: str = Field(description="Email address for authentication")
     api_token: str = Field(description="Jira API token")
+    timeout: float = Field(default=30.0, gt=0, description="HTTP timeout in seconds")
+    concurrency: int = Field(default=8, ge=1, description="Maximum parallel requests per tool call")
+    max_connections: int = Field(default=100, ge=1, description="HTTP connection pool size")
+    adaptive_concurrency: bool = Field(
+        default=True, description="Adapt the process-wide request limit to latency and 429s"
+    )
+    max_concurrency: int = Field(
+        default=32, ge=1, description="Upper bound for the adaptive request limit"
+    )
+    breaker_threshold: int = Field(
+        default=5, ge=0, description="Consecutive errors that open an endpoint's circuit (0: off)"
+    )
+    breaker_reset: float = Field(
+        default=30.0, gt=0, description="Seconds an open circuit fails fast before a probe"
+    )
+    stale_while_revalidate: bool = Field(
+        default=True, description="Answer reads from the last good response while Jira is slow"
+    )
+    stale_timeout: float = Field(
+        default=2.0, gt=0, description="Seconds to wait for a fresh read before answering stale"
+    )
+    max_transfers: int = Field(
+        default=2, ge=1, description="Attachment uploads/downloads running at once"
+    )
 
     @classmethod
     def from_env(cls, instance_name: str) -> "JiraInstanceConfig":
@@ -36,6 +59,7 @@ class JiraInstanceConfig(BaseModel):
         Raises:
             ValueError: If required environment variables are missing
         """
+        load_env()
         instance_upper = instance_name.upper()
 
         url = os.getenv(f"JIRA_{instance_upper}_URL")
@@ -70,11 +94,13 @@ def get_instance_config(instance_name: Optional[str] = None) -> JiraInstanceConf
     Raises:
         ValueError: If instance_name is not provided and JIRA_INSTANCE is not set
     """
+    load_env()
     if instance_name is None:
         instance_name = os.getenv("JIRA_INSTANCE")
         if not instance_name:
             raise ValueError(
-                "No instance specified. Provide --instance argument or set JIRA_INSTANCE environment variable"
+                "No instance specified. Provide --instance argument or set JIRA_INSTANCE "
+                "environment variable"
             )
 
     return JiraInstanceConfig.from_env(instance_name)
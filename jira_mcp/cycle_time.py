@@ -0,0 +1,196 @@
+"""Cycle-time and time-in-status analytics folded from issue changelogs."""
+
+import heapq
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from jira_mcp.jira_client import JiraClient, map_bounded
+from jira_mcp.jobs import report_progress
+from jira_mcp.stats import StreamingHistogram
+
+logger = logging.getLogger(__name__)
+
+# Fields needed to fold an issue's history; everything else is skipped
+CYCLE_TIME_FIELDS = ["created", "status", "resolutiondate"]
+
+
+def parse_jira_datetime(value: str) -> datetime:
+    """
+    Parse a Jira timestamp such as '2024-01-15T10:30:00.000+0000'.
+
+    Args:
+        value: Timestamp string as returned by the Jira REST API
+
+    Returns:
+        Timezone-aware datetime (naive values are treated as UTC)
+    """
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def fold_status_durations(
+    created: datetime,
+    current_status: str,
+    histories: Iterable[Dict[str, Any]],
+    end: datetime,
+) -> Dict[str, float]:
+    """
+    Fold a stream of changelog histories into seconds spent in each status.
+
+    Histories are consumed one at a time, so memory use does not grow with the
+    length of the changelog.
+
+    Args:
+        created: Issue creation time
+        current_status: Status the issue is in now (used when it never transitioned)
+        histories: Changelog histories in chronological order
+        end: Time at which the last status stops accumulating (resolution or now)
+
+    Returns:
+        Dictionary mapping status name to seconds spent in it
+    """
+    durations: Dict[str, float] = {}
+    status: Optional[str] = None
+    since = created
+
+    for history in histories:
+        for item in history.get("items", []):
+            if item.get("field") != "status":
+                continue
+            at = parse_jira_datetime(history["created"])
+            from_status = item.get("fromString") or status or current_status
+            if status is None:
+                status = from_status
+            durations[status] = durations.get(status, 0.0) + max(0.0, (at - since).total_seconds())
+            status = item.get("toString") or status
+            since = at
+
+    status = status or current_status
+    durations[status] = durations.get(status, 0.0) + max(0.0, (end - since).total_seconds())
+    return durations
+
+
+class CycleTimeReport:
+    """Aggregate time-in-status and lead-time statistics over many issues."""
+
+    def __init__(self, top_n: int = 10):
+        """
+        Initialize an empty report.
+
+        Args:
+            top_n: Number of slowest issues (by lead time) to keep for display
+        """
+        self.top_n = top_n
+        self.issue_count = 0
+        self.resolved_count = 0
+        self.errors: List[str] = []
+        self.lead_time = StreamingHistogram()
+        self.time_in_status: Dict[str, StreamingHistogram] = {}
+        self._slowest: List[Tuple[float, str, Dict[str, float]]] = []
+
+    def add_issue(
+        self, issue_key: str, durations: Dict[str, float], lead_time: Optional[float]
+    ) -> None:
+        """Record the folded history of a single issue."""
+        self.issue_count += 1
+        for status, seconds in durations.items():
+            self.time_in_status.setdefault(status, StreamingHistogram()).add(seconds)
+
+        if lead_time is None:
+            return
+        self.resolved_count += 1
+        self.lead_time.add(lead_time)
+
+        entry = (lead_time, issue_key, durations)
+        if len(self._slowest) < self.top_n:
+            heapq.heappush(self._slowest, entry)
+        elif self.top_n and lead_time > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def add_error(self, issue_key: str, error: BaseException) -> None:
+        """Record an issue whose history could not be fetched."""
+        self.errors.append(f"{issue_key}: {error}")
+
+    @property
+    def slowest(self) -> List[Tuple[float, str, Dict[str, float]]]:
+        """Slowest resolved issues as (lead_time, key, durations), slowest first."""
+        return sorted(self._slowest, key=lambda entry: entry[0], reverse=True)
+
+
+def issue_cycle_time(
+    client: JiraClient, issue: Dict[str, Any], now: datetime
+) -> Tuple[Dict[str, float], Optional[float]]:
+    """
+    Compute time-in-status and lead time for a single issue.
+
+    Args:
+        client: JiraClient used to stream the changelog
+        issue: Issue dictionary with created, status and resolutiondate fields
+        now: Reference time for unresolved issues
+
+    Returns:
+        Tuple of (status durations in seconds, lead time in seconds or None if unresolved)
+    """
+    fields = issue.get("fields", {})
+    created = parse_jira_datetime(fields["created"])
+    current_status = (fields.get("status") or {}).get("name", "Unknown")
+    resolved = fields.get("resolutiondate")
+    end = parse_jira_datetime(resolved) if resolved else now
+
+    durations = fold_status_durations(
+        created, current_status, client.iter_changelog(issue["key"]), end
+    )
+    lead_time = (end - created).total_seconds() if resolved else None
+    return durations, lead_time
+
+
+def compute_cycle_times(
+    client: JiraClient,
+    jql: str,
+    max_issues: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    top_n: int = 10,
+) -> CycleTimeReport:
+    """
+    Stream issues matching a JQL query and aggregate their cycle times.
+
+    Changelogs are fetched concurrently, with at most ``concurrency`` issues in
+    flight; the search is paged lazily behind them so neither issues nor
+    histories accumulate in memory.
+
+    Args:
+        client: JiraClient instance
+        jql: JQL query selecting the issues to analyze
+        max_issues: Maximum number of issues to analyze (optional)
+        concurrency: Maximum number of changelogs fetched at once
+            (default: the client's configured concurrency)
+        top_n: Number of slowest issues to keep in the report
+
+    Returns:
+        CycleTimeReport with aggregate statistics
+    """
+    now = datetime.now(timezone.utc)
+    report = CycleTimeReport(top_n=top_n)
+    issues = client.iter_issues(jql, fields=CYCLE_TIME_FIELDS, limit=max_issues)
+
+    logger.info("Computing cycle times for JQL: %s", jql)
+    for issue, result, error in map_bounded(
+        lambda issue: issue_cycle_time(client, issue, now),
+        issues,
+        concurrency or client.concurrency,
+    ):
+        if error is not None:
+            report.add_error(issue.get("key", "?"), error)
+            report_progress(error=f"{issue.get('key', '?')}: {error}")
+            continue
+        durations, lead_time = result
+        report.add_issue(issue["key"], durations, lead_time)
+        report_progress()
+
+    return report
@@ -0,0 +1,217 @@
+"""Decode JSON response bodies once, straight from bytes.
+
+The fastest installed backend is used: orjson, then msgspec, then the
+standard library (``json.loads`` accepts bytes, so no intermediate str is
+built in any case). Set ``JIRA_MCP_JSON_BACKEND`` to 'orjson', 'msgspec' or
+'json' to force one.
+
+When msgspec is installed (and no other backend is forced), known page
+shapes are decoded through typed schemas that skip the fields callers never
+read, such as avatar URLs in changelog authors and worklog comments, so
+those values are never materialized. Results are still plain dicts and
+lists, so callers do not depend on the backend.
+
+Search pages carry whichever fields the caller asked for, so the typed
+search decoder is only used when every requested field is one it knows
+(SEARCH_FIELDS); it then keeps the keys callers read from users, statuses,
+priorities and issue types and drops their avatar and icon URLs.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypedDict
+
+logger = logging.getLogger(__name__)
+
+# Page shapes with a typed msgspec decoder
+SCHEMAS = ("changelog", "worklog", "search")
+
+# Issue fields the typed search decoder keeps; searches asking for any other use generic decoding
+SEARCH_FIELDS = frozenset(
+    {
+        "key", "summary", "status", "issuetype", "priority", "assignee", "reporter",
+        "creator", "created", "updated", "resolutiondate", "duedate", "labels", "parent",
+    }
+)
+
+
+def _installed(module: str) -> bool:
+    try:
+        __import__(module)
+        return True
+    except ImportError:
+        return False
+
+
+def _select_backend(requested: str) -> str:
+    """Pick the JSON backend: the requested one if installed, else the fastest installed."""
+    candidates = [requested] if requested else ["orjson", "msgspec"]
+    for name in candidates:
+        if name == "json" or _installed(name):
+            return name
+        if requested:
+            logger.warning("JSON backend '%s' is not installed; using json", name)
+    return "json"
+
+
+def _build_loads(backend: str) -> Callable[[bytes], Any]:
+    if backend == "orjson":
+        import orjson
+
+        return orjson.loads
+    if backend == "msgspec":
+        import msgspec
+
+        return msgspec.json.Decoder().decode
+    return json.loads
+
+
+def _build_typed_decoders() -> Dict[str, Callable[[bytes], Any]]:
+    """msgspec decoders for known page shapes, returning plain dicts."""
+    import msgspec
+
+    # omit_defaults drops absent optional keys again, so callers' .get() defaults still apply
+    class Author(msgspec.Struct, omit_defaults=True):
+        accountId: Optional[str] = None
+        displayName: Optional[str] = None
+
+    class ChangeItem(msgspec.Struct, omit_defaults=True):
+        field: Optional[str] = None
+        fromString: Optional[str] = None
+        toString: Optional[str] = None
+
+    class History(msgspec.Struct, omit_defaults=True):
+        created: str
+        author: Optional[Author] = None
+        items: List[ChangeItem] = []
+
+    class ChangelogPage(msgspec.Struct, omit_defaults=True):
+        values: List[History] = []
+        startAt: int = 0
+        total: Optional[int] = None
+        isLast: Optional[bool] = None
+
+    class Worklog(msgspec.Struct, omit_defaults=True):
+        started: str
+        timeSpentSeconds: int = 0
+        id: Optional[str] = None
+        author: Optional[Author] = None
+
+    class WorklogPage(msgspec.Struct, omit_defaults=True):
+        worklogs: List[Worklog] = []
+        startAt: int = 0
+        total: Optional[int] = None
+
+    # Search pages decode into TypedDicts: plain dicts straight away, with unknown keys
+    # (avatar and icon URLs, self links) skipped and explicit nulls kept
+    class User(TypedDict, total=False):
+        accountId: Optional[str]
+        displayName: Optional[str]
+        emailAddress: Optional[str]
+        active: bool
+
+    class StatusCategory(TypedDict, total=False):
+        id: int
+        key: str
+        name: str
+
+    class Status(TypedDict, total=False):
+        id: str
+        name: str
+        statusCategory: StatusCategory
+
+    class IssueType(TypedDict, total=False):
+        id: str
+        name: str
+        subtask: bool
+        hierarchyLevel: int
+
+    class Priority(TypedDict, total=False):
+        id: str
+        name: str
+
+    class SearchFields(TypedDict, total=False):
+        summary: Optional[str]
+        status: Optional[Status]
+        issuetype: Optional[IssueType]
+        priority: Optional[Priority]
+        assignee: Optional[User]
+        reporter: Optional[User]
+        creator: Optional[User]
+        created: Optional[str]
+        updated: Optional[str]
+        resolutiondate: Optional[str]
+        duedate: Optional[str]
+        labels: List[str]
+        # Kept whole: one small object per issue
+        parent: Optional[Dict[str, Any]]
+
+    class SearchIssue(TypedDict, total=False):
+        id: str
+        key: str
+        fields: SearchFields
+
+    class SearchPage(TypedDict, total=False):
+        issues: List[SearchIssue]
+        nextPageToken: Optional[str]
+        isLast: bool
+        startAt: int
+        maxResults: int
+        total: int
+
+    generic = msgspec.json.Decoder()
+
+    def typed(page_type: type) -> Callable[[bytes], Any]:
+        decoder = msgspec.json.Decoder(page_type)
+        to_builtins = issubclass(page_type, msgspec.Struct)
+
+        def decode_page(content: bytes) -> Any:
+            try:
+                page = decoder.decode(content)
+                return msgspec.to_builtins(page) if to_builtins else page
+            except msgspec.ValidationError as e:
+                # A value of an unexpected type: keep the whole page rather than fail
+                logger.debug("Typed decoding failed (%s); decoding generically", e)
+                return generic.decode(content)
+
+        return decode_page
+
+    return {
+        "changelog": typed(ChangelogPage),
+        "worklog": typed(WorklogPage),
+        "search": typed(SearchPage),
+    }
+
+
+_requested = os.getenv("JIRA_MCP_JSON_BACKEND", "").lower()
+BACKEND = _select_backend(_requested)
+TYPED = _requested in ("", "msgspec") and _installed("msgspec")
+_loads = _build_loads(BACKEND)
+_typed: Dict[str, Callable[[bytes], Any]] = _build_typed_decoders() if TYPED else {}
+
+
+def search_schema(fields: Iterable[str]) -> Optional[str]:
+    """The schema to decode a search page with, given the fields it requested."""
+    return "search" if _typed and SEARCH_FIELDS.issuperset(fields) else None
+
+
+def decode(content: bytes, schema: Optional[str] = None) -> Any:
+    """
+    Decode a JSON body from bytes.
+
+    Args:
+        content: Raw response body
+        schema: Known page shape (see SCHEMAS) to decode through a typed decoder
+            that skips unused fields, when msgspec is installed (optional)
+
+    Returns:
+        Decoded value as plain dicts, lists and scalars
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    typed = _typed.get(schema) if schema else None
+    if typed is not None:
+        return typed(content)
+    return _loads(content)
@@ -0,0 +1,259 @@
+"""Stream JQL search results to NDJSON, CSV or Parquet files.
+
+Issues are written page by page as the search is paged, so memory use stays
+constant regardless of the size of the result set. Field values are flattened
+to scalars: users, statuses and other objects become their display name,
+rich-text (ADF) fields become plain text, and lists are kept as lists
+(NDJSON) or joined with '; ' (CSV, Parquet).
+
+Parquet output requires pyarrow; each search page becomes one row group.
+
+Tools only write inside JIRA_MCP_EXPORT_DIR: destinations are resolved with
+resolve_in_directory, which rejects absolute, '..' and symlinked paths that
+lead out of it.
+"""
+
+import csv
+import json
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, List, Optional
+
+from jira_mcp.adf import extract_text_from_adf
+from jira_mcp.jira_client import JiraClient
+from jira_mcp.jobs import report_progress
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+# Fields exported when none are given
+DEFAULT_EXPORT_FIELDS = [
+    "summary", "status", "assignee", "priority", "issuetype", "created", "updated",
+]
+
+# Issues requested per search page (and rows per Parquet row group)
+EXPORT_PAGE_SIZE = 100
+
+# Keys tried, in order, to reduce a Jira object to a single display value
+_DISPLAY_KEYS = ("displayName", "name", "value", "key", "emailAddress", "id")
+
+
+def flatten_value(value: Any) -> Any:
+    """
+    Reduce a Jira field value to a scalar or a list of scalars.
+
+    Args:
+        value: Raw field value from the REST API
+
+    Returns:
+        None, a string, number or boolean, or a list of those
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, list):
+        return [flatten_value(item) for item in value]
+    if isinstance(value, dict):
+        if value.get("type") == "doc":
+            return extract_text_from_adf(value)
+        for key in _DISPLAY_KEYS:
+            if value.get(key) is not None:
+                return value[key]
+        return json.dumps(value, separators=(",", ":"), default=str)
+    return str(value)
+
+
+def _as_text(value: Any) -> Optional[str]:
+    """Render a flattened value as a single string (None stays None)."""
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return "; ".join("" if item is None else str(item) for item in value)
+    return str(value)
+
+
+def default_export_dir() -> str:
+    """Directory for exports given without an absolute path (JIRA_MCP_EXPORT_DIR or temp)."""
+    return os.getenv("JIRA_MCP_EXPORT_DIR") or os.path.join(
+        tempfile.gettempdir(), "jira-mcp-exports"
+    )
+
+
+def resolve_in_directory(path: str, directory: str) -> str:
+    """
+    Resolve a path given to a tool, requiring it to stay inside a directory.
+
+    Relative paths are taken from the directory. Symlinks are resolved first,
+    so a link pointing out of the directory is rejected like a '..' path.
+
+    Args:
+        path: Path as given (relative, absolute or starting with '~')
+        directory: Directory the path must resolve inside
+
+    Returns:
+        The resolved absolute path
+
+    Raises:
+        ValueError: If the path resolves outside the directory
+    """
+    root = os.path.realpath(directory)
+    resolved = os.path.realpath(os.path.join(root, os.path.expanduser(path)))
+    if os.path.commonpath([root, resolved]) != root:
+        raise ValueError(f"{path} is outside the allowed directory {root}")
+    return resolved
+
+
+class _RowWriter(ABC):
+    """Writes flattened rows to an open file; subclasses implement one format."""
+
+    def __init__(self, path: str, columns: List[str]):
+        self.path = path
+        self.columns = columns
+
+    @abstractmethod
+    def write_page(self, rows: List[List[Any]]) -> None:
+        """Append one page of rows."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and close the file."""
+
+
+class _NdjsonWriter(_RowWriter):
+    def __init__(self, path: str, columns: List[str]):
+        super().__init__(path, columns)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write_page(self, rows: List[List[Any]]) -> None:
+        self._file.writelines(
+            json.dumps(dict(zip(self.columns, row)), ensure_ascii=False, default=str) + "\n"
+            for row in rows
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _CsvWriter(_RowWriter):
+    def __init__(self, path: str, columns: List[str]):
+        super().__init__(path, columns)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write_page(self, rows: List[List[Any]]) -> None:
+        self._writer.writerows([_as_text(value) or "" for value in row] for row in rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter(_RowWriter):
+    def __init__(self, path: str, columns: List[str]):
+        super().__init__(path, columns)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ValueError("Parquet export requires pyarrow (pip install pyarrow)") from e
+
+        # Every column is a nullable string so row groups always share one schema
+        self._pa = pa
+        self._schema = pa.schema([(column, pa.string()) for column in columns])
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+
+    def write_page(self, rows: List[List[Any]]) -> None:
+        if not rows:
+            return
+        arrays = [
+            self._pa.array([_as_text(row[index]) for row in rows], type=self._pa.string())
+            for index in range(len(self.columns))
+        ]
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_WRITERS = {"ndjson": _NdjsonWriter, "csv": _CsvWriter, "parquet": _ParquetWriter}
+
+
+def _pages(rows: Iterable[List[Any]], size: int) -> Iterable[List[List[Any]]]:
+    page: List[List[Any]] = []
+    for row in rows:
+        page.append(row)
+        if len(page) >= size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def export_issues(
+    client: JiraClient,
+    jql: str,
+    path: str,
+    fields: Optional[List[str]] = None,
+    fmt: str = "ndjson",
+    max_rows: Optional[int] = None,
+    overwrite: bool = False,
+) -> int:
+    """
+    Stream the issues matching a JQL query to a file.
+
+    The file is written under a temporary name and moved into place once
+    complete, so a failed or cancelled export never leaves a partial file at
+    ``path``.
+
+    Args:
+        client: JiraClient instance
+        jql: JQL query selecting the issues to export
+        path: Destination file
+        fields: Fields to export after the issue key (default: DEFAULT_EXPORT_FIELDS)
+        fmt: One of 'ndjson', 'csv' or 'parquet'
+        max_rows: Stop after this many issues (optional)
+        overwrite: Replace an existing file at path (default: False)
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: On an unknown format, an existing file, or missing pyarrow for Parquet
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown export format '{fmt}' (expected one of {', '.join(FORMATS)})")
+    if os.path.exists(path) and not overwrite:
+        raise ValueError(f"{path} already exists (pass overwrite to replace it)")
+
+    fields = list(fields or DEFAULT_EXPORT_FIELDS)
+    columns = ["key"] + fields
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    partial_path = f"{path}.part"
+
+    def rows() -> Iterable[List[Any]]:
+        for issue in client.iter_issues(
+            jql, fields=fields, page_size=EXPORT_PAGE_SIZE, limit=max_rows
+        ):
+            issue_fields = issue.get("fields", {})
+            yield [issue.get("key")] + [flatten_value(issue_fields.get(f)) for f in fields]
+
+    logger.info("Exporting JQL to %s (%s): %s", path, fmt, jql)
+    writer = _WRITERS[fmt](partial_path, columns)
+    count = 0
+    try:
+        for page in _pages(rows(), EXPORT_PAGE_SIZE):
+            writer.write_page(page)
+            count += len(page)
+            report_progress(len(page))
+        writer.close()
+        os.replace(partial_path, path)
+    except BaseException:
+        writer.close()
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    logger.info("Exported %s row(s) to %s", count, path)
+    return count
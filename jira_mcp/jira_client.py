@@ -1,26 +1,206 @@
 """Jira REST API v3 client wrapper."""
 
+import contextvars
 import logging
-from typing import Any, Dict, List, Optional
+import random
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 import httpx
-from jira_mcp.config import JiraInstanceConfig
+from jira_mcp.decoding import decode, search_schema
+from jira_mcp.limiter import AdaptiveLimiter
+from jira_mcp.limiter import limiter as default_limiter
+from jira_mcp.logs import SAMPLED
+from jira_mcp.metrics import Metrics, endpoint_template, registry
+from jira_mcp.resilience import CircuitBreakers, CircuitOpenError, note_stale_read
+from jira_mcp.tracing import traced, tracer
+
+if TYPE_CHECKING:
+    from jira_mcp.config import JiraInstanceConfig
+    from jira_mcp.settings import InstanceConfig
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Default number of concurrent requests for fan-out operations
+DEFAULT_CONCURRENCY = 8
+
+# Times a request answered with 429/503 is retried, and the longest wait before a retry
+MAX_RETRIES = 3
+MAX_RETRY_DELAY = 30.0
+
+# Seconds that cached instance metadata (current user, project list) stays fresh
+METADATA_TTL = 300.0
+
+# Cached responses kept (metadata plus last good issue and user search responses)
+MAX_CACHE_ENTRIES = 500
+
+# Bytes read from disk or the network at a time when streaming attachments
+TRANSFER_CHUNK_SIZE = 1024 * 1024
+
+# Issues per page requested from the agile API, which returns at most 50 by default
+AGILE_PAGE_SIZE = 50
+
+
+def map_bounded(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_CONCURRENCY,
+) -> Iterator[Tuple[T, Optional[R], Optional[BaseException]]]:
+    """
+    Apply a function to items on a thread pool with bounded concurrency.
+
+    Items are pulled from the iterable only when a worker slot frees up, so a
+    streaming source (e.g., paginated search results) is never read further
+    ahead than the pool can process. Results are yielded in completion order.
+    Each call runs in a copy of the caller's context, so tracing spans started
+    by workers are parented to the caller's span.
+
+    Args:
+        func: Function to call for each item (typically issues HTTP requests)
+        items: Iterable of items, consumed lazily
+        max_workers: Maximum number of calls in flight at once
+
+    Yields:
+        Tuples of (item, result, error); error is None on success
+    """
+    iterator = iter(items)
+    pending: Dict[Future, T] = {}
+    exhausted = False
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        while True:
+            while not exhausted and len(pending) < max(1, max_workers):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                context = contextvars.copy_context()
+                pending[pool.submit(context.run, func, item)] = item
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                error = future.exception()
+                yield item, (None if error else future.result()), error
+
+
+class JiraAPIError(Exception):
+    """Error response from the Jira REST API."""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def is_unavailable(error: BaseException) -> bool:
+    """Whether an error means Jira is unreachable or overloaded, rather than a bad request."""
+    if isinstance(error, (httpx.HTTPError, CircuitOpenError)):
+        return True
+    return isinstance(error, JiraAPIError) and (
+        error.status_code >= 500 or error.status_code == 429
+    )
+
+
+def _format_age(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+def _should_retry(response: httpx.Response) -> bool:
+    """Whether a response is a rate-limit answer worth retrying."""
+    if response.status_code == 429:
+        return True
+    # A 503 without Retry-After is an outage; leave it to the circuit breaker
+    return response.status_code == 503 and "Retry-After" in response.headers
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying an overloaded request."""
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_DELAY)
+    # Exponential backoff with jitter, so retries of one burst do not arrive together
+    return min(MAX_RETRY_DELAY, 0.5 * 2**attempt * (1 + random.random()))
+
 
 class JiraClient:
     """Simple, reliable Jira REST API v3 client."""
 
-    def __init__(self, config: JiraInstanceConfig):
+    def __init__(
+        self,
+        config: Union["JiraInstanceConfig", "InstanceConfig"],
+        metrics: Optional[Metrics] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+    ):
         """
         Initialize Jira client.
 
         Args:
-            config: JiraInstanceConfig with URL, email, and API token
+            config: JiraInstanceConfig or InstanceConfig with URL, credentials and tuning
+            metrics: Metrics registry to record requests in (default: process-wide registry)
+            transport: Custom httpx transport, e.g. a MockTransport for offline use (optional)
+            limiter: Concurrency limiter gating every request (default: the process-wide
+                limiter, configured from the config's tuning settings)
         """
         self.config = config
+        self.metrics = metrics or registry
         self.base_url = str(config.url).rstrip("/")
         self.api_base = f"{self.base_url}/rest/api/3"
+        self.agile_base = f"{self.base_url}/rest/agile/1.0"
+
+        if limiter is None:
+            limiter = default_limiter
+            limiter.configure(
+                initial=config.concurrency,
+                maximum=max(config.concurrency, config.max_concurrency),
+                enabled=config.adaptive_concurrency,
+            )
+        self.limiter = limiter
+        # Fan-outs may use as many workers as the limiter may allow; it gates the requests
+        self.concurrency = limiter.maximum if limiter.enabled else config.concurrency
+
+        # Response cache: (name, *key) -> (fetched at, value), least recently used first
+        self._cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._refreshing: Dict[Tuple[Any, ...], Future] = {}
+        self._refresher: Optional[ThreadPoolExecutor] = None
+
+        # Fail fast on endpoints that keep failing; answer reads from cache meanwhile
+        self.breakers = CircuitBreakers(config.breaker_threshold, config.breaker_reset)
+        self.stale_while_revalidate = config.stale_while_revalidate
+        self.stale_timeout = config.stale_timeout
+
+        # Attachment transfers run outside the limiter, at most max_transfers at once
+        self._transfers = threading.BoundedSemaphore(config.max_transfers)
 
         # Setup authentication
         self.auth = (config.email, config.api_token)
@@ -28,14 +208,18 @@ class JiraClient:
         # Create httpx client with reasonable defaults
         self.client = httpx.Client(
             auth=self.auth,
-            timeout=30.0,
+            timeout=config.timeout,
+            limits=httpx.Limits(max_connections=config.max_connections),
+            transport=transport,
             headers={
                 "Accept": "application/json",
                 "Content-Type": "application/json",
             },
         )
 
-        logger.info(f"Initialized Jira client for {self.config.instance_name} at {self.base_url}")
+        logger.info(
+            "Initialized Jira client for %s at %s", self.config.instance_name, self.base_url
+        )
 
     def __enter__(self):
         """Context manager entry."""
@@ -47,14 +231,307 @@ class JiraClient:
 
     def close(self):
         """Close the HTTP client."""
+        if self._refresher is not None:
+            self._refresher.shutdown(wait=False)
         self.client.close()
 
-    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
+    def _request(
+        self, method: str, path: str, agile: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a request to the REST API, recording latency, status and size.
+
+        Every request holds a slot of the concurrency limiter while in flight.
+        Requests answered with 429 (or 503 with a Retry-After header, Jira's other
+        rate-limit answer) are retried up to MAX_RETRIES times, after the server's
+        Retry-After delay or an exponential backoff. Each attempt counts towards
+        the endpoint's circuit breaker; once it opens, requests to the endpoint
+        fail without being sent until a probe succeeds.
+
+        Args:
+            method: HTTP method (e.g., 'GET')
+            path: Path relative to the API base (e.g., '/issue/PROJ-123')
+            agile: Send to the agile API (/rest/agile/1.0) instead of REST API v3;
+                its endpoints are reported under '/agile' (default: False)
+            **kwargs: Passed through to httpx (params, json, ...)
+
+        Returns:
+            httpx Response object
+
+        Raises:
+            httpx.HTTPError: On transport failures (timeouts, connection errors)
+            CircuitOpenError: If the endpoint's circuit breaker is open
+        """
+        endpoint = endpoint_template(path)
+        url = f"{self.api_base}{path}"
+        if agile:
+            endpoint = f"/agile{endpoint}"
+            url = f"{self.agile_base}{path}"
+        for attempt in range(MAX_RETRIES + 1):
+            self.breakers.check(endpoint)
+            ok = False
+            try:
+                response = self._send(method, endpoint, url, **kwargs)
+                ok = response.status_code < 500
+            finally:
+                self.breakers.record(endpoint, ok)
+
+            if not _should_retry(response) or attempt == MAX_RETRIES:
+                return response
+            delay = _retry_delay(response, attempt)
+            self.metrics.record_retry(endpoint)
+            logger.warning(
+                "%s %s answered %s; retrying in %.1fs (%s/%s)",
+                method,
+                endpoint,
+                response.status_code,
+                delay,
+                attempt + 1,
+                MAX_RETRIES,
+            )
+            time.sleep(delay)
+        return response
+
+    def _send(self, method: str, endpoint: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send one attempt of a request, holding a limiter slot and recording it."""
+        with tracer.span(
+            f"HTTP {method} {endpoint}", {"http.method": method, "http.route": endpoint}
+        ) as span:
+            self.limiter.acquire()
+            started = time.perf_counter()
+            status: Optional[int] = None
+            try:
+                response = self.client.request(method, url, **kwargs)
+                status = response.status_code
+            except httpx.HTTPError:
+                self.metrics.record_request(method, endpoint, None, time.perf_counter() - started)
+                raise
+            finally:
+                # Any exception, not only transport errors, must give the slot back
+                elapsed = time.perf_counter() - started
+                self.limiter.release(f"{method} {endpoint}", elapsed, status)
+
+            sent = len(response.request.content)
+            received = len(response.content)
+            self.metrics.record_request(
+                method,
+                endpoint,
+                response.status_code,
+                elapsed,
+                sent=sent,
+                received=received,
+            )
+            span.set_attribute("http.status_code", response.status_code)
+            span.set_attribute("http.request.body.size", sent)
+            span.set_attribute("http.response.body.size", received)
+            return response
+
+    @contextmanager
+    def _stream(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Callable[[], Iterable[bytes]]] = None,
+        **kwargs: Any,
+    ) -> Iterator[httpx.Response]:
+        """
+        Send a request whose body or response is streamed (attachment transfers).
+
+        Transfers hold a slot of their own (max_transfers per client) instead of
+        one of the concurrency limiter's, whose latency baselines a minutes-long
+        download would distort. Bodies pass through chunk by chunk, so memory use
+        does not grow with the file size. Rate-limited attempts are retried and
+        counted towards the circuit breaker as in _request.
+
+        Args:
+            method: HTTP method (e.g., 'POST')
+            path: Path relative to the API base (e.g., '/attachment/content/10001')
+            body: Function returning the request body as an iterable of chunks;
+                called once per attempt, so a retry starts from the beginning (optional)
+            **kwargs: Passed through to httpx (headers, follow_redirects, ...)
+
+        Yields:
+            The response, with its body not yet read
+
+        Raises:
+            JiraAPIError: If Jira answers with an error status
+            httpx.HTTPError: On transport failures, including while the body streams
+            CircuitOpenError: If the endpoint's circuit breaker is open
+        """
+        endpoint = endpoint_template(path)
+        with self._transfers:
+            for attempt in range(MAX_RETRIES + 1):
+                self.breakers.check(endpoint)
+                sent = 0
+                if body is not None:
+
+                    def counted(chunks: Iterable[bytes] = body()) -> Iterator[bytes]:
+                        nonlocal sent
+                        for chunk in chunks:
+                            sent += len(chunk)
+                            yield chunk
+
+                    kwargs["content"] = counted()
+
+                response: Optional[httpx.Response] = None
+                ok = False
+                retry = False
+                with tracer.span(
+                    f"HTTP {method} {endpoint}", {"http.method": method, "http.route": endpoint}
+                ) as span:
+                    started = time.perf_counter()
+                    try:
+                        with self.client.stream(
+                            method, f"{self.api_base}{path}", **kwargs
+                        ) as response:
+                            ok = response.status_code < 500
+                            retry = _should_retry(response) and attempt < MAX_RETRIES
+                            if not retry:
+                                if response.is_error:
+                                    response.read()
+                                    self._handle_response(response)
+                                yield response
+                    except httpx.HTTPError:
+                        ok = False
+                        raise
+                    finally:
+                        elapsed = time.perf_counter() - started
+                        status = response.status_code if response is not None else None
+                        received = response.num_bytes_downloaded if response is not None else 0
+                        self.breakers.record(endpoint, ok)
+                        self.metrics.record_request(
+                            method, endpoint, status, elapsed, sent=sent, received=received
+                        )
+                        if status is not None:
+                            span.set_attribute("http.status_code", status)
+                        span.set_attribute("http.request.body.size", sent)
+                        span.set_attribute("http.response.body.size", received)
+
+                if not retry:
+                    return
+                delay = _retry_delay(response, attempt)
+                self.metrics.record_retry(endpoint)
+                logger.warning(
+                    "%s %s answered %s; retrying in %.1fs (%s/%s)",
+                    method,
+                    endpoint,
+                    response.status_code,
+                    delay,
+                    attempt + 1,
+                    MAX_RETRIES,
+                )
+                time.sleep(delay)
+
+    def _cached(
+        self,
+        name: str,
+        load: Callable[[], R],
+        refresh: bool = False,
+        key: Tuple[Any, ...] = (),
+        ttl: float = METADATA_TTL,
+        allow_stale: bool = True,
+    ) -> R:
+        """
+        Return a cached response, loading it if missing, stale or refreshed.
+
+        With stale-while-revalidate on, an expired entry is revalidated in the
+        background. If the fresh value is not back within stale_timeout seconds,
+        or Jira is unavailable, the last good value is returned and the stale read
+        is noted for the tool reply (see jira_mcp.resilience).
+
+        Args:
+            name: Cache entry name, also used as the metrics cache label
+            load: Function fetching the value from Jira
+            refresh: Bypass the cached value and never answer stale (default: False)
+            key: Arguments distinguishing entries of the same name (optional)
+            ttl: Seconds an entry is served without asking Jira (0: always revalidate)
+            allow_stale: Whether the last good value may answer for a slow or failed load
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        cache_key = (name, *key)
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+        age = time.monotonic() - entry[0] if entry is not None else 0.0
+        if not refresh and entry is not None and age < ttl:
+            self.metrics.record_cache(name, True)
+            return entry[1]
+
+        if refresh or entry is None or not (self.stale_while_revalidate and allow_stale):
+            self.metrics.record_cache(name, False)
+            return self._load_into(cache_key, load)
+
+        future = self._revalidate(cache_key, load)
+        try:
+            value = future.result(timeout=self.stale_timeout)
+            self.metrics.record_cache(name, False)
+            return value
+        except FutureTimeout:
+            reason = f"no response within {self.stale_timeout:g}s; refreshing in the background"
+        except Exception as e:
+            if not is_unavailable(e):
+                raise
+            reason = str(e)
+
+        self.metrics.record_cache(name, True)
+        label = " ".join(str(part) for part in (name, *key[:1]))
+        note_stale_read(f"{label}, {_format_age(age)} old ({reason})")
+        logger.warning("Answering %s from cache (%s old): %s", label, _format_age(age), reason)
+        return entry[1]
+
+    def _load_into(self, cache_key: Tuple[Any, ...], load: Callable[[], R]) -> R:
+        """Load a value and store it as the entry's last good value."""
+        value = load()
+        with self._cache_lock:
+            self._cache.pop(cache_key, None)
+            self._cache[cache_key] = (time.monotonic(), value)
+            while len(self._cache) > MAX_CACHE_ENTRIES:
+                self._cache.popitem(last=False)
+        return value
+
+    def _revalidate(self, cache_key: Tuple[Any, ...], load: Callable[[], R]) -> "Future[R]":
+        """Start (or join) the background load of a cache entry."""
+        with self._cache_lock:
+            future = self._refreshing.get(cache_key)
+            if future is not None:
+                return future
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="jira-revalidate"
+                )
+
+            def run() -> R:
+                try:
+                    return self._load_into(cache_key, load)
+                finally:
+                    with self._cache_lock:
+                        self._refreshing.pop(cache_key, None)
+
+            context = contextvars.copy_context()
+            future = self._refresher.submit(context.run, run)
+            self._refreshing[cache_key] = future
+            return future
+
+    def evict_issue(self, issue_key: str) -> None:
+        """Drop cached responses for an issue and its comments (after it was changed)."""
+        with self._cache_lock:
+            for cache_key in [
+                k for k in self._cache if k[0] in ("issue", "comments") and k[1] == issue_key
+            ]:
+                del self._cache[cache_key]
+
+    def _handle_response(
+        self, response: httpx.Response, schema: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Handle HTTP response and errors.
 
+        The body is decoded once, straight from bytes (see jira_mcp.decoding).
+
         Args:
             response: httpx Response object
+            schema: Known page shape to decode with a typed decoder (optional)
 
         Returns:
             Parsed JSON response
@@ -64,20 +541,25 @@ class JiraClient:
         """
         try:
             response.raise_for_status()
-            return response.json() if response.text else {}
+            content = response.content
+            return decode(content, schema) if content else {}
         except httpx.HTTPStatusError as e:
             error_detail = ""
             try:
-                error_json = e.response.json()
+                error_json = decode(e.response.content)
                 error_detail = error_json.get("errorMessages", [])
                 if not error_detail:
                     error_detail = error_json.get("errors", {})
             except Exception:
                 error_detail = e.response.text
 
-            logger.error(f"Jira API error: {e.response.status_code} - {error_detail}")
-            raise Exception(f"Jira API error ({e.response.status_code}): {error_detail}")
+            logger.error("Jira API error: %s - %s", e.response.status_code, error_detail)
+            raise JiraAPIError(
+                f"Jira API error ({e.response.status_code}): {error_detail}",
+                e.response.status_code,
+            )
 
+    @traced("jira.test_connection")
     def test_connection(self) -> Dict[str, Any]:
         """
         Test connection to Jira instance.
@@ -88,18 +570,74 @@ class JiraClient:
         Raises:
             Exception: On connection failure
         """
-        logger.info(f"Testing connection to {self.config.instance_name}")
-        response = self.client.get(f"{self.api_base}/myself")
-        user_info = self._handle_response(response)
-        logger.info(f"Connected successfully as {user_info.get('emailAddress')}")
+        logger.info("Testing connection to %s", self.config.instance_name)
+        user_info = self.current_user(refresh=True)
+        logger.info("Connected successfully as %s", user_info.get("emailAddress"))
         return user_info
 
+    @traced("jira.current_user")
+    def current_user(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get the authenticated user, cached for METADATA_TTL seconds.
+
+        Args:
+            refresh: Fetch from Jira even if a cached value is fresh (default: False)
+
+        Returns:
+            User dictionary (accountId, displayName, emailAddress, ...)
+
+        Raises:
+            Exception: On API errors
+        """
+        return self._cached(
+            "myself", lambda: self._handle_response(self._request("GET", "/myself")), refresh
+        )
+
+    @traced("jira.warm_up", attributes=("connections",))
+    def warm_up(self, connections: int = 2) -> None:
+        """
+        Pre-establish pooled connections and prefetch instance metadata.
+
+        Fetches the current user and the project list concurrently, plus extra
+        lightweight requests until ``connections`` connections have been opened,
+        so the first real tool call finds a hot connection and a warm cache.
+
+        Args:
+            connections: Number of connections to open concurrently (default: 2)
+
+        Raises:
+            Exception: If verifying the credentials against /myself fails
+        """
+        started = time.perf_counter()
+        tasks: List[Callable[[], Any]] = [
+            lambda: self.current_user(refresh=True),
+            lambda: self.list_projects(refresh=True),
+        ]
+        while len(tasks) < connections:
+            tasks.append(lambda: self._request("GET", "/serverInfo"))
+
+        for task, _, error in map_bounded(lambda task: task(), tasks, max_workers=len(tasks)):
+            if error is not None:
+                # Failing to authenticate is worth surfacing; other prefetches are best effort
+                if task is tasks[0]:
+                    raise error
+                logger.warning("Warm-up request failed: %s", error)
+
+        logger.info(
+            "Warmed up %s: %s connection(s) in %.0f ms",
+            self.config.instance_name,
+            len(tasks),
+            (time.perf_counter() - started) * 1000,
+        )
+
+    @traced("jira.search_issues", attributes=("jql", "max_results"))
     def search_issues(
         self,
         jql: str,
         start_at: int = 0,
         max_results: int = 50,
         fields: Optional[List[str]] = None,
+        next_page_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Search for issues using JQL.
@@ -109,15 +647,19 @@ class JiraClient:
             start_at: Starting index for pagination (default: 0)
             max_results: Maximum number of results to return (default: 50)
             fields: List of fields to return (default: key, summary, status, assignee, priority)
+            next_page_token: Token from a previous page to continue from (optional)
 
         Returns:
-            Dictionary with search results including issues, total, startAt, maxResults
+            Dictionary with search results including issues, nextPageToken, isLast
 
         Raises:
             Exception: On API errors
         """
         if fields is None:
-            fields = ["key", "summary", "status", "assignee", "priority", "issuetype", "created", "updated"]
+            fields = [
+                "key", "summary", "status", "assignee", "priority", "issuetype", "created",
+                "updated",
+            ]
 
         # New /search/jql endpoint expects GET with query params
         params = {
@@ -126,18 +668,181 @@ class JiraClient:
             "maxResults": max_results,
             "fields": ",".join(fields),
         }
+        if next_page_token:
+            params["nextPageToken"] = next_page_token
 
-        logger.info(f"Searching issues with JQL: {jql}")
-        response = self.client.get(f"{self.api_base}/search/jql", params=params)
-        return self._handle_response(response)
+        logger.info("Searching issues with JQL: %s", jql, extra=SAMPLED)
+        response = self._request("GET", "/search/jql", params=params)
+        return self._handle_response(response, schema=search_schema(fields))
+
+    def iter_issues(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all issues matching a JQL query, following nextPageToken pagination.
+
+        Pages are fetched lazily, so only one page is held in memory at a time.
+
+        Args:
+            jql: JQL query string
+            fields: List of fields to return (default: same as search_issues)
+            page_size: Number of issues to request per page (default: 100)
+            limit: Stop after yielding this many issues (optional)
+
+        Yields:
+            Issue dictionaries
+
+        Raises:
+            Exception: On API errors
+        """
+        token: Optional[str] = None
+        yielded = 0
+        page_number = 0
+
+        while True:
+            page_number += 1
+            with tracer.span("jira.search_page", {"jql": jql, "page": page_number}):
+                page = self.search_issues(
+                    jql=jql, max_results=page_size, fields=fields, next_page_token=token
+                )
+            for issue in page.get("issues", []):
+                yield issue
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+            token = page.get("nextPageToken")
+            if not token or page.get("isLast", False):
+                return
+
+    def iter_changelog(self, issue_key: str, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the change history of an issue, oldest first.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+            page_size: Number of history entries to request per page (default: 100)
+
+        Yields:
+            Changelog history dictionaries with created, author and items
+
+        Raises:
+            Exception: On API errors
+        """
+        start_at = 0
+
+        while True:
+            params = {"startAt": start_at, "maxResults": page_size}
+            logger.debug("Getting changelog for %s from %s", issue_key, start_at, extra=SAMPLED)
+            with tracer.span(
+                "jira.changelog_page", {"issue_key": issue_key, "start_at": start_at}
+            ):
+                response = self._request("GET", f"/issue/{issue_key}/changelog", params=params)
+                page = self._handle_response(response, schema="changelog")
+            values = page.get("values", [])
+            yield from values
+
+            start_at += len(values)
+            if not values or page.get("isLast", start_at >= page.get("total", start_at)):
+                return
+
+    @traced("jira.add_worklog", attributes=("issue_key", "time_spent"))
+    def add_worklog(
+        self,
+        issue_key: str,
+        time_spent: str,
+        started: Optional[str] = None,
+        comment: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Log work on an issue.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+            time_spent: Duration in Jira notation (e.g., '1h 30m', '2d')
+            started: Start time in Jira format, e.g. '2024-01-15T09:00:00.000+0000'
+                (optional, defaults to now)
+            comment: Worklog comment (optional)
+
+        Returns:
+            Dictionary with the created worklog (id, timeSpentSeconds, started, ...)
 
-    def get_issue(self, issue_key: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        Raises:
+            Exception: On API errors
+        """
+        payload: Dict[str, Any] = {"timeSpent": time_spent}
+        if started:
+            payload["started"] = started
+        if comment:
+            payload["comment"] = {
+                "type": "doc",
+                "version": 1,
+                "content": [{"type": "paragraph", "content": [{"type": "text", "text": comment}]}],
+            }
+
+        logger.info("Logging %s on %s", time_spent, issue_key)
+        response = self._request("POST", f"/issue/{issue_key}/worklog", json=payload)
+        result = self._handle_response(response)
+        self.evict_issue(issue_key)
+        return result
+
+    def iter_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None,
+        page_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the worklogs of an issue, oldest first.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+            started_after: Only worklogs started at or after this time, in epoch ms (optional)
+            started_before: Only worklogs started before this time, in epoch ms (optional)
+            page_size: Number of worklogs to request per page (default: 1000)
+
+        Yields:
+            Worklog dictionaries with author, started and timeSpentSeconds
+
+        Raises:
+            Exception: On API errors
+        """
+        start_at = 0
+
+        while True:
+            params: Dict[str, Any] = {"startAt": start_at, "maxResults": page_size}
+            if started_after is not None:
+                params["startedAfter"] = started_after
+            if started_before is not None:
+                params["startedBefore"] = started_before
+            logger.debug("Getting worklogs for %s from %s", issue_key, start_at, extra=SAMPLED)
+            with tracer.span("jira.worklog_page", {"issue_key": issue_key, "start_at": start_at}):
+                response = self._request("GET", f"/issue/{issue_key}/worklog", params=params)
+                page = self._handle_response(response, schema="worklog")
+            worklogs = page.get("worklogs", [])
+            yield from worklogs
+
+            start_at += len(worklogs)
+            if not worklogs or start_at >= page.get("total", start_at):
+                return
+
+    @traced("jira.get_issue", attributes=("issue_key",))
+    def get_issue(
+        self, issue_key: str, fields: Optional[List[str]] = None, allow_stale: bool = False
+    ) -> Dict[str, Any]:
         """
         Get detailed information about a specific issue.
 
         Args:
             issue_key: Issue key (e.g., 'PROJ-123')
             fields: List of fields to return (default: all)
+            allow_stale: Answer from the last good response if Jira is slow or
+                unavailable (see _cached; default: False)
 
         Returns:
             Dictionary with issue details
@@ -149,10 +854,105 @@ class JiraClient:
         if fields:
             params["fields"] = ",".join(fields)
 
-        logger.info(f"Getting issue {issue_key}")
-        response = self.client.get(f"{self.api_base}/issue/{issue_key}", params=params)
-        return self._handle_response(response)
+        def load() -> Dict[str, Any]:
+            logger.info("Getting issue %s", issue_key, extra=SAMPLED)
+            response = self._request("GET", f"/issue/{issue_key}", params=params)
+            return self._handle_response(response)
+
+        if not allow_stale:
+            return load()
+        return self._cached("issue", load, key=(issue_key, tuple(fields or ())), ttl=0)
+
+    @traced("jira.get_comments", attributes=("issue_key", "start_at", "max_results"))
+    def get_comments(
+        self,
+        issue_key: str,
+        start_at: int = 0,
+        max_results: int = 50,
+        newest_first: bool = True,
+        allow_stale: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Get one page of an issue's comments.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+            start_at: Index of the first comment to return, in the chosen order (default: 0)
+            max_results: Maximum number of comments to return (default: 50)
+            newest_first: Order by creation date descending (default: True)
+            allow_stale: Answer from the last good response if Jira is slow or
+                unavailable (see _cached; default: False)
+
+        Returns:
+            Dictionary with comments, startAt, maxResults and total
+
+        Raises:
+            Exception: On API errors
+        """
+        params = {
+            "startAt": start_at,
+            "maxResults": max_results,
+            "orderBy": "-created" if newest_first else "created",
+        }
+
+        def load() -> Dict[str, Any]:
+            logger.info("Getting comments for %s from %s", issue_key, start_at, extra=SAMPLED)
+            response = self._request("GET", f"/issue/{issue_key}/comment", params=params)
+            return self._handle_response(response)
+
+        if not allow_stale:
+            return load()
+        return self._cached(
+            "comments", load, key=(issue_key, start_at, max_results, newest_first), ttl=0
+        )
+
+    @traced("jira.get_issue_with_comments", attributes=("issue_key", "comments_start"))
+    def get_issue_with_comments(
+        self,
+        issue_key: str,
+        comments_start: int = 0,
+        comments_max: int = 5,
+        allow_stale: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Get an issue with a page of its newest comments instead of all of them.
+
+        The issue is requested without its embedded comment list, which holds
+        every comment of the issue, while the page of comments is fetched from
+        the comment endpoint concurrently.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+            comments_start: Number of newer comments to skip (default: 0)
+            comments_max: Maximum number of comments to include (default: 5)
+            allow_stale: Answer from the last good responses if Jira is slow or
+                unavailable (see _cached; default: False)
 
+        Returns:
+            Issue dictionary whose ``comment`` field holds the page (oldest first),
+            with startAt counted from the newest comment and the issue's total
+
+        Raises:
+            Exception: On API errors
+        """
+        loads: List[Callable[[], Dict[str, Any]]] = [
+            lambda: self.get_issue(issue_key, fields=["*all", "-comment"], allow_stale=allow_stale),
+            lambda: self.get_comments(
+                issue_key, comments_start, comments_max, allow_stale=allow_stale
+            ),
+        ]
+        results: Dict[int, Dict[str, Any]] = {}
+        for load, result, error in map_bounded(lambda load: load(), loads, max_workers=2):
+            if error is not None:
+                raise error
+            results[loads.index(load)] = result or {}
+
+        issue, page = results[0], results[1]
+        # Copies, so responses held in the cache are not modified
+        page = {**page, "comments": list(reversed(page.get("comments") or []))}
+        return {**issue, "fields": {**(issue.get("fields") or {}), "comment": page}}
+
+    @traced("jira.create_issue", attributes=("project_key", "issue_type"))
     def create_issue(
         self,
         project_key: str,
@@ -225,10 +1025,11 @@ class JiraClient:
 
         payload = {"fields": fields}
 
-        logger.info(f"Creating issue in project {project_key}: {summary}")
-        response = self.client.post(f"{self.api_base}/issue", json=payload)
+        logger.info("Creating issue in project %s: %s", project_key, summary)
+        response = self._request("POST", "/issue", json=payload)
         return self._handle_response(response)
 
+    @traced("jira.update_issue", attributes=("issue_key",))
     def update_issue(self, issue_key: str, fields: Dict[str, Any]) -> None:
         """
         Update an existing issue.
@@ -242,10 +1043,12 @@ class JiraClient:
         """
         payload = {"fields": fields}
 
-        logger.info(f"Updating issue {issue_key}")
-        response = self.client.put(f"{self.api_base}/issue/{issue_key}", json=payload)
+        logger.info("Updating issue %s", issue_key)
+        response = self._request("PUT", f"/issue/{issue_key}", json=payload)
         self._handle_response(response)
+        self.evict_issue(issue_key)
 
+    @traced("jira.add_comment", attributes=("issue_key",))
     def add_comment(self, issue_key: str, comment: str) -> Dict[str, Any]:
         """
         Add a comment to an issue.
@@ -274,10 +1077,13 @@ class JiraClient:
             }
         }
 
-        logger.info(f"Adding comment to issue {issue_key}")
-        response = self.client.post(f"{self.api_base}/issue/{issue_key}/comment", json=payload)
-        return self._handle_response(response)
+        logger.info("Adding comment to issue %s", issue_key)
+        response = self._request("POST", f"/issue/{issue_key}/comment", json=payload)
+        result = self._handle_response(response)
+        self.evict_issue(issue_key)
+        return result
 
+    @traced("jira.transition_issue", attributes=("issue_key", "transition_name"))
     def transition_issue(self, issue_key: str, transition_name: str) -> None:
         """
         Transition an issue to a new status.
@@ -290,8 +1096,8 @@ class JiraClient:
             Exception: On API errors or if transition is not found
         """
         # First, get available transitions
-        logger.info(f"Getting available transitions for {issue_key}")
-        response = self.client.get(f"{self.api_base}/issue/{issue_key}/transitions")
+        logger.info("Getting available transitions for %s", issue_key)
+        response = self._request("GET", f"/issue/{issue_key}/transitions")
         transitions_data = self._handle_response(response)
 
         # Find the transition ID by name
@@ -311,13 +1117,18 @@ class JiraClient:
         # Perform the transition
         payload = {"transition": {"id": transition_id}}
 
-        logger.info(f"Transitioning {issue_key} to {transition_name}")
-        response = self.client.post(f"{self.api_base}/issue/{issue_key}/transitions", json=payload)
+        logger.info("Transitioning %s to %s", issue_key, transition_name)
+        response = self._request("POST", f"/issue/{issue_key}/transitions", json=payload)
         self._handle_response(response)
+        self.evict_issue(issue_key)
 
-    def list_projects(self) -> List[Dict[str, Any]]:
+    @traced("jira.list_projects")
+    def list_projects(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
-        List all projects accessible to the user.
+        List all projects accessible to the user, cached for METADATA_TTL seconds.
+
+        Args:
+            refresh: Fetch from Jira even if a cached list is fresh (default: False)
 
         Returns:
             List of project dictionaries with key, name, and other details
@@ -325,10 +1136,16 @@ class JiraClient:
         Raises:
             Exception: On API errors
         """
-        logger.info("Listing all projects")
-        response = self.client.get(f"{self.api_base}/project")
-        return self._handle_response(response)
 
+        def load() -> List[Dict[str, Any]]:
+            logger.info("Listing all projects")
+            response = self._request("GET", "/project")
+            # /project answers with a JSON array
+            return cast(List[Dict[str, Any]], self._handle_response(response))
+
+        return self._cached("projects", load, refresh)
+
+    @traced("jira.link_issues", attributes=("inward_issue", "outward_issue", "link_type"))
     def link_issues(
         self,
         inward_issue: str,
@@ -355,10 +1172,14 @@ class JiraClient:
             "outwardIssue": {"key": outward_issue},
         }
 
-        logger.info(f"Linking {inward_issue} to {outward_issue} with type {link_type}")
-        response = self.client.post(f"{self.api_base}/issueLink", json=payload)
-        return self._handle_response(response)
+        logger.info("Linking %s to %s with type %s", inward_issue, outward_issue, link_type)
+        response = self._request("POST", "/issueLink", json=payload)
+        result = self._handle_response(response)
+        self.evict_issue(inward_issue)
+        self.evict_issue(outward_issue)
+        return result
 
+    @traced("jira.get_issue_links", attributes=("issue_key",))
     def get_issue_links(self, issue_key: str) -> List[Dict[str, Any]]:
         """
         Get all links for an issue.
@@ -372,10 +1193,11 @@ class JiraClient:
         Raises:
             Exception: On API errors
         """
-        logger.info(f"Getting links for issue {issue_key}")
+        logger.info("Getting links for issue %s", issue_key)
         issue = self.get_issue(issue_key, fields=["issuelinks"])
         return issue.get("fields", {}).get("issuelinks", [])
 
+    @traced("jira.get_epic_issues", attributes=("epic_key",))
     def get_epic_issues(self, epic_key: str, max_results: int = 100) -> List[Dict[str, Any]]:
         """
         Get all issues that belong to an epic.
@@ -391,10 +1213,11 @@ class JiraClient:
             Exception: On API errors
         """
         jql = f'parent = {epic_key}'
-        logger.info(f"Getting issues for epic {epic_key}")
+        logger.info("Getting issues for epic %s", epic_key)
         result = self.search_issues(jql=jql, max_results=max_results)
         return result.get("issues", [])
 
+    @traced("jira.get_available_transitions", attributes=("issue_key",))
     def get_available_transitions(self, issue_key: str) -> List[Dict[str, Any]]:
         """
         Get all available transitions for an issue.
@@ -408,18 +1231,23 @@ class JiraClient:
         Raises:
             Exception: On API errors
         """
-        logger.info(f"Getting available transitions for {issue_key}")
-        response = self.client.get(f"{self.api_base}/issue/{issue_key}/transitions")
+        logger.info("Getting available transitions for %s", issue_key)
+        response = self._request("GET", f"/issue/{issue_key}/transitions")
         transitions_data = self._handle_response(response)
         return transitions_data.get("transitions", [])
 
-    def search_users(self, query: str, max_results: int = 50) -> List[Dict[str, Any]]:
+    @traced("jira.search_users", attributes=("max_results",))
+    def search_users(
+        self, query: str, max_results: int = 50, allow_stale: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Search for users by name or email.
 
         Args:
             query: Search query (name or email)
             max_results: Maximum number of results to return (default: 50)
+            allow_stale: Answer from the last good response if Jira is slow or
+                unavailable (see _cached; default: False)
 
         Returns:
             List of user dictionaries with accountId, displayName, emailAddress
@@ -432,10 +1260,17 @@ class JiraClient:
             "maxResults": max_results,
         }
 
-        logger.info(f"Searching for users matching: {query}")
-        response = self.client.get(f"{self.api_base}/user/search", params=params)
-        return self._handle_response(response)
+        def load() -> List[Dict[str, Any]]:
+            logger.info("Searching for users matching: %s", query)
+            response = self._request("GET", "/user/search", params=params)
+            # /user/search answers with a JSON array
+            return cast(List[Dict[str, Any]], self._handle_response(response))
 
+        if not allow_stale:
+            return load()
+        return self._cached("users", load, key=(query, max_results), ttl=0)
+
+    @traced("jira.assign_issue", attributes=("issue_key",))
     def assign_issue(self, issue_key: str, account_id: Optional[str] = None) -> None:
         """
         Assign an issue to a user, or unassign if account_id is None.
@@ -449,9 +1284,345 @@ class JiraClient:
         """
         payload = {"accountId": account_id} if account_id else None
 
-        logger.info(f"Assigning issue {issue_key} to {account_id or 'unassigned'}")
-        response = self.client.put(
-            f"{self.api_base}/issue/{issue_key}/assignee",
-            json=payload
-        )
+        logger.info("Assigning issue %s to %s", issue_key, account_id or "unassigned")
+        response = self._request("PUT", f"/issue/{issue_key}/assignee", json=payload)
         self._handle_response(response)
+        self.evict_issue(issue_key)
+
+    @traced("jira.add_attachment", attributes=("issue_key", "filename", "size"))
+    def add_attachment(
+        self,
+        issue_key: str,
+        filename: str,
+        size: int,
+        chunks: Callable[[], Iterable[bytes]],
+        mime_type: str = "application/octet-stream",
+    ) -> List[Dict[str, Any]]:
+        """
+        Attach a file to an issue, streaming it as a multipart body.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+            filename: Name the attachment gets in Jira
+            size: Exact number of bytes the chunks add up to
+            chunks: Function returning the file content as an iterable of chunks
+                (called again if the upload is retried)
+            mime_type: Content type of the file (default: application/octet-stream)
+
+        Returns:
+            List with the created attachment (id, filename, size, mimeType, content, ...)
+
+        Raises:
+            Exception: On API errors
+        """
+        boundary = secrets.token_hex(16)
+        quoted = filename.translate({ord('"'): "%22", ord("\r"): "%0D", ord("\n"): "%0A"})
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{quoted}"\r\n'
+            f"Content-Type: {mime_type}\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
+
+        def body() -> Iterator[bytes]:
+            yield head
+            yield from chunks()
+            yield tail
+
+        headers = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(head) + size + len(tail)),
+            # Jira rejects attachment uploads without this CSRF opt-out
+            "X-Atlassian-Token": "no-check",
+        }
+        logger.info("Attaching %s (%s bytes) to %s", filename, size, issue_key)
+        with self._stream(
+            "POST", f"/issue/{issue_key}/attachments", body=body, headers=headers
+        ) as response:
+            response.read()
+            # The attachments endpoint answers with a JSON array of what was added
+            result = cast(List[Dict[str, Any]], self._handle_response(response))
+        self.evict_issue(issue_key)
+        return result
+
+    @traced("jira.get_attachment", attributes=("attachment_id",))
+    def get_attachment(self, attachment_id: str) -> Dict[str, Any]:
+        """
+        Get the metadata of an attachment.
+
+        Args:
+            attachment_id: Attachment ID (e.g., '10001')
+
+        Returns:
+            Dictionary with id, filename, size, mimeType, created and author
+
+        Raises:
+            Exception: On API errors
+        """
+        logger.info("Getting attachment %s", attachment_id)
+        response = self._request("GET", f"/attachment/{attachment_id}")
+        return self._handle_response(response)
+
+    def iter_attachment(
+        self, attachment_id: str, chunk_size: int = TRANSFER_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Stream the content of an attachment.
+
+        Jira answers with a redirect to its media service, which is followed.
+
+        Args:
+            attachment_id: Attachment ID (e.g., '10001')
+            chunk_size: Bytes per yielded chunk, at most (default: TRANSFER_CHUNK_SIZE)
+
+        Yields:
+            Chunks of the attachment content, in order
+
+        Raises:
+            Exception: On API errors
+        """
+        logger.info("Downloading attachment %s", attachment_id)
+        with self._stream(
+            "GET",
+            f"/attachment/content/{attachment_id}",
+            headers={"Accept": "*/*"},
+            follow_redirects=True,
+        ) as response:
+            yield from response.iter_bytes(chunk_size)
+
+    def _agile_values(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the values of a paginated agile API list (boards, sprints)."""
+        start_at = 0
+        while True:
+            page_params = {**(params or {}), "startAt": start_at, "maxResults": AGILE_PAGE_SIZE}
+            page = self._handle_response(
+                self._request("GET", path, agile=True, params=page_params)
+            )
+            values = page.get("values", [])
+            yield from values
+            start_at += len(values)
+            if not values or page.get("isLast", True):
+                return
+
+    def _agile_issues(
+        self,
+        path: str,
+        fields: Optional[List[str]] = None,
+        jql: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Read every page of an agile API issue list (sprint, backlog, board issues).
+
+        The first page gives the total; the remaining pages are then fetched
+        concurrently and put back in order.
+
+        Args:
+            path: Path relative to the agile API base (e.g., '/board/1/backlog')
+            fields: List of fields to return (optional; Jira's defaults if omitted)
+            jql: JQL narrowing the list (optional)
+            limit: Stop after this many issues (optional)
+
+        Returns:
+            Issue dictionaries, in the board's rank order
+
+        Raises:
+            Exception: On API errors
+        """
+        params: Dict[str, Any] = {}
+        if fields:
+            params["fields"] = ",".join(fields)
+        if jql:
+            params["jql"] = jql
+
+        def page(start_at: int) -> Dict[str, Any]:
+            page_params = {**params, "startAt": start_at, "maxResults": AGILE_PAGE_SIZE}
+            response = self._request("GET", path, agile=True, params=page_params)
+            return self._handle_response(response)
+
+        first = page(0)
+        issues = first.get("issues", [])
+        total = first.get("total", len(issues))
+        if limit is not None:
+            total = min(total, limit)
+        # Jira may cap the page size below what was asked for
+        step = len(issues) or AGILE_PAGE_SIZE
+        if len(issues) >= total:
+            return issues[:total]
+
+        pages: Dict[int, List[Dict[str, Any]]] = {}
+        for start_at, result, error in map_bounded(
+            page, range(step, total, step), max_workers=self.concurrency
+        ):
+            if error is not None:
+                raise error
+            pages[start_at] = result.get("issues", [])
+        for start_at in sorted(pages):
+            issues.extend(pages[start_at])
+        return issues[:total]
+
+    @traced("jira.list_boards", attributes=("project_key",))
+    def list_boards(
+        self, project_key: Optional[str] = None, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        List agile boards, cached for METADATA_TTL seconds.
+
+        Args:
+            project_key: Only boards of this project (optional)
+            refresh: Fetch from Jira even if a cached list is fresh (default: False)
+
+        Returns:
+            List of board dictionaries with id, name, type and location
+
+        Raises:
+            Exception: On API errors
+        """
+        params = {"projectKeyOrId": project_key} if project_key else {}
+
+        def load() -> List[Dict[str, Any]]:
+            logger.info("Listing boards for %s", project_key or "all projects")
+            return list(self._agile_values("/board", params))
+
+        return self._cached("boards", load, refresh, key=(project_key,))
+
+    @traced("jira.get_board", attributes=("board_id",))
+    def get_board(self, board_id: int, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get an agile board, cached for METADATA_TTL seconds.
+
+        Args:
+            board_id: Board ID
+            refresh: Fetch from Jira even if a cached board is fresh (default: False)
+
+        Returns:
+            Board dictionary with id, name, type and location
+
+        Raises:
+            Exception: On API errors
+        """
+
+        def load() -> Dict[str, Any]:
+            logger.info("Getting board %s", board_id)
+            return self._handle_response(self._request("GET", f"/board/{board_id}", agile=True))
+
+        return self._cached("board", load, refresh, key=(board_id,))
+
+    @traced("jira.get_board_configuration", attributes=("board_id",))
+    def get_board_configuration(self, board_id: int, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get a board's columns, their statuses and its estimation field.
+
+        Cached for METADATA_TTL seconds; boards are rarely reconfigured.
+
+        Args:
+            board_id: Board ID
+            refresh: Fetch from Jira even if a cached configuration is fresh (default: False)
+
+        Returns:
+            Configuration dictionary with columnConfig and estimation
+
+        Raises:
+            Exception: On API errors
+        """
+
+        def load() -> Dict[str, Any]:
+            logger.info("Getting configuration of board %s", board_id)
+            response = self._request("GET", f"/board/{board_id}/configuration", agile=True)
+            return self._handle_response(response)
+
+        return self._cached("board_config", load, refresh, key=(board_id,))
+
+    @traced("jira.list_sprints", attributes=("board_id", "state"))
+    def list_sprints(self, board_id: int, state: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List a board's sprints, oldest first.
+
+        Args:
+            board_id: Board ID
+            state: Comma-separated states to include: future, active, closed (optional)
+
+        Returns:
+            List of sprint dictionaries with id, name, state, startDate, endDate and goal
+
+        Raises:
+            Exception: On API errors
+        """
+        logger.info("Listing sprints of board %s", board_id)
+        params = {"state": state} if state else {}
+        return list(self._agile_values(f"/board/{board_id}/sprint", params))
+
+    @traced("jira.get_sprint", attributes=("sprint_id",))
+    def get_sprint(self, sprint_id: int) -> Dict[str, Any]:
+        """
+        Get a sprint.
+
+        Args:
+            sprint_id: Sprint ID
+
+        Returns:
+            Sprint dictionary with id, name, state, dates, goal and originBoardId
+
+        Raises:
+            Exception: On API errors
+        """
+        logger.info("Getting sprint %s", sprint_id)
+        return self._handle_response(self._request("GET", f"/sprint/{sprint_id}", agile=True))
+
+    @traced("jira.get_sprint_issues", attributes=("board_id", "sprint_id"))
+    def get_sprint_issues(
+        self,
+        board_id: int,
+        sprint_id: int,
+        fields: Optional[List[str]] = None,
+        jql: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the issues of a sprint as shown on a board, reading pages concurrently.
+
+        Args:
+            board_id: Board ID
+            sprint_id: Sprint ID
+            fields: List of fields to return (optional)
+            jql: JQL narrowing the issues (optional)
+            limit: Maximum number of issues (optional)
+
+        Returns:
+            Issue dictionaries, in rank order
+
+        Raises:
+            Exception: On API errors
+        """
+        logger.info("Getting issues of sprint %s on board %s", sprint_id, board_id)
+        return self._agile_issues(
+            f"/board/{board_id}/sprint/{sprint_id}/issue", fields, jql, limit
+        )
+
+    @traced("jira.get_backlog_issues", attributes=("board_id",))
+    def get_backlog_issues(
+        self,
+        board_id: int,
+        fields: Optional[List[str]] = None,
+        jql: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a board's backlog (issues in no open sprint), reading pages concurrently.
+
+        Args:
+            board_id: Board ID
+            fields: List of fields to return (optional)
+            jql: JQL narrowing the issues (optional)
+            limit: Maximum number of issues (optional)
+
+        Returns:
+            Issue dictionaries, in rank order
+
+        Raises:
+            Exception: On API errors
+        """
+        logger.info("Getting backlog of board %s", board_id)
+        return self._agile_issues(f"/board/{board_id}/backlog", fields, jql, limit)
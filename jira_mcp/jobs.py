@@ -0,0 +1,270 @@
+"""Background jobs for long-running tool calls.
+
+A job runs a tool on a bounded worker pool while the tool call that started
+it returns the job ID immediately. Code running inside a job reports progress
+through the module-level helpers below, which are no-ops outside a job:
+
+    set_total(len(entries))
+    for entry in entries:
+        ...
+        report_progress(partial=f"{key}: done")   # raises JobCancelled if cancelled
+
+Progress reports double as cancellation checkpoints, so cancelling a running
+job stops it at the next processed item; work already in flight completes.
+
+Each job belongs to the MCP session that started it: other sessions can
+neither see, read nor cancel it. Jobs run in a copy of the submitting
+context, so context variables (the request context, tracing spans) carry over.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Jobs that may run at once; further jobs wait in the queue
+DEFAULT_MAX_CONCURRENT_JOBS = 2
+
+# Finished jobs kept for status queries before the oldest are forgotten
+MAX_FINISHED_JOBS = 100
+
+# Most recent partial results and errors kept per job
+MAX_PARTIAL_RESULTS = 50
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+_current_job: contextvars.ContextVar[Optional["Job"]] = contextvars.ContextVar(
+    "jira_mcp_current_job", default=None
+)
+
+
+class JobCancelled(Exception):
+    """Raised at a progress checkpoint when the running job has been cancelled."""
+
+
+class Job:
+    """State, progress and outcome of one background tool call."""
+
+    __slots__ = (
+        "id", "tool", "state", "created", "started", "finished", "done", "total",
+        "partial_results", "errors", "error_count", "result", "_owner", "_cancel", "_future",
+        "_lock",
+    )
+
+    def __init__(self, tool: str, session: Any = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.tool = tool
+        # Weak, so a job does not keep its session alive
+        self._owner = weakref.ref(session) if session is not None else None
+        self.state = QUEUED
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.done = 0
+        self.total: Optional[int] = None
+        self.partial_results: Deque[str] = deque(maxlen=MAX_PARTIAL_RESULTS)
+        self.errors: Deque[str] = deque(maxlen=MAX_PARTIAL_RESULTS)
+        self.error_count = 0
+        self.result: Optional[str] = None
+        self._cancel = threading.Event()
+        self._future: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    def owned_by(self, session: Any) -> bool:
+        """Whether the job was started by a session (None: outside any session)."""
+        if self._owner is None:
+            return session is None
+        return session is not None and self._owner() is session
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Whether cancellation has been requested."""
+        return self._cancel.is_set()
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """Seconds spent running so far, or in total once finished."""
+        if self.started is None:
+            return None
+        return (self.finished or time.time()) - self.started
+
+    def advance(
+        self, count: int = 1, partial: Optional[str] = None, error: Optional[str] = None
+    ) -> None:
+        """Record processed items, an optional partial result and an optional error."""
+        with self._lock:
+            self.done += count
+            if partial is not None:
+                self.partial_results.append(partial)
+            if error is not None:
+                self.errors.append(error)
+                self.error_count += 1
+        if self._cancel.is_set():
+            raise JobCancelled(f"Job {self.id} cancelled")
+
+
+class JobManager:
+    """Runs jobs on a bounded thread pool and keeps their status for polling."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_CONCURRENT_JOBS):
+        """
+        Initialize the manager; worker threads start with the first job.
+
+        Args:
+            max_workers: Maximum number of jobs running at once
+        """
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, max_workers: int) -> None:
+        """Set the job concurrency limit (takes effect before the first job starts)."""
+        self.max_workers = max(1, max_workers)
+
+    def submit(self, tool: str, func: Callable[[], str], session: Any = None) -> Job:
+        """
+        Queue a job, to run in a copy of the caller's context.
+
+        Args:
+            tool: Name of the tool being run (for display)
+            func: Blocking function producing the job's final text result
+            session: MCP session starting the job, the only one that may see it (optional)
+
+        Returns:
+            The queued Job
+        """
+        job = Job(tool, session)
+        context = contextvars.copy_context()
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="jira-mcp-job"
+                )
+            self._jobs[job.id] = job
+            self._prune()
+            job._future = self._pool.submit(context.run, self._run, job, func)
+        logger.info("Queued job %s (%s)", job.id, tool)
+        return job
+
+    def _run(self, job: Job, func: Callable[[], str]) -> None:
+        if job.cancel_requested:
+            job.state = CANCELLED
+            job.finished = time.time()
+            return
+
+        job.state = RUNNING
+        job.started = time.time()
+        token = _current_job.set(job)
+        try:
+            job.result = func()
+            job.state = CANCELLED if job.cancel_requested else SUCCEEDED
+        except JobCancelled:
+            job.state = CANCELLED
+        except Exception as e:
+            logger.error("Job %s (%s) failed: %s", job.id, job.tool, e, exc_info=True)
+            job.result = f"Error: {e}"
+            job.state = FAILED
+        finally:
+            _current_job.reset(token)
+            job.finished = time.time()
+            logger.info("Job %s (%s) %s in %.1fs", job.id, job.tool, job.state, job.elapsed)
+
+    def get(self, job_id: str, session: Any = None) -> Optional[Job]:
+        """Look up a job by ID, or None if there is none or another session started it."""
+        job = self._jobs.get(job_id)
+        return job if job is not None and job.owned_by(session) else None
+
+    def list_jobs(self, session: Any = None) -> List[Job]:
+        """A session's known jobs, newest first."""
+        with self._lock:
+            return [job for job in reversed(self._jobs.values()) if job.owned_by(session)]
+
+    def cancel(self, job_id: str, session: Any = None) -> Optional[Job]:
+        """
+        Request cancellation of a job.
+
+        Queued jobs are cancelled immediately; running jobs stop at their next
+        progress checkpoint.
+
+        Args:
+            job_id: Job ID
+            session: MCP session asking; only its own jobs can be cancelled
+
+        Returns:
+            The job, or None if the session has no such job
+        """
+        job = self.get(job_id, session)
+        if job is not None:
+            self._request_cancel(job)
+        return job
+
+    def _request_cancel(self, job: Job) -> None:
+        if job.state in FINISHED_STATES:
+            return
+        job._cancel.set()
+        if job._future is not None and job._future.cancel():
+            job.state = CANCELLED
+            job.finished = time.time()
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond MAX_FINISHED_JOBS (caller holds the lock)."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.state in FINISHED_STATES]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    def shutdown(self) -> None:
+        """Cancel all jobs, of every session, and stop the worker threads."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            self._request_cancel(job)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Process-wide job manager; each session sees only its own jobs
+manager = JobManager()
+
+
+def current_job() -> Optional[Job]:
+    """The job the calling code runs in, or None outside a job."""
+    return _current_job.get()
+
+
+def set_total(total: int) -> None:
+    """Set the number of items the current job will process (no-op outside a job)."""
+    job = _current_job.get()
+    if job is not None:
+        job.total = total
+
+
+def report_progress(
+    count: int = 1, partial: Optional[str] = None, error: Optional[str] = None
+) -> None:
+    """
+    Report processed items for the current job (no-op outside a job).
+
+    Args:
+        count: Number of items processed since the last report
+        partial: Short partial result to show in the job status (optional)
+        error: Error message for a failed item (optional)
+
+    Raises:
+        JobCancelled: If the current job has been cancelled
+    """
+    job = _current_job.get()
+    if job is not None:
+        job.advance(count, partial=partial, error=error)
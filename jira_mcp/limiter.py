@@ -0,0 +1,188 @@
+"""Adaptive concurrency limit shared by every request the process sends to Jira.
+
+Each request holds a slot for its duration. The limit follows an AIMD scheme:
+
+- while requests come back as fast as usual for their endpoint and the slots
+  are in use, the limit grows by about one per round trip (additive increase);
+- a 429 (or 503) cuts it in half, and a latency spike (a request taking more
+  than LATENCY_TOLERANCE times its endpoint's baseline) cuts it by 10%
+  (multiplicative decrease).
+
+Requests that were already in flight when the limit was cut do not cut it
+again, so a burst of 429s from one wave of requests counts once. The baseline
+is the fastest recent response per endpoint template, drifting slowly upward
+so it follows a server that has become slower for good.
+
+A single process-wide instance is available as ``limiter``; JiraClient
+configures it from the instance's tuning settings.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from jira_mcp.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# A response slower than this multiple of its endpoint's baseline is a latency spike
+LATENCY_TOLERANCE = 2.0
+
+# ...provided it is also at least this much slower, in seconds, so jitter on fast calls is ignored
+MIN_SPIKE_SECONDS = 0.05
+
+# Share of the limit kept after a 429/503 and after a latency spike
+THROTTLE_BACKOFF = 0.5
+LATENCY_BACKOFF = 0.9
+
+# How fast an endpoint's baseline follows responses slower than it (per response)
+BASELINE_DRIFT = 0.01
+
+# Statuses by which Jira signals overload
+OVERLOAD_STATUSES = (429, 503)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit with per-endpoint latency baselines."""
+
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 32, enabled: bool = True):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting limit
+            minimum: Lowest limit backoffs may reach
+            maximum: Highest limit increases may reach
+            enabled: Whether to limit at all; if False, acquire never blocks
+        """
+        self._cond = threading.Condition()
+        self.configure(initial, minimum, maximum, enabled)
+
+    def configure(
+        self, initial: int = 8, minimum: int = 1, maximum: int = 32, enabled: bool = True
+    ) -> None:
+        """Set the bounds and starting limit, and reset all state and statistics."""
+        with self._cond:
+            self.enabled = enabled
+            self.minimum = max(1, minimum)
+            self.maximum = max(self.minimum, maximum)
+            self.limit = float(min(max(initial, self.minimum), self.maximum))
+            self.in_flight = 0
+            self.peak_in_flight = 0
+            self.waits = 0
+            self.throttle_backoffs = 0
+            self.latency_backoffs = 0
+            self._waiting = 0
+            self._last_decrease = 0.0
+            self._baselines: Dict[str, float] = {}
+            self._cond.notify_all()
+        self._publish()
+
+    def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        with self._cond:
+            if self.enabled and self.in_flight >= int(self.limit):
+                self.waits += 1
+                self._waiting += 1
+                try:
+                    while self.enabled and self.in_flight >= int(self.limit):
+                        self._cond.wait()
+                finally:
+                    self._waiting -= 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def release(self, endpoint: str, seconds: float, status: Optional[int]) -> None:
+        """
+        Give back a slot and adjust the limit from the request's outcome.
+
+        Args:
+            endpoint: Endpoint template the request was sent to
+            seconds: Time the request took
+            status: HTTP status code, or None if no response was received
+        """
+        with self._cond:
+            saturated = self._waiting > 0 or self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            if self.enabled:
+                self._adjust(endpoint, seconds, status, saturated)
+            self._cond.notify()
+
+    def _adjust(
+        self, endpoint: str, seconds: float, status: Optional[int], saturated: bool
+    ) -> None:
+        now = time.monotonic()
+        if status in OVERLOAD_STATUSES:
+            self._decrease(now - seconds, THROTTLE_BACKOFF, f"HTTP {status}")
+            return
+        if status is None or status >= 500:
+            return
+
+        baseline = self._baselines.get(endpoint)
+        if baseline is None or seconds < baseline:
+            self._baselines[endpoint] = seconds
+        else:
+            self._baselines[endpoint] = baseline + (seconds - baseline) * BASELINE_DRIFT
+
+        if (
+            baseline is not None
+            and seconds > baseline * LATENCY_TOLERANCE
+            and seconds - baseline > MIN_SPIKE_SECONDS
+        ):
+            self._decrease(now - seconds, LATENCY_BACKOFF, f"{endpoint} took {seconds:.2f}s")
+        elif saturated and self.limit < self.maximum:
+            # +1/limit per response is about +1 per round trip of a full window
+            previous = int(self.limit)
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            if int(self.limit) != previous:
+                self._publish()
+                self._cond.notify()
+
+    def _decrease(self, started: float, factor: float, reason: str) -> None:
+        # Requests sent before the last cut saw the old limit; count their signal once
+        if started < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        if factor == THROTTLE_BACKOFF:
+            self.throttle_backoffs += 1
+        else:
+            self.latency_backoffs += 1
+        previous = self.limit
+        self.limit = max(float(self.minimum), math.floor(self.limit * factor))
+        logger.info("Concurrency limit %.1f → %.0f (%s)", previous, self.limit, reason)
+        self._publish()
+
+    def _publish(self) -> None:
+        registry.set_gauge("jira_mcp_concurrency_limit", int(self.limit) if self.enabled else 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limit, bounds and counters."""
+        with self._cond:
+            return {
+                "enabled": self.enabled,
+                "limit": self.limit,
+                "minimum": self.minimum,
+                "maximum": self.maximum,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "waits": self.waits,
+                "throttle_backoffs": self.throttle_backoffs,
+                "latency_backoffs": self.latency_backoffs,
+            }
+
+    def format_summary(self) -> str:
+        """Render the limiter's state for jira_server_stats."""
+        s = self.stats()
+        if not s["enabled"]:
+            return "Adaptive concurrency: disabled"
+        return (
+            f"Adaptive concurrency: limit {int(s['limit'])} ({s['minimum']}-{s['maximum']}), "
+            f"{s['in_flight']} in flight (peak {s['peak_in_flight']})\n"
+            f"  backoffs: {s['throttle_backoffs']} on 429/503, {s['latency_backoffs']} on latency"
+            f" | {s['waits']} request(s) waited for a slot"
+        )
+
+
+limiter = AdaptiveLimiter()
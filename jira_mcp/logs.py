@@ -0,0 +1,166 @@
+"""Logging setup that keeps log output off the request path.
+
+Records are handed to a queue in the calling thread and formatted and written
+to stderr by a listener thread, so a tool call never waits for a slow or full
+stderr pipe. Messages use lazy ``%``-style arguments, which are only merged
+into the message (in the listener thread) if the record is emitted at all.
+
+High-volume events (one per search page, issue read or HTTP request) can be
+sampled: with ``sample_every=N``, the first record of each such event and
+then one in N are kept. Mark an event as high-volume with ``extra=SAMPLED``:
+
+    logger.info("Searching issues with JQL: %s", jql, extra=SAMPLED)
+
+Records from the loggers in SAMPLED_LOGGERS (the per-request lines of httpx
+and the MCP SDK) are sampled the same way. Warnings and errors are never sampled.
+
+With ``fmt="json"``, each record is written as one JSON object per line with
+the message template as ``event``, the formatted ``message``, any ``extra``
+fields and, for sampled events, the ``sample_rate`` to scale counts by.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+FORMATS = ("text", "json")
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Pass as ``extra`` to mark a log call as a high-volume event subject to sampling
+SAMPLED: Dict[str, Any] = {"sampled": True}
+
+# Loggers whose INFO records are all high-volume events
+SAMPLED_LOGGERS = ("httpx", "mcp.server.lowlevel.server")
+
+# Attributes every LogRecord has; anything else on a record came from ``extra``
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "sampled"}
+
+# Argument types that cannot change between the log call and formatting in the listener
+_IMMUTABLE = (str, int, float, bool, type(None))
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class EventSampler(logging.Filter):
+    """Keep the first and then one in ``every`` records of each high-volume event."""
+
+    def __init__(self, every: int = 1):
+        super().__init__()
+        self.every = max(1, every)
+        self._counts: Dict[Tuple[str, Any], int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.every == 1 or record.levelno > logging.INFO:
+            return True
+        if not (getattr(record, "sampled", False) or record.name in SAMPLED_LOGGERS):
+            return True
+        # Events are told apart by their message template; counts may skip under races
+        key = (record.name, record.msg)
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        if count % self.every:
+            return False
+        record.sample_rate = self.every
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.msg if isinstance(record.msg, str) else str(record.msg),
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread where it is safe."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock handler formats every record in the calling thread. Records are
+        # only read in this process, so they can travel as they are, unless an
+        # argument is mutable and could change before the listener formats it.
+        args = record.args
+        if isinstance(record.msg, str) and (
+            not args or (isinstance(args, tuple) and all(isinstance(a, _IMMUTABLE) for a in args))
+        ):
+            return record
+        return super().prepare(record)
+
+
+def configure_logging(
+    level: str = "INFO",
+    fmt: str = "text",
+    sample_every: int = 1,
+    use_queue: bool = True,
+) -> None:
+    """
+    Send the process's log records to stderr, replacing any handlers already set up.
+
+    Args:
+        level: Root log level name (e.g., 'INFO', 'DEBUG')
+        fmt: 'text' for human-readable lines or 'json' for one JSON object per line
+        sample_every: Keep one in this many records of each high-volume event (1: all)
+        use_queue: Write from a listener thread instead of the calling thread
+
+    Raises:
+        ValueError: On an unknown format or level
+    """
+    global _listener
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown log format '{fmt}' (expected one of {', '.join(FORMATS)})")
+    numeric_level = logging.getLevelName(level.upper())
+    if not isinstance(numeric_level, int):
+        raise ValueError(f"Unknown log level '{level}'")
+
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+
+    handler: logging.Handler = stream
+    if use_queue:
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        handler = _DeferredQueueHandler(records)
+    # Sampling runs before queueing, so dropped records cost no more than the filter
+    handler.addFilter(EventSampler(sample_every))
+
+    stop_listener()
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(numeric_level)
+
+    if use_queue:
+        _listener = logging.handlers.QueueListener(records, stream, respect_handler_level=True)
+        _listener.start()
+
+
+def stop_listener() -> None:
+    """Flush queued records and stop the listener thread (no-op if none is running)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_listener)
@@ -0,0 +1,287 @@
+"""In-process metrics: request counters, latency histograms and tool timings."""
+
+import bisect
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from jira_mcp.stats import StreamingHistogram
+
+# Fixed histogram buckets (seconds) used for the Prometheus export
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_ISSUE_KEY_SEGMENT = re.compile(r"^[A-Za-z][A-Za-z0-9_]*-\d+$")
+_ID_SEGMENT = re.compile(r"^\d+$")
+
+
+def endpoint_template(path: str) -> str:
+    """
+    Collapse a concrete REST path into an endpoint template.
+
+    Issue keys become ``{key}`` and numeric IDs become ``{id}``, so that
+    ``/issue/PROJ-123/comment/10001`` is reported as ``/issue/{key}/comment/{id}``.
+
+    Args:
+        path: Request path relative to the API base (e.g., '/issue/PROJ-123')
+
+    Returns:
+        Endpoint template string
+    """
+    segments = []
+    for segment in path.split("/"):
+        if _ISSUE_KEY_SEGMENT.match(segment):
+            segments.append("{key}")
+        elif _ID_SEGMENT.match(segment):
+            segments.append("{id}")
+        else:
+            segments.append(segment)
+    return "/".join(segments) or "/"
+
+
+class LatencyStats:
+    """Count, error count and latency distribution for one endpoint or tool."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.histogram = StreamingHistogram()
+        self.buckets = [0] * len(PROMETHEUS_BUCKETS)
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        """Record one observation."""
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.histogram.add(seconds)
+        index = bisect.bisect_left(PROMETHEUS_BUCKETS, seconds)
+        if index < len(self.buckets):
+            self.buckets[index] += 1
+
+
+class Metrics:
+    """
+    Thread-safe registry of client and tool metrics.
+
+    Counters are keyed by endpoint template rather than raw URL so cardinality
+    stays bounded. A single process-wide instance is available as ``registry``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.requests: Dict[Tuple[str, str], LatencyStats] = {}
+        self.status_codes: Dict[Tuple[str, str, str], int] = {}
+        self.bytes_sent: Dict[Tuple[str, str], int] = {}
+        self.bytes_received: Dict[Tuple[str, str], int] = {}
+        self.retries: Dict[str, int] = {}
+        self.cache_hits: Dict[str, int] = {}
+        self.cache_misses: Dict[str, int] = {}
+        self.tools: Dict[str, LatencyStats] = {}
+        self.gauges: Dict[str, float] = {}
+
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        status: Optional[int],
+        seconds: float,
+        sent: int = 0,
+        received: int = 0,
+    ) -> None:
+        """
+        Record a completed HTTP request.
+
+        Args:
+            method: HTTP method (e.g., 'GET')
+            endpoint: Endpoint template (see endpoint_template)
+            status: HTTP status code, or None if no response was received
+            seconds: Wall-clock time for the request
+            sent: Request body size in bytes
+            received: Response body size in bytes
+        """
+        status_label = str(status) if status is not None else "error"
+        failed = status is None or status >= 400
+        with self._lock:
+            self.requests.setdefault((method, endpoint), LatencyStats()).observe(seconds, failed)
+            key = (method, endpoint, status_label)
+            self.status_codes[key] = self.status_codes.get(key, 0) + 1
+            series = (method, endpoint)
+            self.bytes_sent[series] = self.bytes_sent.get(series, 0) + sent
+            self.bytes_received[series] = self.bytes_received.get(series, 0) + received
+
+    def record_retry(self, endpoint: str) -> None:
+        """Record a retried request."""
+        with self._lock:
+            self.retries[endpoint] = self.retries.get(endpoint, 0) + 1
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """Record a cache lookup."""
+        with self._lock:
+            counter = self.cache_hits if hit else self.cache_misses
+            counter[cache] = counter.get(cache, 0) + 1
+
+    def record_tool(self, tool: str, seconds: float, error: bool = False) -> None:
+        """Record an end-to-end tool call."""
+        with self._lock:
+            self.tools.setdefault(tool, LatencyStats()).observe(seconds, error)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge (a current value, such as the concurrency limit)."""
+        with self._lock:
+            self.gauges[name] = value
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        with self._lock:
+            self.started_at = time.time()
+            for table in (
+                self.requests, self.status_codes, self.bytes_sent, self.bytes_received,
+                self.retries, self.cache_hits, self.cache_misses, self.tools, self.gauges,
+            ):
+                table.clear()
+
+    def format_summary(self) -> str:
+        """Render a human-readable summary of all metrics."""
+        with self._lock:
+            uptime = time.time() - self.started_at
+            lines = [f"Uptime: {uptime:.0f}s"]
+
+            if self.tools:
+                lines.append("\nTool calls (end-to-end):")
+                for tool, stats in sorted(self.tools.items()):
+                    lines.append(f"  {tool}: {_format_latency(stats)}")
+
+            if self.requests:
+                lines.append("\nHTTP requests by endpoint:")
+                for (method, endpoint), stats in sorted(self.requests.items()):
+                    codes = ", ".join(
+                        f"{status}×{count}"
+                        for (m, e, status), count in sorted(self.status_codes.items())
+                        if m == method and e == endpoint
+                    )
+                    sent = self.bytes_sent.get((method, endpoint), 0)
+                    received = self.bytes_received.get((method, endpoint), 0)
+                    lines.append(f"  {method} {endpoint}: {_format_latency(stats)}")
+                    lines.append(f"    status {codes} | sent {sent}B | received {received}B")
+            else:
+                lines.append("\nNo HTTP requests recorded yet")
+
+            if self.retries:
+                retries = ", ".join(f"{e}×{n}" for e, n in sorted(self.retries.items()))
+                lines.append(f"\nRetries: {retries}")
+
+            caches = sorted(set(self.cache_hits) | set(self.cache_misses))
+            if caches:
+                lines.append("\nCaches:")
+                for cache in caches:
+                    hits = self.cache_hits.get(cache, 0)
+                    misses = self.cache_misses.get(cache, 0)
+                    ratio = hits / (hits + misses) if hits + misses else 0.0
+                    lines.append(f"  {cache}: {hits} hit(s), {misses} miss(es) ({ratio:.0%})")
+
+            return "\n".join(lines)
+
+    def format_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            out: List[str] = []
+
+            out.append("# TYPE jira_mcp_http_requests_total counter")
+            for (method, endpoint, status), count in sorted(self.status_codes.items()):
+                labels = _labels(method=method, endpoint=endpoint, status=status)
+                out.append(f"jira_mcp_http_requests_total{labels} {count}")
+
+            out.append("# TYPE jira_mcp_http_request_duration_seconds histogram")
+            for (method, endpoint), stats in sorted(self.requests.items()):
+                _append_histogram(
+                    out, "jira_mcp_http_request_duration_seconds", stats,
+                    method=method, endpoint=endpoint,
+                )
+
+            for name, by_method in (
+                ("jira_mcp_http_bytes_sent_total", self.bytes_sent),
+                ("jira_mcp_http_bytes_received_total", self.bytes_received),
+            ):
+                out.append(f"# TYPE {name} counter")
+                for (method, endpoint), value in sorted(by_method.items()):
+                    out.append(f"{name}{_labels(method=method, endpoint=endpoint)} {value}")
+
+            out.append("# TYPE jira_mcp_http_retries_total counter")
+            for endpoint, value in sorted(self.retries.items()):
+                out.append(f"jira_mcp_http_retries_total{_labels(endpoint=endpoint)} {value}")
+
+            for name, counter in (
+                ("jira_mcp_cache_hits_total", self.cache_hits),
+                ("jira_mcp_cache_misses_total", self.cache_misses),
+            ):
+                out.append(f"# TYPE {name} counter")
+                for cache, value in sorted(counter.items()):
+                    out.append(f"{name}{_labels(cache=cache)} {value}")
+
+            for name, value in sorted(self.gauges.items()):
+                out.append(f"# TYPE {name} gauge")
+                out.append(f"{name} {value}")
+
+            out.append("# TYPE jira_mcp_tool_errors_total counter")
+            for tool, stats in sorted(self.tools.items()):
+                out.append(f"jira_mcp_tool_errors_total{_labels(tool=tool)} {stats.errors}")
+
+            out.append("# TYPE jira_mcp_tool_duration_seconds histogram")
+            for tool, stats in sorted(self.tools.items()):
+                _append_histogram(out, "jira_mcp_tool_duration_seconds", stats, tool=tool)
+
+            return "\n".join(out) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """
+        Atomically write the Prometheus text dump to a file.
+
+        Suitable for the node_exporter textfile collector.
+
+        Args:
+            path: Destination file path
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.format_prometheus())
+        os.replace(tmp_path, path)
+
+
+def _format_latency(stats: LatencyStats) -> str:
+    """Format count, errors and latency percentiles (in milliseconds)."""
+    h = stats.histogram
+
+    def ms(value: Optional[float]) -> str:
+        return f"{value * 1000:.0f}ms" if value is not None else "N/A"
+
+    return (
+        f"{stats.count} call(s), {stats.errors} error(s) | "
+        f"p50 {ms(h.quantile(0.5))} | p90 {ms(h.quantile(0.9))} | "
+        f"p99 {ms(h.quantile(0.99))} | max {ms(h.max)}"
+    )
+
+
+def _labels(**labels: str) -> str:
+    """Format Prometheus labels, escaping quotes and backslashes."""
+    parts = []
+    for name, value in labels.items():
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{name}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _append_histogram(out: List[str], name: str, stats: LatencyStats, **labels: str) -> None:
+    """Append Prometheus histogram sample lines for one series."""
+    cumulative = 0
+    for bound, count in zip(PROMETHEUS_BUCKETS, stats.buckets):
+        cumulative += count
+        out.append(f"{name}_bucket{_labels(**labels, le=str(bound))} {cumulative}")
+    out.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {stats.count}")
+    out.append(f"{name}_sum{_labels(**labels)} {stats.histogram.total}")
+    out.append(f"{name}_count{_labels(**labels)} {stats.count}")
+
+
+# Process-wide metrics registry
+registry = Metrics()
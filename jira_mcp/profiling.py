@@ -0,0 +1,101 @@
+"""Startup profiling: import-time breakdown and time to first list_tools response."""
+
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Target for a cold start, from process launch to the first list_tools response
+STARTUP_TARGET_MS = 1000.0
+
+# Dummy instance used for profiling; the client is never built, so nothing is contacted
+_PROFILE_ENV = {
+    "JIRA_STARTUPPROFILE_URL": "https://startup-profile.invalid",
+    "JIRA_STARTUPPROFILE_EMAIL": "profile@example.com",
+    "JIRA_STARTUPPROFILE_TOKEN": "unused",
+}
+
+
+def import_time_breakdown(module: str = "jira_mcp.server") -> Tuple[Dict[str, float], float]:
+    """
+    Import a module in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Tuple of (self time in ms per top-level package, total import time in ms)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    by_package: Dict[str, float] = {}
+    total_ms = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[12:].split("|"))
+        package = name.split(".")[0]
+        by_package[package] = by_package.get(package, 0.0) + int(self_us) / 1000
+        if name == module:
+            total_ms = int(cumulative_us) / 1000
+    return by_package, total_ms
+
+
+async def _first_list_tools_ms() -> float:
+    """Launch the server over stdio and time the handshake plus first list_tools."""
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "jira_mcp.server", "--instance", "startupprofile"],
+        env={**os.environ, **_PROFILE_ENV},
+    )
+    started = time.perf_counter()
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(params, errlog=devnull) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                await session.list_tools()
+                return (time.perf_counter() - started) * 1000
+
+
+def profile_startup(runs: int = 3, target_ms: float = STARTUP_TARGET_MS) -> bool:
+    """
+    Print an import-time breakdown and the measured time to first list_tools.
+
+    Args:
+        runs: Number of cold starts to measure (the median is reported)
+        target_ms: Target time to first list_tools response
+
+    Returns:
+        True if the median cold start meets the target
+    """
+    by_package, total_ms = import_time_breakdown()
+    print(f"Import time for jira_mcp.server: {total_ms:.0f} ms (self time by package)")
+    ranked: List[Tuple[str, float]] = sorted(
+        by_package.items(), key=lambda item: item[1], reverse=True
+    )
+    for package, ms in ranked[:12]:
+        share = ms / total_ms if total_ms else 0.0
+        print(f"  {package:<24} {ms:>8.1f} ms  {share:>6.1%}")
+    own = by_package.get("jira_mcp", 0.0)
+    print(f"  (jira_mcp itself: {own:.1f} ms; the Jira client is built on the first tool call)")
+
+    timings = [asyncio.run(_first_list_tools_ms()) for _ in range(max(1, runs))]
+    median = statistics.median(timings)
+    ok = median <= target_ms
+    print(
+        f"\nTime to first list_tools response: {median:.0f} ms "
+        f"(median of {len(timings)} cold start(s), min {min(timings):.0f} ms, "
+        f"target {target_ms:.0f} ms) {'✓' if ok else '✗'}"
+    )
+    return ok
@@ -0,0 +1,133 @@
+"""Compact in-memory representation of issues for large result sets.
+
+Raw search results keep a full nested dict per issue, with the status,
+issue type, priority and user sub-objects repeated for every issue. An
+IssueRecord keeps only the scalar values the formatters need, in slots, and
+interns the low-cardinality strings (status, type, priority and user names),
+so ten thousand issues in the same few statuses share a handful of strings.
+"""
+
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    # Only needed for annotations; keeps this module importable without httpx
+    from jira_mcp.jira_client import JiraClient
+
+# Fields needed to build an IssueRecord; request these to keep pages small
+RECORD_FIELDS = [
+    "summary", "status", "issuetype", "priority", "assignee", "reporter",
+    "created", "updated", "resolutiondate", "parent", "labels",
+]
+
+
+def _interned(obj: Optional[Dict[str, Any]], key: str) -> Optional[str]:
+    """Read a string from a sub-object and intern it."""
+    if not obj:
+        return None
+    value = obj.get(key)
+    return sys.intern(value) if isinstance(value, str) else None
+
+
+class IssueRecord:
+    """A single issue's summary fields, with shared strings interned."""
+
+    __slots__ = (
+        "key", "id", "summary", "status", "status_category", "issue_type", "priority",
+        "assignee", "assignee_id", "reporter", "created", "updated", "resolved",
+        "parent_key", "labels",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        id: Optional[str] = None,
+        summary: Optional[str] = None,
+        status: Optional[str] = None,
+        status_category: Optional[str] = None,
+        issue_type: Optional[str] = None,
+        priority: Optional[str] = None,
+        assignee: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+        reporter: Optional[str] = None,
+        created: Optional[str] = None,
+        updated: Optional[str] = None,
+        resolved: Optional[str] = None,
+        parent_key: Optional[str] = None,
+        labels: Tuple[str, ...] = (),
+    ):
+        self.key = key
+        self.id = id
+        self.summary = summary
+        self.status = status
+        self.status_category = status_category
+        self.issue_type = issue_type
+        self.priority = priority
+        self.assignee = assignee
+        self.assignee_id = assignee_id
+        self.reporter = reporter
+        self.created = created
+        self.updated = updated
+        self.resolved = resolved
+        self.parent_key = parent_key
+        self.labels = labels
+
+    @classmethod
+    def from_json(cls, issue: Dict[str, Any]) -> "IssueRecord":
+        """
+        Build a record from an issue as returned by the REST API.
+
+        Args:
+            issue: Issue dictionary with key and fields
+
+        Returns:
+            IssueRecord; fields missing from the response are None
+        """
+        fields = issue.get("fields") or {}
+        status = fields.get("status")
+        assignee = fields.get("assignee")
+        return cls(
+            key=issue.get("key", "N/A"),
+            id=issue.get("id"),
+            summary=fields.get("summary"),
+            status=_interned(status, "name"),
+            status_category=_interned(status.get("statusCategory") if status else None, "key"),
+            issue_type=_interned(fields.get("issuetype"), "name"),
+            priority=_interned(fields.get("priority"), "name"),
+            assignee=_interned(assignee, "displayName"),
+            assignee_id=_interned(assignee, "accountId"),
+            reporter=_interned(fields.get("reporter"), "displayName"),
+            created=fields.get("created"),
+            updated=fields.get("updated"),
+            resolved=fields.get("resolutiondate"),
+            parent_key=(fields.get("parent") or {}).get("key"),
+            labels=tuple(sys.intern(label) for label in fields.get("labels") or ()),
+        )
+
+    def __repr__(self) -> str:
+        return f"IssueRecord({self.key!r}, status={self.status!r}, summary={self.summary!r})"
+
+
+def iter_records(
+    client: "JiraClient",
+    jql: str,
+    page_size: int = 100,
+    limit: Optional[int] = None,
+) -> Iterator[IssueRecord]:
+    """
+    Stream IssueRecords for a JQL query.
+
+    Each page is converted as it arrives and then dropped, so only the
+    compact records outlive the response.
+
+    Args:
+        client: JiraClient instance
+        jql: JQL query string
+        page_size: Number of issues to request per page (default: 100)
+        limit: Stop after this many issues (optional)
+
+    Returns:
+        Iterator of IssueRecord, one per matching issue
+    """
+    issues = client.iter_issues(jql, fields=RECORD_FIELDS, page_size=page_size, limit=limit)
+    return map(IssueRecord.from_json, issues)
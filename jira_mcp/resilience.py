@@ -0,0 +1,161 @@
+"""Failing fast and answering from cache while Jira is degraded.
+
+A CircuitBreaker per endpoint template counts consecutive failures (transport
+errors and 5xx responses). After ``threshold`` of them it opens: requests to
+that endpoint fail at once with CircuitOpenError instead of each waiting for
+the full HTTP timeout. After ``reset_timeout`` seconds one probe request is let
+through; its success closes the breaker, its failure keeps it open.
+
+Reads that may be answered from cache (see JiraClient._cached) record the
+stale answers they gave in the current context, so the tool call can flag
+its reply:
+
+    reads = track_stale_reads()
+    ...                      # tool handler runs
+    if reads:
+        notice = format_stale_notice(reads)
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failures that open a breaker, and seconds before it lets a probe through
+DEFAULT_BREAKER_THRESHOLD = 5
+DEFAULT_BREAKER_RESET = 30.0
+
+_stale_reads: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "jira_mcp_stale_reads", default=None
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to an endpoint whose breaker is open."""
+
+
+class CircuitBreaker:
+    """Failure count and open/half-open state of one endpoint."""
+
+    __slots__ = ("failures", "opened_at", "probing", "trips")
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self.trips = 0
+
+
+class CircuitBreakers:
+    """Thread-safe circuit breakers keyed by endpoint template."""
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_BREAKER_THRESHOLD,
+        reset_timeout: float = DEFAULT_BREAKER_RESET,
+    ):
+        """
+        Initialize with every breaker closed.
+
+        Args:
+            threshold: Consecutive failures that open a breaker (0 disables breakers)
+            reset_timeout: Seconds an open breaker rejects requests before a probe
+        """
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def check(self, endpoint: str) -> None:
+        """
+        Let a request through, or fail fast if the endpoint's breaker is open.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a probe in flight
+        """
+        if not self.threshold:
+            return
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None or breaker.opened_at is None:
+                return
+            remaining = breaker.opened_at + self.reset_timeout - time.monotonic()
+            if remaining <= 0 and not breaker.probing:
+                breaker.probing = True
+                logger.info("Circuit for %s half-open: sending a probe request", endpoint)
+                return
+        raise CircuitOpenError(
+            f"Jira is failing on {endpoint} ({breaker.failures} consecutive errors); "
+            f"not sending requests for another {max(remaining, 0):.0f}s"
+        )
+
+    def record(self, endpoint: str, ok: bool) -> None:
+        """Record the outcome of a request that was let through."""
+        if not self.threshold:
+            return
+        with self._lock:
+            breaker = self._breakers.setdefault(endpoint, CircuitBreaker())
+            if ok:
+                if breaker.opened_at is not None:
+                    logger.info("Circuit for %s closed: Jira is responding again", endpoint)
+                breaker.failures = 0
+                breaker.opened_at = None
+                breaker.probing = False
+                return
+
+            breaker.failures += 1
+            if breaker.probing or (
+                breaker.opened_at is None and breaker.failures >= self.threshold
+            ):
+                if not breaker.probing:
+                    breaker.trips += 1
+                    logger.warning(
+                        "Circuit for %s opened after %s consecutive errors",
+                        endpoint,
+                        breaker.failures,
+                    )
+                breaker.opened_at = time.monotonic()
+                breaker.probing = False
+
+    def format_summary(self) -> str:
+        """Render breaker states for jira_server_stats."""
+        if not self.threshold:
+            return "Circuit breakers: disabled"
+        with self._lock:
+            trips = sum(b.trips for b in self._breakers.values())
+            lines = [f"Circuit breakers: {trips} trip(s)"]
+            now = time.monotonic()
+            for endpoint, breaker in sorted(self._breakers.items()):
+                if breaker.opened_at is None:
+                    continue
+                remaining = breaker.opened_at + self.reset_timeout - now
+                state = "half-open" if breaker.probing or remaining <= 0 else "open"
+                lines.append(
+                    f"  {endpoint}: {state} after {breaker.failures} error(s)"
+                    + (f", probe in {remaining:.0f}s" if remaining > 0 else "")
+                )
+            if len(lines) == 1:
+                lines[0] += ", all closed"
+            return "\n".join(lines)
+
+
+def track_stale_reads() -> List[str]:
+    """Start collecting stale cache answers given in the current context; returns the list."""
+    reads: List[str] = []
+    _stale_reads.set(reads)
+    return reads
+
+
+def note_stale_read(description: str) -> None:
+    """Record that a read was answered from cache (no-op unless tracking)."""
+    reads = _stale_reads.get()
+    if reads is not None:
+        reads.append(description)
+
+
+def format_stale_notice(reads: List[str]) -> str:
+    """One-line warning to put in front of a tool reply that used stale data."""
+    return f"⚠ Jira is slow or unavailable; answered from cached data: {'; '.join(reads)}\n"
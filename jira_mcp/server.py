@@ -1,53 +1,105 @@
 #!/usr/bin/env python3
 """Simple Jira MCP Server - Clean, reliable Jira integration for Claude Desktop."""
 
+from __future__ import annotations
+
 import argparse
 import asyncio
 import json
 import logging
+import os
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-from jira_mcp.config import get_instance_config
-from jira_mcp.jira_client import JiraClient
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stderr)],
-)
+from jira_mcp.adf import build_update_fields, extract_text_from_adf
+from jira_mcp.jobs import RUNNING, Job, JobCancelled, current_job
+from jira_mcp.jobs import manager as job_manager
+from jira_mcp.metrics import registry as metrics
+from jira_mcp.records import IssueRecord
+from jira_mcp.tracing import tracer
+from jira_mcp.validation import Validator, compile_schema
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: httpx and the client are only needed on the first tool call
+    from jira_mcp.agile import BoardIssues, SprintReport
+    from jira_mcp.batch import Operation
+    from jira_mcp.changes import IssueChange
+    from jira_mcp.config import JiraInstanceConfig
+    from jira_mcp.settings import InstanceConfig
+    from jira_mcp.cycle_time import CycleTimeReport
+    from jira_mcp.similar import SimilarIssue
+    from jira_mcp.jira_client import JiraClient
+    from jira_mcp.worklog import TimeReport
+
+# Handlers are installed by setup_logging() when the server starts
 logger = logging.getLogger(__name__)
 
-# Global Jira client instance
+# Global Jira client instance, built from instance_config on the first tool call
 jira_client: Optional[JiraClient] = None
+instance_config: Optional[Union[JiraInstanceConfig, InstanceConfig]] = None
+_client_lock = threading.Lock()
 
+# Optional path for a Prometheus text dump, rewritten after every tool call
+metrics_file: Optional[str] = None
 
-def format_issue_summary(issue: Dict[str, Any]) -> str:
-    """Format an issue for display in a compact, readable way."""
-    fields = issue.get("fields", {})
-    key = issue.get("key", "N/A")
-    summary = fields.get("summary", "No summary")
-    status = fields.get("status", {}).get("name", "Unknown")
-    issue_type = fields.get("issuetype", {}).get("name", "Unknown")
-    priority = fields.get("priority", {}).get("name", "None")
+# Handler for a single tool: (client, validated arguments) -> response content.
+# Handlers make blocking Jira calls and are run on a worker thread by the dispatcher.
+ToolHandler = Callable[["JiraClient", Dict[str, Any]], List[TextContent]]
 
-    assignee_info = fields.get("assignee")
-    if assignee_info:
-        assignee = assignee_info.get("displayName", "Unassigned")
-    else:
-        assignee = "Unassigned"
 
+def get_jira_client() -> Optional[JiraClient]:
+    """
+    Return the shared Jira client, constructing it on first use.
+
+    Deferring construction keeps httpx/TLS setup off the startup path, so the
+    server can answer list_tools before any client exists.
+
+    Returns:
+        The shared JiraClient, or None if no configuration has been loaded
+    """
+    global jira_client
+    if jira_client is None and instance_config is not None:
+        with _client_lock:
+            if jira_client is None:
+                from jira_mcp.jira_client import JiraClient
+
+                jira_client = JiraClient(instance_config)
+                logger.info("Jira client initialized successfully")
+    return jira_client
+
+
+def current_session() -> Any:
+    """
+    The MCP session of the tool call being handled, or None outside a request.
+
+    Usable from handler threads: the request context is copied to them along with
+    the other context variables.
+    """
+    from mcp.server.lowlevel.server import request_ctx
+
+    context = request_ctx.get(None)
+    return context.session if context is not None else None
+
+
+def format_issue_summary(issue: Union[Dict[str, Any], IssueRecord]) -> str:
+    """Format an issue (raw dict or IssueRecord) for display in a compact, readable way."""
+    record = issue if isinstance(issue, IssueRecord) else IssueRecord.from_json(issue)
     return (
-        f"[{key}] {summary}\n"
-        f"  Type: {issue_type} | Status: {status} | Priority: {priority} | Assignee: {assignee}"
+        f"[{record.key}] {record.summary or 'No summary'}\n"
+        f"  Type: {record.issue_type or 'Unknown'} | Status: {record.status or 'Unknown'} | "
+        f"Priority: {record.priority or 'None'} | Assignee: {record.assignee or 'Unassigned'}"
     )
 
 
+# Comments shown per page by jira_get_issue
+COMMENTS_PAGE_SIZE = 5
+
+
 def format_issue_detailed(issue: Dict[str, Any]) -> str:
     """Format an issue with full details."""
     fields = issue.get("fields", {})
@@ -64,7 +116,8 @@ def format_issue_detailed(issue: Dict[str, Any]) -> str:
     # Assignee
     assignee_info = fields.get("assignee")
     if assignee_info:
-        lines.append(f"Assignee: {assignee_info.get('displayName', 'Unknown')} ({assignee_info.get('emailAddress', '')})")
+        name = assignee_info.get('displayName', 'Unknown')
+        lines.append(f"Assignee: {name} ({assignee_info.get('emailAddress', '')})")
     else:
         lines.append("Assignee: Unassigned")
 
@@ -89,11 +142,31 @@ def format_issue_detailed(issue: Dict[str, Any]) -> str:
             desc_text = str(description)
         lines.append(f"\nDescription:\n{desc_text}")
 
-    # Comments
-    comments = fields.get("comment", {}).get("comments", [])
+    # Attachments (IDs are what jira_download_attachment takes)
+    attachments = fields.get("attachment") or []
+    if attachments:
+        lines.append(f"\nAttachments ({len(attachments)}):")
+        for attachment in attachments:
+            lines.append(
+                f"  [{attachment.get('id')}] {attachment.get('filename', 'unnamed')} "
+                f"({format_size(attachment.get('size'))})"
+            )
+
+    # Comments: the newest page, oldest first; startAt counts back from the newest comment
+    comment_page = fields.get("comment") or {}
+    comments = (comment_page.get("comments") or [])[-COMMENTS_PAGE_SIZE:]
+    total = comment_page.get("total", len(comments))
+    start = comment_page.get("startAt", 0)
     if comments:
-        lines.append(f"\nComments ({len(comments)}):")
-        for comment in comments[-5:]:  # Show last 5 comments
+        if len(comments) >= total:
+            lines.append(f"\nComments ({total}):")
+        else:
+            shown = f"{start + 1}-{start + len(comments)} newest of {total}"
+            if start + len(comments) < total:
+                next_page = start // COMMENTS_PAGE_SIZE + 2
+                shown += f"; comments_page={next_page} for older"
+            lines.append(f"\nComments ({shown}):")
+        for comment in comments:
             author = comment.get("author", {}).get("displayName", "Unknown")
             created = comment.get("created", "")
             body = comment.get("body", {})
@@ -103,30 +176,319 @@ def format_issue_detailed(issue: Dict[str, Any]) -> str:
                 body_text = str(body)
             lines.append(f"  [{author} @ {created}]")
             lines.append(f"  {body_text[:200]}...")
+    elif start and total:
+        lines.append(f"\nComments: no more (the issue has {total})")
+
+    return "\n".join(lines)
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Format a duration in seconds as a compact human-readable string."""
+    if seconds is None:
+        return "N/A"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 86400:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
+
+
+def format_cycle_time_report(report: CycleTimeReport, jql: str) -> str:
+    """Format aggregate cycle-time statistics for display."""
+    if not report.issue_count and not report.errors:
+        return f"No issues found matching: {jql}"
+
+    lines = [
+        f"Cycle time for {report.issue_count} issue(s) ({report.resolved_count} resolved)",
+        f"Query: {jql}",
+    ]
+
+    if report.resolved_count:
+        lines.append(
+            f"\nLead time (created → resolved): "
+            f"p50 {format_duration(report.lead_time.quantile(0.5))} | "
+            f"p90 {format_duration(report.lead_time.quantile(0.9))} | "
+            f"mean {format_duration(report.lead_time.mean)}"
+        )
+
+    if report.time_in_status:
+        lines.append("\nTime in status:")
+        by_total = sorted(
+            report.time_in_status.items(), key=lambda item: item[1].total, reverse=True
+        )
+        for status, histogram in by_total:
+            lines.append(
+                f"  - {status}: p50 {format_duration(histogram.quantile(0.5))} | "
+                f"p90 {format_duration(histogram.quantile(0.9))} | "
+                f"issues {histogram.count}"
+            )
+
+    slowest = report.slowest
+    if slowest:
+        lines.append("\nSlowest resolved issues:")
+        for lead_time, key, durations in slowest:
+            longest = max(durations.items(), key=lambda item: item[1])
+            lines.append(
+                f"  [{key}] {format_duration(lead_time)} "
+                f"(longest in {longest[0]}: {format_duration(longest[1])})"
+            )
+
+    if report.errors:
+        lines.append(f"\nFailed to read history for {len(report.errors)} issue(s):")
+        for error in report.errors[:5]:
+            lines.append(f"  - {error}")
+
+    return "\n".join(lines)
+
+
+def format_size(size: Optional[int]) -> str:
+    """Format a byte count as a compact human-readable string."""
+    if size is None:
+        return "unknown size"
+    if size < 1024:
+        return f"{size} B"
+    value = float(size)
+    for unit in ("KB", "MB", "GB"):
+        value /= 1024
+        if value < 1024 or unit == "GB":
+            break
+    return f"{value:.1f} {unit}"
+
+
+def format_hours(seconds: float) -> str:
+    """Format logged time in hours."""
+    return f"{seconds / 3600:.1f}h"
+
+
+def format_time_report(report: TimeReport, jql: str, since: str, until: str) -> str:
+    """Format aggregate worklog totals for display."""
+    if not report.worklog_count and not report.errors:
+        return f"No time logged between {since} and {until} on issues matching: {jql}"
+
+    lines = [
+        f"Time logged {since} → {until}: {format_hours(report.total_seconds)} "
+        f"in {report.worklog_count} worklog(s) across {report.issue_count} issue(s) scanned",
+        f"Query: {jql}",
+    ]
+
+    if report.by_user:
+        lines.append("\nBy user:")
+        for user, seconds in sorted(report.by_user.items(), key=lambda item: item[1], reverse=True):
+            lines.append(f"  - {user}: {format_hours(seconds)}")
+
+    top_issues = report.top_issues
+    if top_issues:
+        lines.append("\nBy issue:")
+        for seconds, key in top_issues:
+            lines.append(f"  [{key}] {format_hours(seconds)}")
+
+    if report.errors:
+        lines.append(f"\nFailed to read worklogs for {len(report.errors)} issue(s):")
+        for error in report.errors[:5]:
+            lines.append(f"  - {error}")
+
+    return "\n".join(lines)
+
+
+def format_points(value: float) -> str:
+    """Format an estimate total without a trailing .0."""
+    return f"{value:g}"
+
+
+def format_board_issues(result: BoardIssues) -> str:
+    """Format a board's sprint or backlog issues grouped by column."""
+    board = result.board
+    unit = result.columns.unit
+    lines = [f"Board {board.get('name')} (ID {board.get('id')}): {result.source}"]
+    if not result.total:
+        lines.append("No issues.")
+    for column, issues in result.by_column.items():
+        if not issues:
+            continue
+        lines.append(f"\n{column} ({len(issues)}):")
+        for issue in issues:
+            fields = issue.get("fields", {})
+            status = (fields.get("status") or {}).get("name", "Unknown")
+            assignee = (fields.get("assignee") or {}).get("displayName", "Unassigned")
+            details = [status, assignee]
+            if unit != "issues":
+                value = fields.get(result.columns.estimation_field)
+                details.append(
+                    f"{format_points(value)} {unit}" if value is not None else "unestimated"
+                )
+            lines.append(f"  [{issue['key']}] {fields.get('summary', '')} ({', '.join(details)})")
+
+    if result.other_boards:
+        others = ", ".join(f"{b.get('name')} (ID {b.get('id')})" for b in result.other_boards)
+        lines.append(f"\nOther boards for this project: {others}")
+    return "\n".join(lines)
+
+
+def format_sprint_report(report: SprintReport) -> str:
+    """Format a sprint's progress, remaining work and burndown."""
+    sprint = report.sprint
+    unit = report.columns.unit
+    lines = [f"{sprint.get('name')} ({sprint.get('state')}) on board {report.board.get('name')}"]
+    if report.start and report.end:
+        lines.append(
+            f"Dates: {report.start:%Y-%m-%d} → {report.end:%Y-%m-%d} "
+            f"({report.elapsed_days:.1f} day(s) elapsed, {report.days_left:.1f} left)"
+        )
+    if sprint.get("goal"):
+        lines.append(f"Goal: {sprint['goal']}")
+    if not report.issue_count:
+        lines.append("No issues in this sprint.")
+        return "\n".join(lines)
+
+    percent = report.done / report.total * 100 if report.total else 0.0
+    lines.append(
+        f"\nDone: {format_points(report.done)} of {format_points(report.total)} {unit} "
+        f"({percent:.0f}%), {report.done_count} of {report.issue_count} issue(s)"
+    )
+    if report.unestimated:
+        lines.append(f"Unestimated: {report.unestimated} issue(s)")
+
+    lines.append("\nBy column:")
+    for column, (count, estimate) in report.by_column.items():
+        lines.append(f"  - {column}: {count:.0f} issue(s), {format_points(estimate)} {unit}")
+
+    if report.remaining_by_assignee:
+        lines.append("\nRemaining by assignee:")
+        by_estimate = sorted(
+            report.remaining_by_assignee.items(), key=lambda item: item[1][1], reverse=True
+        )
+        for name, (count, estimate) in by_estimate:
+            lines.append(f"  - {name}: {count:.0f} issue(s), {format_points(estimate)} {unit}")
+
+    if report.burndown:
+        lines.append(f"\nBurndown ({unit} remaining at the end of each day):")
+        lines.append("  Day         Remaining  Ideal")
+        for day, remaining, ideal in report.burndown:
+            lines.append(f"  {day:%Y-%m-%d}  {remaining:>9g}  {ideal:>5.1f}")
+
+    projected = report.projected_remaining
+    if projected is not None:
+        if projected <= 0:
+            lines.append("\nProjection: on track to finish at the current burn rate")
+        else:
+            lines.append(
+                f"\nProjection: about {projected:.1f} {unit} left at the end date "
+                "at the current burn rate"
+            )
+    lines.append("\nScope is the sprint's current issues; removed issues are not counted.")
+    return "\n".join(lines)
+
+
+def format_batch(operations: List[Operation], elapsed: float) -> str:
+    """Format the outcome of a batch, one line per operation in the order given."""
+    counts = {state: 0 for state in ("succeeded", "failed", "skipped")}
+    for op in operations:
+        counts[op.state or "skipped"] += 1
 
+    lines = [
+        f"Batch of {len(operations)} operation(s) in {elapsed:.2f}s: "
+        f"{counts['succeeded']} succeeded, {counts['failed']} failed, "
+        f"{counts['skipped']} skipped"
+    ]
+    for op in operations:
+        if op.state == "succeeded":
+            result = ", ".join(
+                f"{key}={value}" for key, value in (op.result or {}).items() if value is not None
+            )
+            lines.append(f"  ✓ {op.id} ({op.tool}): {result}")
+        elif op.state == "failed":
+            lines.append(f"  ✗ {op.id} ({op.tool}): {op.error}")
+        else:
+            lines.append(f"  - {op.id} ({op.tool}) skipped: {op.error}")
     return "\n".join(lines)
 
 
-def extract_text_from_adf(adf: Dict[str, Any]) -> str:
-    """Extract plain text from Atlassian Document Format."""
-    if not isinstance(adf, dict):
-        return str(adf)
+def _format_field_value(value: Any) -> str:
+    if value is None or value == ():
+        return "none"
+    if isinstance(value, tuple):
+        return ", ".join(value)
+    return str(value)
+
+
+def format_changes(changes: List[IssueChange], more: bool, since: Optional[str]) -> str:
+    """Format the issues reported by a change feed poll, with field-level diffs."""
+    if not changes:
+        text = "No changes since the last call."
+        return f"{text} (More updates are pending; call again.)" if more else text
+
+    new = sum(1 for change in changes if change.is_new)
+    deleted = sum(1 for change in changes if change.is_deleted)
+    deleted_text = f", {deleted} deleted" if deleted else ""
+    changed = len(changes) - new - deleted
+    lines = [f"{changed} issue(s) changed, {new} new to this feed{deleted_text}:"]
+    for change in changes:
+        record = change.record
+        if change.is_deleted:
+            lines.append(f"\n[{record.key}] deleted")
+        elif change.is_new:
+            lines.append(f"\n{format_issue_summary(record)}\n  Updated: {record.updated}")
+        else:
+            lines.append(f"\n[{record.key}] updated {record.updated}")
+            if not change.changes and not change.notes:
+                lines.append("  (no tracked field changed; e.g. description or comments)")
+            for name, old, value in change.changes:
+                lines.append(f"  {name}: {_format_field_value(old)} → {_format_field_value(value)}")
+        lines.extend(f"  - {note}" for note in change.notes)
+
+    if since:
+        lines.append(f"\nWatermark: {since}")
+    if more:
+        lines.append("More updates are pending; call again to continue.")
+    return "\n".join(lines)
 
-    text_parts = []
 
-    def extract(node):
-        if isinstance(node, dict):
-            if node.get("type") == "text":
-                text_parts.append(node.get("text", ""))
-            if "content" in node:
-                for child in node["content"]:
-                    extract(child)
-        elif isinstance(node, list):
-            for item in node:
-                extract(item)
+def format_similar(matches: List[SimilarIssue], project_key: str, indexed: int) -> str:
+    """Format issues ranked by similarity, best first, with the words they share."""
+    if not matches:
+        return f"No similar issues among {indexed} indexed in {project_key}."
+    lines = [f"{len(matches)} similar issue(s) among {indexed} indexed in {project_key}:"]
+    for match in matches:
+        status = f" [{match.status}]" if match.status else ""
+        lines.append(f"\n{match.score:.2f} [{match.key}]{status} {match.summary}")
+        if match.shared:
+            lines.append(f"  Shared words: {', '.join(match.shared)}")
+    return "\n".join(lines)
+
 
-    extract(adf)
-    return " ".join(text_parts)
+# Optional argument of bulk tools that may run as a background job
+BACKGROUND_PROPERTY: Dict[str, Any] = {
+    "type": "boolean",
+    "description": (
+        "Run as a background job: return a job ID immediately and poll jira_job_status "
+        "for progress and the result (default: false)"
+    ),
+    "default": False,
+}
+
+
+def format_job(job: Job, detailed: bool = True) -> str:
+    """Format a background job's state, progress and (when finished) its result."""
+    progress = f"{job.done}/{job.total}" if job.total is not None else f"{job.done}"
+    elapsed = f", {job.elapsed:.1f}s" if job.elapsed is not None else ""
+    errors = f", {job.error_count} error(s)" if job.error_count else ""
+    state = "cancelling" if job.state == RUNNING and job.cancel_requested else job.state
+    summary = f"Job {job.id} ({job.tool}): {state} | {progress} item(s) done{errors}{elapsed}"
+    if not detailed:
+        return summary
+
+    lines = [summary]
+    if job.result is not None:
+        lines.append(f"\nResult:\n{job.result}")
+        return "\n".join(lines)
+
+    if job.partial_results:
+        lines.append("\nRecent results:")
+        lines.extend(f"  - {partial}" for partial in list(job.partial_results)[-10:])
+    if job.errors:
+        lines.append("\nRecent errors:")
+        lines.extend(f"  - {error}" for error in list(job.errors)[-10:])
+    return "\n".join(lines)
 
 
 # Define MCP tools
@@ -149,6 +511,7 @@ TOOLS: List[Tool] = [
                     "type": "integer",
                     "description": "Maximum number of results to return (default: 50)",
                     "default": 50,
+                    "minimum": 1,
                 },
             },
             "required": ["jql"],
@@ -156,7 +519,9 @@ TOOLS: List[Tool] = [
     ),
     Tool(
         name="jira_get_issue",
-        description="Get detailed information about a specific Jira issue by its key (e.g., 'PROJ-123')",
+        description=(
+            "Get detailed information about a specific Jira issue by its key (e.g., 'PROJ-123')"
+        ),
         inputSchema={
             "type": "object",
             "properties": {
@@ -164,6 +529,15 @@ TOOLS: List[Tool] = [
                     "type": "string",
                     "description": "Issue key (e.g., 'PROJ-123')",
                 },
+                "comments_page": {
+                    "type": "integer",
+                    "description": (
+                        "Page of comments to show, newest first, 5 per page "
+                        "(default: 1, the newest; 2 for the five before them, ...)"
+                    ),
+                    "default": 1,
+                    "minimum": 1,
+                },
             },
             "required": ["issue_key"],
         },
@@ -205,12 +579,69 @@ TOOLS: List[Tool] = [
                 },
                 "parent": {
                     "type": "string",
-                    "description": "Parent issue key for Epic/subtask relationships (e.g., 'EPIC-123') (optional)",
+                    "description": (
+                        "Parent issue key for Epic/subtask relationships (e.g., 'EPIC-123') "
+                        "(optional)"
+                    ),
+                },
+                "check_duplicates": {
+                    "type": "boolean",
+                    "description": (
+                        "Look for similar existing issues in the project first (as "
+                        "jira_find_similar does) and do not create the issue if any is a "
+                        "likely duplicate; they are listed instead. The check is skipped "
+                        "while the project is first being indexed (default: false)"
+                    ),
+                    "default": False,
                 },
             },
             "required": ["project_key", "summary", "issue_type"],
         },
     ),
+    Tool(
+        name="jira_find_similar",
+        description=(
+            "Find existing issues similar to a proposed summary and description, best match "
+            "first, to avoid filing duplicates. Answers from a local index of the project's "
+            "issues instead of running text searches. The first call for a project starts "
+            "building the index; for a large project it asks to be called again shortly."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": "Project to look in (e.g., 'PROJ')",
+                },
+                "summary": {
+                    "type": "string",
+                    "description": "Proposed issue summary/title",
+                    "minLength": 1,
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Proposed issue description (optional)",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of issues to return (default: 5)",
+                    "default": 5,
+                    "minimum": 1,
+                },
+                "min_score": {
+                    "type": "number",
+                    "description": (
+                        "Leave out issues with a similarity below this, from 0 to 1 "
+                        "(default: 0.1)"
+                    ),
+                    "default": 0.1,
+                    "minimum": 0,
+                    "maximum": 1,
+                },
+            },
+            "required": ["project_key", "summary"],
+        },
+    ),
     Tool(
         name="jira_update_issue",
         description="Update fields on an existing Jira issue",
@@ -240,12 +671,76 @@ TOOLS: List[Tool] = [
                 },
                 "parent": {
                     "type": "string",
-                    "description": "Parent issue key for Epic/subtask relationships (e.g., 'EPIC-123') (optional)",
+                    "description": (
+                        "Parent issue key for Epic/subtask relationships (e.g., 'EPIC-123') "
+                        "(optional)"
+                    ),
                 },
             },
             "required": ["issue_key"],
         },
     ),
+    Tool(
+        name="jira_update_issues",
+        description=(
+            "Apply the same field changes to many issues, given by key and/or JQL. Current "
+            "values are read first and only issues (and fields) that actually differ are "
+            "written, concurrently. Use for relabeling, reprioritizing or moving issues "
+            "under an epic in bulk; add_labels/remove_labels edit each issue's labels."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Issues to update (e.g., ['PROJ-1', 'PROJ-2'])",
+                },
+                "jql": {
+                    "type": "string",
+                    "description": "JQL selecting issues to update (in addition to issue_keys)",
+                },
+                "fields": {
+                    "type": "object",
+                    "description": "Values to set; only the fields given are changed",
+                    "properties": {
+                        "summary": {"type": "string", "description": "New summary/title"},
+                        "description": {"type": "string", "description": "New description"},
+                        "priority": {"type": "string", "description": "New priority name"},
+                        "labels": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Replacement labels list",
+                        },
+                        "parent": {"type": "string", "description": "New parent issue key"},
+                    },
+                    "additionalProperties": False,
+                },
+                "add_labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Labels to add to each issue's labels (optional)",
+                },
+                "remove_labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Labels to remove from each issue's labels (optional)",
+                },
+                "max_issues": {
+                    "type": "integer",
+                    "description": "Maximum number of issues taken from the JQL (default: 1000)",
+                    "default": 1000,
+                    "minimum": 1,
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "Report what would change without writing (default: false)",
+                    "default": False,
+                },
+                "background": BACKGROUND_PROPERTY,
+            },
+        },
+    ),
     Tool(
         name="jira_add_comment",
         description="Add a comment to a Jira issue",
@@ -334,6 +829,7 @@ TOOLS: List[Tool] = [
                     "type": "integer",
                     "description": "Maximum number of results to return (default: 100)",
                     "default": 100,
+                    "minimum": 1,
                 },
             },
             "required": ["epic_key"],
@@ -367,6 +863,7 @@ TOOLS: List[Tool] = [
                     "type": "integer",
                     "description": "Maximum number of results to return (default: 50)",
                     "default": 50,
+                    "minimum": 1,
                 },
             },
             "required": ["query"],
@@ -384,7 +881,9 @@ TOOLS: List[Tool] = [
                 },
                 "account_id": {
                     "type": "string",
-                    "description": "User's account ID (use jira_search_users to find it) (optional)",
+                    "description": (
+                        "User's account ID (use jira_search_users to find it) (optional)"
+                    ),
                 },
             },
             "required": ["issue_key"],
@@ -406,11 +905,17 @@ TOOLS: List[Tool] = [
                 },
                 "created": {
                     "type": "string",
-                    "description": "Creation date in ISO 8601 format (e.g., '2024-01-15T10:30:00.000+0000') (optional)",
+                    "description": (
+                        "Creation date in ISO 8601 format (e.g., '2024-01-15T10:30:00.000+0000') "
+                        "(optional)"
+                    ),
                 },
                 "resolutiondate": {
                     "type": "string",
-                    "description": "Resolution date in ISO 8601 format (e.g., '2024-02-20T15:45:00.000+0000') (optional)",
+                    "description": (
+                        "Resolution date in ISO 8601 format (e.g., '2024-02-20T15:45:00.000+0000') "
+                        "(optional)"
+                    ),
                 },
                 "duedate": {
                     "type": "string",
@@ -420,321 +925,1560 @@ TOOLS: List[Tool] = [
             "required": ["issue_key"],
         },
     ),
-]
-
-
-async def handle_tool_call(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-    """Handle MCP tool calls and route to appropriate Jira client methods."""
-    if jira_client is None:
-        return [TextContent(type="text", text="Error: Jira client not initialized")]
-
-    try:
-        if name == "jira_search":
-            jql = arguments["jql"]
-            max_results = arguments.get("max_results", 50)
-
-            result = jira_client.search_issues(jql=jql, max_results=max_results)
-            issues = result.get("issues", [])
-            # New API returns isLast instead of total
-            total = result.get("total", len(issues))
-            is_last = result.get("isLast", True)
-
-            if not issues:
-                return [TextContent(type="text", text=f"No issues found matching: {jql}")]
-
-            output = []
-            if total > 0 and total != len(issues):
-                output.append(f"Found {total} total issue(s) (showing {len(issues)}):\n")
-            elif not is_last:
-                output.append(f"Showing {len(issues)} issue(s) (more available):\n")
-            else:
-                output.append(f"Found {len(issues)} issue(s):\n")
-
-            for issue in issues:
-                output.append(format_issue_summary(issue))
-                output.append("")
-
-            return [TextContent(type="text", text="\n".join(output))]
-
-        elif name == "jira_get_issue":
-            issue_key = arguments["issue_key"]
-
-            issue = jira_client.get_issue(issue_key)
-            output = format_issue_detailed(issue)
-
-            return [TextContent(type="text", text=output)]
-
-        elif name == "jira_create_issue":
-            project_key = arguments["project_key"]
-            summary = arguments["summary"]
-            issue_type = arguments["issue_type"]
-            description = arguments.get("description")
-            priority = arguments.get("priority")
-            labels = arguments.get("labels")
-            parent = arguments.get("parent")
-
-            result = jira_client.create_issue(
-                project_key=project_key,
-                summary=summary,
-                issue_type=issue_type,
-                description=description,
-                priority=priority,
-                labels=labels,
-                parent=parent,
-            )
-
-            issue_key = result.get("key")
-            parent_info = f"\nParent: {parent}" if parent else ""
-            return [TextContent(
-                type="text",
-                text=f"Created issue {issue_key}{parent_info}\nURL: {jira_client.base_url}/browse/{issue_key}"
-            )]
-
-        elif name == "jira_update_issue":
-            issue_key = arguments["issue_key"]
-            fields = {}
-
-            if "summary" in arguments:
-                fields["summary"] = arguments["summary"]
-            if "description" in arguments:
-                fields["description"] = {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": arguments["description"]}],
-                        }
-                    ],
-                }
-            if "priority" in arguments:
-                fields["priority"] = {"name": arguments["priority"]}
-            if "labels" in arguments:
-                fields["labels"] = arguments["labels"]
-            if "parent" in arguments:
-                fields["parent"] = {"key": arguments["parent"]}
-
-            jira_client.update_issue(issue_key, fields)
-            return [TextContent(type="text", text=f"Updated issue {issue_key}")]
-
-        elif name == "jira_add_comment":
-            issue_key = arguments["issue_key"]
-            comment = arguments["comment"]
-
-            jira_client.add_comment(issue_key, comment)
-            return [TextContent(type="text", text=f"Added comment to {issue_key}")]
-
-        elif name == "jira_transition_issue":
-            issue_key = arguments["issue_key"]
-            transition_name = arguments["transition_name"]
-
-            jira_client.transition_issue(issue_key, transition_name)
-            return [TextContent(type="text", text=f"Transitioned {issue_key} to {transition_name}")]
-
-        elif name == "jira_list_projects":
-            projects = jira_client.list_projects()
-
-            if not projects:
-                return [TextContent(type="text", text="No projects found")]
-
-            output = [f"Found {len(projects)} project(s):\n"]
-            for project in projects:
-                key = project.get("key", "N/A")
-                name = project.get("name", "Unknown")
-                project_type = project.get("projectTypeKey", "unknown")
-                output.append(f"[{key}] {name} ({project_type})")
-
-            return [TextContent(type="text", text="\n".join(output))]
-
-        elif name == "jira_link_issues":
-            inward_issue = arguments["inward_issue"]
-            outward_issue = arguments["outward_issue"]
-            link_type = arguments.get("link_type", "Relates")
-
-            jira_client.link_issues(inward_issue, outward_issue, link_type)
-            return [TextContent(
-                type="text",
-                text=f"Linked {inward_issue} to {outward_issue} with link type '{link_type}'"
-            )]
-
-        elif name == "jira_get_epic_issues":
-            epic_key = arguments["epic_key"]
-            max_results = arguments.get("max_results", 100)
-
-            issues = jira_client.get_epic_issues(epic_key, max_results)
-
-            if not issues:
-                return [TextContent(type="text", text=f"No issues found under epic {epic_key}")]
-
-            output = [f"Found {len(issues)} issue(s) under epic {epic_key}:\n"]
-            for issue in issues:
-                output.append(format_issue_summary(issue))
-                output.append("")
-
-            return [TextContent(type="text", text="\n".join(output))]
-
-        elif name == "jira_get_transitions":
-            issue_key = arguments["issue_key"]
-
-            transitions = jira_client.get_available_transitions(issue_key)
-
-            if not transitions:
-                return [TextContent(type="text", text=f"No transitions available for {issue_key}")]
-
-            output = [f"Available transitions for {issue_key}:\n"]
-            for transition in transitions:
-                name = transition.get("name", "Unknown")
-                to_status = transition.get("to", {}).get("name", "Unknown")
-                transition_id = transition.get("id", "N/A")
-                output.append(f"  - {name} → {to_status} (ID: {transition_id})")
-
-            return [TextContent(type="text", text="\n".join(output))]
-
-        elif name == "jira_search_users":
-            query = arguments["query"]
-            max_results = arguments.get("max_results", 50)
-
-            users = jira_client.search_users(query, max_results)
-
-            if not users:
-                return [TextContent(type="text", text=f"No users found matching: {query}")]
-
-            output = [f"Found {len(users)} user(s) matching '{query}':\n"]
-            for user in users:
-                display_name = user.get("displayName", "Unknown")
-                email = user.get("emailAddress", "N/A")
-                account_id = user.get("accountId", "N/A")
-                output.append(f"  - {display_name} ({email})")
-                output.append(f"    Account ID: {account_id}")
-
-            return [TextContent(type="text", text="\n".join(output))]
-
-        elif name == "jira_assign_issue":
-            issue_key = arguments["issue_key"]
-            account_id = arguments.get("account_id")
-
-            jira_client.assign_issue(issue_key, account_id)
-
-            assignee_text = f"to account {account_id}" if account_id else "(unassigned)"
-            return [TextContent(type="text", text=f"Assigned {issue_key} {assignee_text}")]
-
-        elif name == "jira_update_issue_dates":
-            issue_key = arguments["issue_key"]
-            fields = {}
-
-            # Add date fields if provided
-            if "created" in arguments:
-                fields["created"] = arguments["created"]
-            if "resolutiondate" in arguments:
-                fields["resolutiondate"] = arguments["resolutiondate"]
-            if "duedate" in arguments:
-                fields["duedate"] = arguments["duedate"]
-
-            if not fields:
-                return [TextContent(type="text", text=f"No date fields provided to update for {issue_key}")]
-
-            jira_client.update_issue(issue_key, fields)
-
-            updated_fields = ", ".join(fields.keys())
-            return [TextContent(type="text", text=f"Updated date fields on {issue_key}: {updated_fields}")]
-
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
-    except Exception as e:
-        logger.error(f"Error handling tool call {name}: {e}", exc_info=True)
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-
-async def main(instance_name: Optional[str] = None):
-    """Run the MCP server."""
-    global jira_client
-
-    # Load configuration
-    try:
-        config = get_instance_config(instance_name)
-        logger.info(f"Loaded configuration for instance: {config.instance_name}")
-    except Exception as e:
-        logger.error(f"Failed to load configuration: {e}")
-        sys.exit(1)
-
-    # Initialize Jira client
-    try:
-        jira_client = JiraClient(config)
-        logger.info("Jira client initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize Jira client: {e}")
-        sys.exit(1)
-
-    # Create MCP server
-    server = Server("jira-mcp")
-
-    # Register tool list handler
-    @server.list_tools()
-    async def list_tools() -> List[Tool]:
-        return TOOLS
-
-    # Register tool call handler
-    @server.call_tool()
-    async def call_tool(name: str, arguments: Any) -> List[TextContent]:
-        return await handle_tool_call(name, arguments)
-
-    # Run the server
-    logger.info("Starting MCP server...")
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
-
-
-def test_connection(instance_name: str):
-    """Test connection to a Jira instance."""
-    try:
-        config = get_instance_config(instance_name)
-        print(f"Testing connection to {config.instance_name} at {config.url}...")
-
-        with JiraClient(config) as client:
-            user_info = client.test_connection()
-            print(f"✓ Connected successfully!")
-            print(f"  User: {user_info.get('displayName')} ({user_info.get('emailAddress')})")
-            print(f"  Account ID: {user_info.get('accountId')}")
-
-            # List projects as additional test
-            projects = client.list_projects()
-            print(f"  Accessible projects: {len(projects)}")
-            for project in projects[:5]:  # Show first 5
-                print(f"    - [{project['key']}] {project['name']}")
-
-            if len(projects) > 5:
-                print(f"    ... and {len(projects) - 5} more")
-
-            return True
-    except Exception as e:
-        print(f"✗ Connection failed: {e}")
-        return False
-
-
-def cli():
-    """Command-line interface entry point."""
-    parser = argparse.ArgumentParser(description="Simple Jira MCP Server")
-    parser.add_argument(
-        "--instance",
-        type=str,
-        help="Jira instance name (e.g., 'positronic'). Can also use JIRA_INSTANCE env var.",
-    )
-    parser.add_argument(
-        "--test-connection",
-        type=str,
-        metavar="INSTANCE",
-        help="Test connection to specified instance and exit",
-    )
-
-    args = parser.parse_args()
-
-    if args.test_connection:
-        success = test_connection(args.test_connection)
-        sys.exit(0 if success else 1)
-
-    # Run the MCP server
-    asyncio.run(main(args.instance))
+    Tool(
+        name="jira_cycle_time",
+        description=(
+            "Compute lead time and time-in-status statistics (p50/p90) for issues matching a "
+            "JQL query. Reads each issue's changelog server-side and returns only aggregate "
+            "statistics. Example: 'project = PROJ AND resolved >= -30d'"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": "JQL query selecting the issues to analyze",
+                },
+                "max_issues": {
+                    "type": "integer",
+                    "description": "Maximum number of issues to analyze (default: 500)",
+                    "default": 500,
+                    "minimum": 1,
+                },
+                "top_n": {
+                    "type": "integer",
+                    "description": "Number of slowest issues to list (default: 10)",
+                    "default": 10,
+                    "minimum": 1,
+                },
+                "background": BACKGROUND_PROPERTY,
+            },
+            "required": ["jql"],
+        },
+    ),
+    Tool(
+        name="jira_log_work",
+        description=(
+            "Log time on one or more issues. Entries are posted concurrently, so many "
+            "worklogs can be recorded in a single call."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entries": {
+                    "type": "array",
+                    "description": "Worklogs to record",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "issue_key": {
+                                "type": "string",
+                                "description": "Issue key (e.g., 'PROJ-123')",
+                            },
+                            "time_spent": {
+                                "type": "string",
+                                "description": "Time spent in Jira notation (e.g., '1h 30m', '2d')",
+                                "minLength": 1,
+                            },
+                            "started": {
+                                "type": "string",
+                                "description": (
+                                    "When the work started: 'YYYY-MM-DD' (09:00) or "
+                                    "'YYYY-MM-DDTHH:MM' (UTC unless an offset is given). "
+                                    "Default: now"
+                                ),
+                            },
+                            "comment": {
+                                "type": "string",
+                                "description": "Worklog comment (optional)",
+                            },
+                        },
+                        "required": ["issue_key", "time_spent"],
+                    },
+                },
+                "background": BACKGROUND_PROPERTY,
+            },
+            "required": ["entries"],
+        },
+    ),
+    Tool(
+        name="jira_time_report",
+        description=(
+            "Total the time logged on issues matching a JQL query within a date window, "
+            "by user and by issue. Worklogs are aggregated server-side and only totals are "
+            "returned. Tip: add 'worklogDate >= ...' to the JQL to skip issues without time "
+            "in the window."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": "JQL query selecting the issues to include",
+                },
+                "since": {
+                    "type": "string",
+                    "description": "First day of the window, YYYY-MM-DD (default: 7 days ago)",
+                },
+                "until": {
+                    "type": "string",
+                    "description": "Last day of the window, YYYY-MM-DD (default: today)",
+                },
+                "max_issues": {
+                    "type": "integer",
+                    "description": "Maximum number of issues to scan (default: 1000)",
+                    "default": 1000,
+                    "minimum": 1,
+                },
+                "top_n": {
+                    "type": "integer",
+                    "description": "Number of issues to list by time logged (default: 10)",
+                    "default": 10,
+                    "minimum": 1,
+                },
+                "background": BACKGROUND_PROPERTY,
+            },
+            "required": ["jql"],
+        },
+    ),
+    Tool(
+        name="jira_board_issues",
+        description=(
+            "List an agile board's issues in a sprint or the backlog, grouped by board column, "
+            "with status, assignee and estimate. Give board_id or project_key (the project's "
+            "scrum board is preferred); the sprint defaults to the active one."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "integer",
+                    "description": "Board ID (optional if project_key is given)",
+                    "minimum": 1,
+                },
+                "project_key": {
+                    "type": "string",
+                    "description": "Project whose board to use (e.g., 'PROJ')",
+                },
+                "sprint_id": {
+                    "type": "integer",
+                    "description": (
+                        "Sprint to show (default: the active sprint, else the last closed one)"
+                    ),
+                },
+                "backlog": {
+                    "type": "boolean",
+                    "description": "Show the board's backlog instead of a sprint (default: false)",
+                    "default": False,
+                },
+                "jql": {
+                    "type": "string",
+                    "description": "JQL narrowing the issues, e.g. 'assignee = currentUser()'",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of issues to return (default: 200)",
+                    "default": 200,
+                    "minimum": 1,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="jira_sprint_report",
+        description=(
+            "Summarize a sprint in one call: done vs. total estimate, work per board column, "
+            "remaining work per assignee, a day-by-day burndown against the ideal line and a "
+            "projection for the end date. Computed server-side from the sprint's issues."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "integer",
+                    "description": "Board ID (optional if project_key is given)",
+                    "minimum": 1,
+                },
+                "project_key": {
+                    "type": "string",
+                    "description": "Project whose board to use (e.g., 'PROJ')",
+                },
+                "sprint_id": {
+                    "type": "integer",
+                    "description": (
+                        "Sprint to report on (default: the active sprint, else the last closed one)"
+                    ),
+                },
+            },
+        },
+    ),
+    Tool(
+        name="jira_export",
+        description=(
+            "Export all issues matching a JQL query to a local file (NDJSON, CSV or Parquet), "
+            "streaming page by page. Returns only the file path and row count. "
+            "Use for large result sets that should be analyzed outside the conversation."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": "JQL query selecting the issues to export",
+                },
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Fields to export after the issue key (default: summary, status, "
+                        "assignee, priority, issuetype, created, updated)"
+                    ),
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["ndjson", "csv", "parquet"],
+                    "description": "File format (default: ndjson; parquet requires pyarrow)",
+                    "default": "ndjson",
+                },
+                "path": {
+                    "type": "string",
+                    "description": (
+                        "Destination file inside JIRA_MCP_EXPORT_DIR (default: a "
+                        "jira-mcp-exports folder in the temp directory); relative paths are "
+                        "placed there and paths leading out of it are rejected"
+                    ),
+                },
+                "max_rows": {
+                    "type": "integer",
+                    "description": "Maximum number of issues to export (optional)",
+                    "minimum": 1,
+                },
+                "overwrite": {
+                    "type": "boolean",
+                    "description": "Replace an existing file (default: false)",
+                    "default": False,
+                },
+                "background": BACKGROUND_PROPERTY,
+            },
+            "required": ["jql"],
+        },
+    ),
+    Tool(
+        name="jira_attach_file",
+        description=(
+            "Attach a local file to an issue. The file is streamed in chunks, so large "
+            "artifacts (build logs, dumps, videos) can be uploaded without loading them "
+            "into memory."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Issue key (e.g., 'PROJ-123')",
+                },
+                "file_path": {
+                    "type": "string",
+                    "description": (
+                        "File to upload, inside JIRA_MCP_UPLOAD_DIR on the machine running "
+                        "the server; relative paths are taken from there"
+                    ),
+                },
+                "filename": {
+                    "type": "string",
+                    "description": "Name for the attachment in Jira (default: the file's name)",
+                },
+                "background": BACKGROUND_PROPERTY,
+            },
+            "required": ["issue_key", "file_path"],
+        },
+    ),
+    Tool(
+        name="jira_download_attachment",
+        description=(
+            "Download an attachment to a local file, streaming it to disk in chunks. "
+            "Attachment IDs are listed by jira_get_issue. Returns only the file path and size."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "attachment_id": {
+                    "type": "string",
+                    "description": "Attachment ID (e.g., '10001')",
+                },
+                "path": {
+                    "type": "string",
+                    "description": (
+                        "Destination file or existing directory inside JIRA_MCP_EXPORT_DIR; "
+                        "relative paths are placed there (default: the attachment's filename "
+                        "there)"
+                    ),
+                },
+                "overwrite": {
+                    "type": "boolean",
+                    "description": "Replace an existing file (default: false)",
+                    "default": False,
+                },
+                "background": BACKGROUND_PROPERTY,
+            },
+            "required": ["attachment_id"],
+        },
+    ),
+    Tool(
+        name="jira_batch",
+        description=(
+            "Run several operations in one call. Operations can reference the results of "
+            "earlier ones with '$<id>.<field>' (e.g. parent: '$epic.key', account_id: "
+            "'$alice.account_id'). Independent operations run concurrently and dependents "
+            "start as soon as their inputs are ready. Use to build an epic with its stories, "
+            "links, assignees and transitions without a tool call per step. Supported tools: "
+            "jira_create_issue (result: key, id, url), jira_update_issue (key), jira_add_comment "
+            "(key, id), jira_transition_issue (key, status), jira_link_issues (inward, outward, "
+            "type), jira_assign_issue (key, account_id), jira_get_issue (key, id, summary, "
+            "status, assignee_id, ...), jira_search_users (account_id, display_name of the first "
+            "match)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "description": "Operations to run (at most 100), in any order",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": (
+                                    "Name other operations use to reference this one's result "
+                                    "(default: op1, op2, ... by position)"
+                                ),
+                            },
+                            "tool": {
+                                "type": "string",
+                                "enum": [
+                                    "jira_create_issue",
+                                    "jira_update_issue",
+                                    "jira_add_comment",
+                                    "jira_transition_issue",
+                                    "jira_link_issues",
+                                    "jira_assign_issue",
+                                    "jira_get_issue",
+                                    "jira_search_users",
+                                ],
+                                "description": "Tool to run",
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": (
+                                    "The tool's arguments; string values may contain references"
+                                ),
+                            },
+                            "depends_on": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": (
+                                    "IDs of operations that must succeed first, in addition "
+                                    "to those referenced in arguments (optional)"
+                                ),
+                            },
+                        },
+                        "required": ["tool", "arguments"],
+                    },
+                },
+                "concurrency": {
+                    "type": "integer",
+                    "description": (
+                        "Maximum operations in flight (optional, default: the server's "
+                        "configured concurrency)"
+                    ),
+                    "minimum": 1,
+                },
+                "background": BACKGROUND_PROPERTY,
+            },
+            "required": ["operations"],
+        },
+    ),
+    Tool(
+        name="jira_changes_since",
+        description=(
+            "Report only the issues that changed since this session's previous call, with "
+            "field-level diffs (status, assignee, priority, summary, labels, ...). The first "
+            "call lists issues updated within 'since' and records a watermark; later calls "
+            "query only newer updates. Use instead of re-running searches to poll for changes."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": (
+                        "JQL limiting the issues followed, e.g. 'project = PROJ' (optional). "
+                        "Each distinct value keeps its own watermark."
+                    ),
+                },
+                "since": {
+                    "type": "string",
+                    "description": (
+                        "Window for the first call (or after reset): a relative date such as "
+                        "'-1h', '-30m', '-2d', or 'YYYY-MM-DD' (default: -1h)"
+                    ),
+                    "default": "-1h",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": (
+                        "Maximum number of updated issues to read per call (default: 100)"
+                    ),
+                    "default": 100,
+                    "minimum": 1,
+                },
+                "reset": {
+                    "type": "boolean",
+                    "description": "Discard the watermark and snapshots first (default: false)",
+                    "default": False,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="jira_job_status",
+        description=(
+            "Show the state, progress, recent partial results and errors of a background job, "
+            "and its result once finished. Without job_id, lists recent jobs."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "job_id": {
+                    "type": "string",
+                    "description": "Job ID returned when the job was started (optional)",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="jira_cancel_job",
+        description=(
+            "Cancel a background job. Queued jobs never start; running jobs stop after "
+            "the items already in flight."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "job_id": {
+                    "type": "string",
+                    "description": "Job ID returned when the job was started",
+                },
+            },
+            "required": ["job_id"],
+        },
+    ),
+    Tool(
+        name="jira_server_stats",
+        description=(
+            "Show server performance statistics: per-tool end-to-end latency, "
+            "per-endpoint HTTP latency (p50/p90/p99), status codes, bytes transferred, "
+            "cache hit rates, retries, the adaptive concurrency limit and circuit breakers"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+]
+
+
+def _tool_search(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_search."""
+    jql = arguments["jql"]
+    max_results = arguments.get("max_results", 50)
+
+    result = client.search_issues(jql=jql, max_results=max_results)
+    issues = result.get("issues", [])
+    # New API returns isLast instead of total
+    total = result.get("total", len(issues))
+    is_last = result.get("isLast", True)
+
+    if not issues:
+        return [TextContent(type="text", text=f"No issues found matching: {jql}")]
+
+    output = []
+    if total > 0 and total != len(issues):
+        output.append(f"Found {total} total issue(s) (showing {len(issues)}):\n")
+    elif not is_last:
+        output.append(f"Showing {len(issues)} issue(s) (more available):\n")
+    else:
+        output.append(f"Found {len(issues)} issue(s):\n")
+
+    for issue in issues:
+        output.append(format_issue_summary(issue))
+        output.append("")
+
+    return [TextContent(type="text", text="\n".join(output))]
+
+
+def _tool_get_issue(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_get_issue."""
+    issue_key = arguments["issue_key"]
+    page = arguments.get("comments_page", 1)
+
+    issue = client.get_issue_with_comments(
+        issue_key,
+        comments_start=(page - 1) * COMMENTS_PAGE_SIZE,
+        comments_max=COMMENTS_PAGE_SIZE,
+        allow_stale=True,
+    )
+    output = format_issue_detailed(issue)
+
+    return [TextContent(type="text", text=output)]
+
+
+def _tool_create_issue(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_create_issue."""
+    project_key = arguments["project_key"]
+    summary = arguments["summary"]
+    issue_type = arguments["issue_type"]
+    description = arguments.get("description")
+    priority = arguments.get("priority")
+    labels = arguments.get("labels")
+    parent = arguments.get("parent")
+
+    from jira_mcp import similar
+
+    skipped = ""
+    if arguments.get("check_duplicates"):
+        matches = similar.find_similar(
+            client, project_key, summary, description, min_score=similar.DUPLICATE_THRESHOLD
+        )
+        if matches is None:
+            skipped = f"\nDuplicate check skipped: {project_key.upper()} is still being indexed."
+        elif matches:
+            indexed = len(similar.get_index(project_key))
+            return [TextContent(
+                type="text",
+                text=f"Not created: possible duplicates exist.\n\n"
+                f"{format_similar(matches, project_key.upper(), indexed)}\n\n"
+                "Call again without check_duplicates to create the issue anyway."
+            )]
+
+    result = client.create_issue(
+        project_key=project_key,
+        summary=summary,
+        issue_type=issue_type,
+        description=description,
+        priority=priority,
+        labels=labels,
+        parent=parent,
+    )
+
+    issue_key = result.get("key")
+    similar.note_created(project_key, issue_key, summary, description)
+    parent_info = f"\nParent: {parent}" if parent else ""
+    return [TextContent(
+        type="text",
+        text=f"Created issue {issue_key}{parent_info}\n"
+        f"URL: {client.base_url}/browse/{issue_key}{skipped}"
+    )]
+
+
+def _tool_find_similar(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_find_similar."""
+    from jira_mcp.similar import find_similar, get_index
+
+    project_key = arguments["project_key"]
+    matches = find_similar(
+        client,
+        project_key,
+        arguments["summary"],
+        arguments.get("description"),
+        limit=arguments.get("max_results", 5),
+        min_score=arguments.get("min_score", 0.1),
+    )
+    indexed = len(get_index(project_key))
+    if matches is None:
+        return [TextContent(
+            type="text",
+            text=f"The similarity index for {project_key.upper()} is still being built "
+            f"({indexed} issues so far). Try again shortly."
+        )]
+    return [TextContent(type="text", text=format_similar(matches, project_key.upper(), indexed))]
+
+
+def _tool_update_issue(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_update_issue."""
+    issue_key = arguments["issue_key"]
+
+    client.update_issue(issue_key, build_update_fields(arguments))
+    return [TextContent(type="text", text=f"Updated issue {issue_key}")]
+
+
+def _tool_update_issues(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_update_issues."""
+    issue_keys = arguments.get("issue_keys") or []
+    jql = arguments.get("jql")
+    if not issue_keys and not jql:
+        return [TextContent(type="text", text="Error: Provide issue_keys and/or jql")]
+    patch = dict(arguments.get("fields") or {})
+    for edit in ("add_labels", "remove_labels"):
+        if arguments.get(edit):
+            patch[edit] = arguments[edit]
+    if not patch:
+        return [TextContent(type="text", text="Error: Provide fields, add_labels or remove_labels")]
+
+    from jira_mcp.jobs import report_progress, set_total
+    from jira_mcp.updates import update_issues
+
+    if not jql:
+        set_total(len(issue_keys))
+    dry_run = arguments.get("dry_run", False)
+    changed: List[str] = []
+    unchanged = 0
+    failures: List[str] = []
+    for key, changes, error in update_issues(
+        client,
+        patch,
+        issue_keys=issue_keys,
+        jql=jql,
+        max_issues=arguments.get("max_issues", 1000),
+        dry_run=dry_run,
+    ):
+        if error is not None:
+            failures.append(f"  - {key}: {error}")
+            report_progress(error=f"{key}: {error}")
+        elif changes:
+            changed.append(f"  - {key}: {', '.join(changes)}")
+            report_progress(partial=f"{key}: {', '.join(changes)}")
+        else:
+            unchanged += 1
+            report_progress()
+
+    total = len(changed) + unchanged + len(failures)
+    verb = "Would update" if dry_run else "Updated"
+    output = [f"{verb} {len(changed)} of {total} issue(s); {unchanged} already up to date"]
+    if changed:
+        # Keep the reply short when hundreds of issues change
+        output.append(f"\n{verb}:")
+        output.extend(changed[:50])
+        if len(changed) > 50:
+            output.append(f"  ... and {len(changed) - 50} more")
+    if failures:
+        output.append(f"\nFailed ({len(failures)}):")
+        output.extend(failures)
+    return [TextContent(type="text", text="\n".join(output))]
+
+
+def _tool_add_comment(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_add_comment."""
+    issue_key = arguments["issue_key"]
+    comment = arguments["comment"]
+
+    client.add_comment(issue_key, comment)
+    return [TextContent(type="text", text=f"Added comment to {issue_key}")]
+
+
+def _tool_transition_issue(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_transition_issue."""
+    issue_key = arguments["issue_key"]
+    transition_name = arguments["transition_name"]
+
+    client.transition_issue(issue_key, transition_name)
+    return [TextContent(type="text", text=f"Transitioned {issue_key} to {transition_name}")]
+
+
+def _tool_list_projects(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_list_projects."""
+    projects = client.list_projects()
+
+    if not projects:
+        return [TextContent(type="text", text="No projects found")]
+
+    output = [f"Found {len(projects)} project(s):\n"]
+    for project in projects:
+        key = project.get("key", "N/A")
+        name = project.get("name", "Unknown")
+        project_type = project.get("projectTypeKey", "unknown")
+        output.append(f"[{key}] {name} ({project_type})")
+
+    return [TextContent(type="text", text="\n".join(output))]
+
+
+def _tool_link_issues(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_link_issues."""
+    inward_issue = arguments["inward_issue"]
+    outward_issue = arguments["outward_issue"]
+    link_type = arguments.get("link_type", "Relates")
+
+    client.link_issues(inward_issue, outward_issue, link_type)
+    return [TextContent(
+        type="text",
+        text=f"Linked {inward_issue} to {outward_issue} with link type '{link_type}'"
+    )]
+
+
+def _tool_get_epic_issues(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_get_epic_issues."""
+    epic_key = arguments["epic_key"]
+    max_results = arguments.get("max_results", 100)
+
+    issues = client.get_epic_issues(epic_key, max_results)
+
+    if not issues:
+        return [TextContent(type="text", text=f"No issues found under epic {epic_key}")]
+
+    output = [f"Found {len(issues)} issue(s) under epic {epic_key}:\n"]
+    for issue in issues:
+        output.append(format_issue_summary(issue))
+        output.append("")
+
+    return [TextContent(type="text", text="\n".join(output))]
+
+
+def _tool_get_transitions(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_get_transitions."""
+    issue_key = arguments["issue_key"]
+
+    transitions = client.get_available_transitions(issue_key)
+
+    if not transitions:
+        return [TextContent(type="text", text=f"No transitions available for {issue_key}")]
+
+    output = [f"Available transitions for {issue_key}:\n"]
+    for transition in transitions:
+        name = transition.get("name", "Unknown")
+        to_status = transition.get("to", {}).get("name", "Unknown")
+        transition_id = transition.get("id", "N/A")
+        output.append(f"  - {name} → {to_status} (ID: {transition_id})")
+
+    return [TextContent(type="text", text="\n".join(output))]
+
+
+def _tool_search_users(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_search_users."""
+    query = arguments["query"]
+    max_results = arguments.get("max_results", 50)
+
+    users = client.search_users(query, max_results, allow_stale=True)
+
+    if not users:
+        return [TextContent(type="text", text=f"No users found matching: {query}")]
+
+    output = [f"Found {len(users)} user(s) matching '{query}':\n"]
+    for user in users:
+        display_name = user.get("displayName", "Unknown")
+        email = user.get("emailAddress", "N/A")
+        account_id = user.get("accountId", "N/A")
+        output.append(f"  - {display_name} ({email})")
+        output.append(f"    Account ID: {account_id}")
+
+    return [TextContent(type="text", text="\n".join(output))]
+
+
+def _tool_assign_issue(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_assign_issue."""
+    issue_key = arguments["issue_key"]
+    account_id = arguments.get("account_id")
+
+    client.assign_issue(issue_key, account_id)
+
+    assignee_text = f"to account {account_id}" if account_id else "(unassigned)"
+    return [TextContent(type="text", text=f"Assigned {issue_key} {assignee_text}")]
+
+
+def _tool_update_issue_dates(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_update_issue_dates."""
+    issue_key = arguments["issue_key"]
+    fields = {}
+
+    # Add date fields if provided
+    if "created" in arguments:
+        fields["created"] = arguments["created"]
+    if "resolutiondate" in arguments:
+        fields["resolutiondate"] = arguments["resolutiondate"]
+    if "duedate" in arguments:
+        fields["duedate"] = arguments["duedate"]
+
+    if not fields:
+        return [TextContent(type="text", text=f"No date fields provided to update for {issue_key}")]
+
+    client.update_issue(issue_key, fields)
+
+    updated_fields = ", ".join(fields.keys())
+    return [TextContent(type="text", text=f"Updated date fields on {issue_key}: {updated_fields}")]
+
+
+def _tool_cycle_time(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_cycle_time."""
+    jql = arguments["jql"]
+    max_issues = arguments.get("max_issues", 500)
+    top_n = arguments.get("top_n", 10)
+
+    from jira_mcp.cycle_time import compute_cycle_times
+
+    report = compute_cycle_times(client, jql, max_issues=max_issues, top_n=top_n)
+    return [TextContent(type="text", text=format_cycle_time_report(report, jql))]
+
+
+def _tool_log_work(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_log_work."""
+    entries = arguments["entries"]
+    if not entries:
+        return [TextContent(type="text", text="No worklog entries given")]
+
+    from jira_mcp.jobs import report_progress, set_total
+    from jira_mcp.worklog import log_work
+
+    set_total(len(entries))
+    logged_seconds = 0
+    failures = []
+    for entry, worklog, error in log_work(client, entries):
+        label = f"{entry['issue_key']} ({entry['time_spent']})"
+        if error is not None:
+            failures.append(f"  - {label}: {error}")
+            report_progress(error=f"{label}: {error}")
+        else:
+            logged_seconds += worklog.get("timeSpentSeconds", 0)
+            report_progress(partial=f"{label}: logged")
+
+    logged = len(entries) - len(failures)
+    output = [
+        f"Logged {logged} of {len(entries)} worklog(s), {format_hours(logged_seconds)} in total"
+    ]
+    if failures:
+        output.append(f"\nFailed ({len(failures)}):")
+        output.extend(failures)
+    return [TextContent(type="text", text="\n".join(output))]
+
+
+def _tool_time_report(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_time_report."""
+    from datetime import date, timedelta
+
+    from jira_mcp.worklog import compute_time_report
+
+    jql = arguments["jql"]
+    until = date.fromisoformat(arguments["until"]) if "until" in arguments else date.today()
+    since = (
+        date.fromisoformat(arguments["since"])
+        if "since" in arguments
+        else until - timedelta(days=7)
+    )
+    if since > until:
+        return [TextContent(type="text", text=f"Error: since ({since}) is after until ({until})")]
+
+    report = compute_time_report(
+        client,
+        jql,
+        since,
+        until,
+        max_issues=arguments.get("max_issues", 1000),
+        top_n=arguments.get("top_n", 10),
+    )
+    text = format_time_report(report, jql, since.isoformat(), until.isoformat())
+    return [TextContent(type="text", text=text)]
+
+
+def _tool_board_issues(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_board_issues."""
+    from jira_mcp.agile import get_board_issues
+
+    result = get_board_issues(
+        client,
+        board_id=arguments.get("board_id"),
+        project_key=arguments.get("project_key"),
+        sprint_id=arguments.get("sprint_id"),
+        backlog=arguments.get("backlog", False),
+        jql=arguments.get("jql"),
+        limit=arguments.get("max_results", 200),
+    )
+    return [TextContent(type="text", text=format_board_issues(result))]
+
+
+def _tool_sprint_report(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_sprint_report."""
+    from jira_mcp.agile import compute_sprint_report
+
+    report = compute_sprint_report(
+        client,
+        board_id=arguments.get("board_id"),
+        project_key=arguments.get("project_key"),
+        sprint_id=arguments.get("sprint_id"),
+    )
+    return [TextContent(type="text", text=format_sprint_report(report))]
+
+
+def _tool_export(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_export."""
+    from datetime import datetime
+
+    from jira_mcp.export import default_export_dir, export_issues, resolve_in_directory
+
+    fmt = arguments.get("format", "ndjson")
+    path = arguments.get("path") or f"jira-export-{datetime.now():%Y%m%d-%H%M%S}.{fmt}"
+    path = resolve_in_directory(path, default_export_dir())
+
+    rows = export_issues(
+        client,
+        arguments["jql"],
+        path,
+        fields=arguments.get("fields"),
+        fmt=fmt,
+        max_rows=arguments.get("max_rows"),
+        overwrite=arguments.get("overwrite", False),
+    )
+    size = os.path.getsize(path)
+    text = f"Exported {rows} row(s) to {path} ({fmt}, {size} bytes)"
+    return [TextContent(type="text", text=text)]
+
+
+def _tool_attach_file(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_attach_file."""
+    from jira_mcp.attachments import default_upload_dir, upload_attachment
+    from jira_mcp.export import resolve_in_directory
+
+    path = resolve_in_directory(arguments["file_path"], default_upload_dir())
+    attachment = upload_attachment(client, arguments["issue_key"], path, arguments.get("filename"))
+    text = (
+        f"Attached {attachment.get('filename')} to {arguments['issue_key']} "
+        f"({format_size(attachment.get('size'))}, attachment ID {attachment.get('id')})"
+    )
+    return [TextContent(type="text", text=text)]
+
+
+def _tool_download_attachment(
+    client: JiraClient, arguments: Dict[str, Any]
+) -> List[TextContent]:
+    """Handle jira_download_attachment."""
+    from jira_mcp.attachments import download_attachment
+    from jira_mcp.export import default_export_dir, resolve_in_directory
+
+    path = resolve_in_directory(arguments.get("path", ""), default_export_dir())
+    if not arguments.get("path"):
+        os.makedirs(path, exist_ok=True)
+
+    attachment = download_attachment(
+        client, arguments["attachment_id"], path, overwrite=arguments.get("overwrite", False)
+    )
+    text = (
+        f"Downloaded {attachment.get('filename')} to {attachment['path']} "
+        f"({format_size(attachment['written'])})"
+    )
+    return [TextContent(type="text", text=text)]
+
+
+def _tool_batch(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_batch."""
+    from jira_mcp.batch import plan_batch, run_batch
+
+    started = time.perf_counter()
+    operations = run_batch(
+        client,
+        plan_batch(arguments["operations"], TOOL_VALIDATORS),
+        arguments.get("concurrency"),
+    )
+    text = format_batch(operations, time.perf_counter() - started)
+    return [TextContent(type="text", text=text)]
+
+
+def _tool_changes_since(client: JiraClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_changes_since."""
+    from jira_mcp.changes import DEFAULT_SINCE, get_feed, reset_feed
+
+    session = current_session()
+    jql = arguments.get("jql")
+    if arguments.get("reset"):
+        reset_feed(session, jql)
+
+    feed = get_feed(session, jql)
+    changes, more = feed.poll(
+        client,
+        since=arguments.get("since", DEFAULT_SINCE),
+        limit=arguments.get("max_results", 100),
+    )
+    watermark = feed.watermark.isoformat() if feed.watermark else None
+    return [TextContent(type="text", text=format_changes(changes, more, watermark))]
+
+
+def _tool_job_status(client: Optional[JiraClient], arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_job_status."""
+    job_id = arguments.get("job_id")
+    if job_id is None:
+        jobs = job_manager.list_jobs(current_session())
+        if not jobs:
+            return [TextContent(type="text", text="No background jobs")]
+        text = "\n".join(format_job(job, detailed=False) for job in jobs)
+        return [TextContent(type="text", text=text)]
+
+    job = job_manager.get(job_id, current_session())
+    if job is None:
+        return [TextContent(type="text", text=f"Error: No job with ID {job_id}")]
+    return [TextContent(type="text", text=format_job(job))]
+
+
+def _tool_cancel_job(client: Optional[JiraClient], arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle jira_cancel_job."""
+    job = job_manager.cancel(arguments["job_id"], current_session())
+    if job is None:
+        return [TextContent(type="text", text=f"Error: No job with ID {arguments['job_id']}")]
+    return [TextContent(type="text", text=format_job(job, detailed=False))]
+
+
+def _tool_server_stats(
+    client: Optional[JiraClient], arguments: Dict[str, Any]
+) -> List[TextContent]:
+    """Handle jira_server_stats."""
+    from jira_mcp.limiter import limiter
+
+    text = f"{metrics.format_summary()}\n\n{limiter.format_summary()}"
+    if client is not None:
+        text += f"\n\n{client.breakers.format_summary()}"
+    return [TextContent(type="text", text=text)]
+
+
+# Tool name -> handler. To add a tool, append its Tool definition to TOOLS and
+# register its handler here; arguments are validated before dispatch.
+TOOL_HANDLERS: Dict[str, ToolHandler] = {
+    "jira_search": _tool_search,
+    "jira_get_issue": _tool_get_issue,
+    "jira_create_issue": _tool_create_issue,
+    "jira_find_similar": _tool_find_similar,
+    "jira_update_issue": _tool_update_issue,
+    "jira_update_issues": _tool_update_issues,
+    "jira_add_comment": _tool_add_comment,
+    "jira_transition_issue": _tool_transition_issue,
+    "jira_list_projects": _tool_list_projects,
+    "jira_link_issues": _tool_link_issues,
+    "jira_get_epic_issues": _tool_get_epic_issues,
+    "jira_get_transitions": _tool_get_transitions,
+    "jira_search_users": _tool_search_users,
+    "jira_assign_issue": _tool_assign_issue,
+    "jira_update_issue_dates": _tool_update_issue_dates,
+    "jira_cycle_time": _tool_cycle_time,
+    "jira_log_work": _tool_log_work,
+    "jira_time_report": _tool_time_report,
+    "jira_board_issues": _tool_board_issues,
+    "jira_sprint_report": _tool_sprint_report,
+    "jira_export": _tool_export,
+    "jira_attach_file": _tool_attach_file,
+    "jira_download_attachment": _tool_download_attachment,
+    "jira_batch": _tool_batch,
+    "jira_changes_since": _tool_changes_since,
+    "jira_job_status": _tool_job_status,
+    "jira_cancel_job": _tool_cancel_job,
+    "jira_server_stats": _tool_server_stats,
+}
+
+# Tools that do not talk to Jira and may run before the client is initialized
+LOCAL_TOOLS = {"jira_job_status", "jira_cancel_job", "jira_server_stats"}
+
+# Argument validators, compiled once from each tool's inputSchema
+# (read by alias, since newer MCP SDKs expose it as Tool.input_schema)
+TOOL_VALIDATORS: Dict[str, Validator] = {
+    tool.name: compile_schema(tool.model_dump(by_alias=True)["inputSchema"]) for tool in TOOLS
+}
+
+# Tools that may run as background jobs (their schema lists BACKGROUND_PROPERTY)
+BACKGROUND_TOOLS = frozenset(
+    tool.name
+    for tool in TOOLS
+    if "background" in tool.model_dump(by_alias=True)["inputSchema"].get("properties", {})
+)
+
+
+async def handle_tool_call(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle MCP tool calls, tracing each call as the root span of its HTTP requests."""
+    if not tracer.enabled:
+        return await _handle_tool_call(name, arguments)
+
+    attributes: Dict[str, Any] = {
+        "mcp.tool": name,
+        "mcp.arguments.size": len(json.dumps(arguments, default=str)),
+    }
+    if arguments and "issue_key" in arguments:
+        attributes["issue_key"] = arguments["issue_key"]
+    with tracer.span(f"tool {name}", attributes):
+        return await _handle_tool_call(name, arguments)
+
+
+async def _handle_tool_call(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Validate arguments and route MCP tool calls to their registered handler."""
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        metrics.record_tool("unknown", 0.0, error=True)
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+    arguments = arguments or {}
+    problems = TOOL_VALIDATORS[name](arguments)
+    if arguments.get("background") and name not in BACKGROUND_TOOLS:
+        problems = [*problems, f"{name} cannot run in the background"]
+    if problems:
+        metrics.record_tool(name, 0.0, error=True)
+        message = f"Error: Invalid arguments for {name}: {'; '.join(problems)}"
+        return [TextContent(type="text", text=message)]
+
+    if name not in LOCAL_TOOLS and jira_client is None and instance_config is None:
+        return [TextContent(type="text", text="Error: Jira client not initialized")]
+
+    if arguments.get("background"):
+        job = _start_job(handler, name, arguments)
+        text = (
+            f"Started job {job.id} ({name}). "
+            f"Poll jira_job_status with job_id '{job.id}' for progress and the result."
+        )
+        return [TextContent(type="text", text=text)]
+
+    started = time.perf_counter()
+    failed = False
+    try:
+        # Run blocking Jira I/O off the event loop so concurrent calls and
+        # sessions (see --transport http) are not serialized behind each other
+        return await asyncio.to_thread(_call_handler, handler, name, arguments)
+
+    except Exception as e:
+        failed = True
+        tracer.current_span().set_attribute("error", str(e))
+        logger.error("Error handling tool call %s: %s", name, e, exc_info=True)
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
+
+    finally:
+        metrics.record_tool(name, time.perf_counter() - started, error=failed)
+        if metrics_file:
+            try:
+                metrics.write_prometheus(metrics_file)
+            except OSError as e:
+                logger.warning("Failed to write metrics file %s: %s", metrics_file, e)
+
+
+def create_server() -> Server:
+    """Create the MCP server with tool listing and dispatch registered."""
+    server = Server("jira-mcp")
+
+    # Register tool list handler
+    @server.list_tools()
+    async def list_tools() -> List[Tool]:
+        return TOOLS
+
+    # Register tool call handler
+    @server.call_tool()
+    async def call_tool(name: str, arguments: Any) -> List[TextContent]:
+        return await handle_tool_call(name, arguments)
+
+    return server
+
+
+async def serve_http(
+    server: Server,
+    host: str,
+    port: int,
+    webhooks: bool = False,
+    webhook_secret: Optional[str] = None,
+    webhook_insecure: bool = False,
+) -> None:
+    """
+    Serve MCP over streamable HTTP (with SSE streaming) at http://HOST:PORT/mcp.
+
+    One process serves many concurrent sessions. Each session gets its own MCP
+    session state, while the Jira client (and its connection pool), metrics and
+    tracing are shared by all of them.
+
+    Args:
+        server: MCP server to expose
+        host: Interface to bind (use 127.0.0.1 unless clients are remote)
+        port: TCP port to listen on
+        webhooks: Also receive Jira webhooks at http://HOST:PORT/webhook
+        webhook_secret: Shared secret for webhook signature checks
+        webhook_insecure: Accept unsigned webhooks when there is no secret (default: False)
+    """
+    import contextlib
+
+    import uvicorn
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+
+    session_manager = StreamableHTTPSessionManager(app=server)
+
+    async def handle_mcp(scope: Any, receive: Any, send: Any) -> None:
+        await session_manager.handle_request(scope, receive, send)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> Any:
+        async with session_manager.run():
+            yield
+
+    routes: List[Any] = [Mount("/mcp", app=handle_mcp)]
+    if webhooks:
+        from jira_mcp.webhooks import WEBHOOK_PATH, webhook_routes
+
+        routes.extend(webhook_routes(webhook_secret, webhook_insecure))
+        logger.info("Receiving Jira webhooks on http://%s:%s%s", host, port, WEBHOOK_PATH)
+    app = Starlette(routes=routes, lifespan=lifespan)
+
+    logger.info("Starting MCP server on http://%s:%s/mcp ...", host, port)
+    config = uvicorn.Config(app, host=host, port=port, log_level="warning")
+    await uvicorn.Server(config).serve()
+
+
+def _warm_up_client() -> None:
+    """Build the client, open pooled connections and prefetch metadata (blocking)."""
+    client = get_jira_client()
+    if client is not None:
+        client.warm_up(connections=client.config.concurrency)
+
+
+async def warm_up() -> None:
+    """
+    Warm up the Jira client in the background while MCP initialization proceeds.
+
+    Failures are logged rather than raised: the first tool call retries from scratch.
+    """
+    try:
+        await asyncio.to_thread(_warm_up_client)
+    except Exception as e:
+        logger.warning("Warm-up failed: %s", e)
+
+
+def _start_job(handler: ToolHandler, name: str, arguments: Dict[str, Any]) -> Job:
+    """Queue a tool call as a background job; its metrics are recorded when it finishes."""
+
+    def run() -> str:
+        started = time.perf_counter()
+        failed = False
+        try:
+            job = current_job()
+            with tracer.span(f"job {name}", {"mcp.tool": name, "job.id": job.id if job else ""}):
+                content = _call_handler(handler, name, arguments)
+            return "\n".join(item.text for item in content)
+        except JobCancelled:
+            raise
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            metrics.record_tool(name, time.perf_counter() - started, error=failed)
+
+    return job_manager.submit(name, run, session=current_session())
+
+
+def _call_handler(handler: ToolHandler, name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Run a tool handler on the current (worker) thread, building the client if needed."""
+    from jira_mcp.resilience import format_stale_notice, track_stale_reads
+
+    client = jira_client if name in LOCAL_TOOLS else get_jira_client()
+    stale_reads = track_stale_reads()
+    content = handler(client, arguments)  # type: ignore[arg-type]
+    if stale_reads and content:
+        # Flag replies built from cached data while Jira was slow or unavailable
+        notice = format_stale_notice(stale_reads)
+        content[0] = TextContent(type="text", text=notice + content[0].text)
+    return content
+
+
+def setup_logging(
+    log_format: Optional[str] = None,
+    log_level: Optional[str] = None,
+    log_sample: Optional[int] = None,
+) -> None:
+    """
+    Install the process's log handlers, falling back to the JIRA_MCP_LOG_* env vars.
+
+    Exits if the format or level is not recognised.
+    """
+    from jira_mcp.logs import configure_logging
+
+    try:
+        configure_logging(
+            level=log_level or os.getenv("JIRA_MCP_LOG_LEVEL") or "INFO",
+            fmt=log_format or os.getenv("JIRA_MCP_LOG_FORMAT") or "text",
+            sample_every=log_sample or int(os.getenv("JIRA_MCP_LOG_SAMPLE") or 1),
+        )
+    except ValueError as e:
+        print(f"Invalid logging configuration: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+async def main(
+    instance_name: Optional[str] = None,
+    metrics_path: Optional[str] = None,
+    trace_file: Optional[str] = None,
+    trace_otlp_endpoint: Optional[str] = None,
+    transport: str = "stdio",
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    config_file: Optional[str] = None,
+    warm_up_client: bool = False,
+    webhook_port: Optional[int] = None,
+    webhook_secret: Optional[str] = None,
+    log_format: Optional[str] = None,
+    log_level: Optional[str] = None,
+    log_sample: Optional[int] = None,
+    webhook_insecure: bool = False,
+    max_jobs: Optional[int] = None,
+):
+    """Run the MCP server."""
+    global instance_config, metrics_file
+
+    setup_logging(log_format, log_level, log_sample)
+    metrics_file = metrics_path or os.getenv("JIRA_MCP_METRICS_FILE")
+    tracer.configure(
+        jsonl_path=trace_file or os.getenv("JIRA_MCP_TRACE_FILE"),
+        otlp_endpoint=trace_otlp_endpoint or os.getenv("JIRA_MCP_TRACE_OTLP_ENDPOINT"),
+    )
+    max_jobs = max_jobs or int(os.getenv("JIRA_MCP_MAX_JOBS") or 0)
+    if max_jobs:
+        job_manager.configure(max_jobs)
+
+    # Load configuration; the Jira client itself is built on the first tool call
+    from jira_mcp.settings import load_instance_config
+
+    try:
+        instance_config = load_instance_config(instance_name, config_file)
+        logger.info("Loaded configuration for instance: %s", instance_config.instance_name)
+    except Exception as e:
+        logger.error("Failed to load configuration: %s", e)
+        sys.exit(1)
+
+    # Optionally pay DNS, TLS and auth costs now instead of on the first tool call
+    warm_up_task = None
+    if warm_up_client or os.getenv("JIRA_MCP_WARM_UP", "").lower() in ("1", "true", "yes"):
+        warm_up_task = asyncio.create_task(warm_up())
+
+    # Create MCP server
+    server = create_server()
+
+    # Optionally receive Jira webhooks, on the MCP port or a port of their own
+    webhook_port = webhook_port or int(os.getenv("JIRA_MCP_WEBHOOK_PORT") or 0) or None
+    webhook_secret = webhook_secret or os.getenv("JIRA_MCP_WEBHOOK_SECRET")
+    webhook_insecure = webhook_insecure or os.getenv(
+        "JIRA_MCP_WEBHOOK_INSECURE", ""
+    ).lower() in ("1", "true", "yes")
+    if webhook_port and not webhook_secret and not webhook_insecure:
+        logger.error(
+            "Webhooks need --webhook-secret (or JIRA_MCP_WEBHOOK_SECRET); "
+            "pass --webhook-insecure to accept unsigned webhooks"
+        )
+        sys.exit(1)
+    shared_port = transport == "http" and webhook_port == port
+    webhook_task = None
+    if webhook_port and not shared_port:
+        from jira_mcp.webhooks import serve_webhooks
+
+        webhook_task = asyncio.create_task(
+            serve_webhooks(host, webhook_port, webhook_secret, webhook_insecure)
+        )
+
+    # Run the server; background jobs are cancelled when it stops
+    try:
+        if transport == "http":
+            await serve_http(
+                server,
+                host,
+                port,
+                webhooks=shared_port,
+                webhook_secret=webhook_secret,
+                webhook_insecure=webhook_insecure,
+            )
+            return
+
+        from mcp.server.stdio import stdio_server
+
+        logger.info("Starting MCP server...")
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        for task in (warm_up_task, webhook_task):
+            if task is not None:
+                task.cancel()
+        job_manager.shutdown()
+
+
+def test_connection(instance_name: str, config_file: Optional[str] = None):
+    """Test connection to a Jira instance."""
+    from jira_mcp.jira_client import JiraClient
+    from jira_mcp.settings import load_instance_config
+
+    try:
+        config = load_instance_config(instance_name, config_file)
+        print(f"Testing connection to {config.instance_name} at {config.url}...")
+
+        with JiraClient(config) as client:
+            user_info = client.test_connection()
+            print("✓ Connected successfully!")
+            print(f"  User: {user_info.get('displayName')} ({user_info.get('emailAddress')})")
+            print(f"  Account ID: {user_info.get('accountId')}")
+
+            # List projects as additional test
+            projects = client.list_projects()
+            print(f"  Accessible projects: {len(projects)}")
+            for project in projects[:5]:  # Show first 5
+                print(f"    - [{project['key']}] {project['name']}")
+
+            if len(projects) > 5:
+                print(f"    ... and {len(projects) - 5} more")
+
+            return True
+    except Exception as e:
+        print(f"✗ Connection failed: {e}")
+        return False
+
+
+def cli():
+    """Command-line interface entry point."""
+    parser = argparse.ArgumentParser(description="Simple Jira MCP Server")
+    parser.add_argument(
+        "--instance",
+        type=str,
+        help="Jira instance name (e.g., 'positronic'). Can also use JIRA_INSTANCE env var.",
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        metavar="PATH",
+        help="TOML file describing instances and tuning knobs. Can also use JIRA_MCP_CONFIG "
+        "env var; ~/.config/jira-mcp/config.toml is read if it exists.",
+    )
+    parser.add_argument(
+        "--test-connection",
+        type=str,
+        metavar="INSTANCE",
+        help="Test connection to specified instance and exit",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=str,
+        metavar="PATH",
+        help="Write Prometheus text metrics to PATH after each tool call. "
+        "Can also use JIRA_MCP_METRICS_FILE env var.",
+    )
+    parser.add_argument(
+        "--trace-file",
+        type=str,
+        metavar="PATH",
+        help="Append tracing spans as JSON lines to PATH. "
+        "Can also use JIRA_MCP_TRACE_FILE env var.",
+    )
+    parser.add_argument(
+        "--trace-otlp",
+        type=str,
+        metavar="ENDPOINT",
+        help="Export tracing spans to an OTLP/HTTP collector (requires opentelemetry-sdk). "
+        "Can also use JIRA_MCP_TRACE_OTLP_ENDPOINT env var.",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report an import-time breakdown and the time to first list_tools response, then exit",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http"],
+        default="stdio",
+        help="Serve over stdio (default, one client per process) or streamable HTTP "
+        "(one long-lived process shared by many concurrent sessions)",
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="Interface to bind with --transport http (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port to listen on with --transport http (default: 8000)",
+    )
+    parser.add_argument(
+        "--webhook-port",
+        type=int,
+        metavar="PORT",
+        help="Receive Jira webhooks at http://HOST:PORT/webhook to keep change feeds fresh "
+        "without polling (the MCP port itself with --transport http). "
+        "Can also use JIRA_MCP_WEBHOOK_PORT env var.",
+    )
+    parser.add_argument(
+        "--webhook-secret",
+        type=str,
+        metavar="SECRET",
+        help="Reject webhooks not signed with this secret (required with --webhook-port). "
+        "Can also use JIRA_MCP_WEBHOOK_SECRET env var.",
+    )
+    parser.add_argument(
+        "--webhook-insecure",
+        action="store_true",
+        help="Accept unsigned webhooks when no secret is set, e.g. for local testing. "
+        "Anyone who can reach the port can then inject issue events. "
+        "Can also use JIRA_MCP_WEBHOOK_INSECURE=1 env var.",
+    )
+    parser.add_argument(
+        "--warm-up",
+        action="store_true",
+        help="Connect to Jira in the background at startup: open pooled connections, verify "
+        "credentials and prefetch projects and the current user. "
+        "Can also use JIRA_MCP_WARM_UP=1 env var.",
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=["text", "json"],
+        help="Write log lines as text (default) or as one JSON object per line. "
+        "Can also use JIRA_MCP_LOG_FORMAT env var.",
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        metavar="LEVEL",
+        help="Minimum level to log: DEBUG, INFO (default), WARNING or ERROR. "
+        "Can also use JIRA_MCP_LOG_LEVEL env var.",
+    )
+    parser.add_argument(
+        "--log-sample",
+        type=int,
+        metavar="N",
+        help="Keep only the first and then one in N lines of each high-volume event "
+        "(search pages, issue reads, HTTP requests). Warnings and errors are always kept. "
+        "Can also use JIRA_MCP_LOG_SAMPLE env var.",
+    )
+    parser.add_argument(
+        "--max-jobs",
+        type=int,
+        metavar="N",
+        help="Background jobs that may run at once (default: 2); further jobs wait. "
+        "Can also use JIRA_MCP_MAX_JOBS env var.",
+    )
+
+    args = parser.parse_args()
+
+    if args.test_connection:
+        setup_logging(args.log_format, args.log_level, args.log_sample)
+        success = test_connection(args.test_connection, args.config)
+        sys.exit(0 if success else 1)
+
+    if args.profile_startup:
+        from jira_mcp.profiling import profile_startup
+
+        sys.exit(0 if profile_startup() else 1)
+
+    # Run the MCP server
+    asyncio.run(
+        main(
+            args.instance,
+            args.metrics_file,
+            args.trace_file,
+            args.trace_otlp,
+            args.transport,
+            args.host,
+            args.port,
+            args.config,
+            args.warm_up,
+            args.webhook_port,
+            args.webhook_secret,
+            args.log_format,
+            args.log_level,
+            args.log_sample,
+            args.webhook_insecure,
+            args.max_jobs,
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,345 @@
+"""Lightweight configuration loading without pydantic.
+
+InstanceConfig holds the same connection fields as JiraInstanceConfig, plus
+tuning knobs, in a slotted dataclass with equivalent URL validation. Instances
+can be read from environment variables or from a TOML config file describing
+several instances:
+
+    default_instance = "positronic"
+
+    [tuning]            # defaults for every instance
+    timeout = 30.0
+    concurrency = 8
+    max_concurrency = 32
+
+    [instances.positronic]
+    url = "https://positronic.atlassian.net"
+    email = "me@positronic.ai"
+    api_token_env = "JIRA_POSITRONIC_TOKEN"   # or api_token = "..."
+    timeout = 20.0                             # per-instance override
+"""
+
+import os
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+# Default config file location, used when it exists and no other file is given
+DEFAULT_CONFIG_PATH = os.path.join("~", ".config", "jira-mcp", "config.toml")
+
+# Same limit pydantic's HttpUrl enforces
+MAX_URL_LENGTH = 2083
+
+# Config keys that may be set in [tuning] and overridden per instance
+TUNING_KEYS = (
+    "timeout", "concurrency", "max_connections", "adaptive_concurrency", "max_concurrency",
+    "breaker_threshold", "breaker_reset", "stale_while_revalidate", "stale_timeout",
+    "max_transfers",
+)
+
+# Types a config file value may have; ints are also accepted for floats
+_TYPE_NAMES = {str: "a string", int: "an integer", float: "a number", bool: "true or false"}
+
+_dotenv_loaded = False
+
+
+def load_env() -> None:
+    """Load environment variables from a .env file, once, on first config lookup."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _dotenv_loaded = True
+
+
+def _check_type(key: str, value: Any, expected: type, where: str) -> Any:
+    """
+    Check a value read from a config file against the type its setting needs.
+
+    Args:
+        key: Setting name, for the error message
+        value: Value as parsed from TOML
+        expected: str, int, float or bool
+        where: Where the setting was found (e.g., "instance 'positronic'")
+
+    Returns:
+        The value, with an int given for a float converted
+
+    Raises:
+        ValueError: If the value has another type
+    """
+    # bool is a subclass of int, so check it explicitly
+    if expected is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, expected) and (expected is bool or not isinstance(value, bool)):
+        return value
+    raise ValueError(
+        f"{key} for {where} should be {_TYPE_NAMES[expected]}, not {type(value).__name__}"
+    )
+
+
+def validate_url(url: str) -> str:
+    """
+    Validate an http(s) URL the way pydantic's HttpUrl does.
+
+    Args:
+        url: URL string (e.g., 'https://lit-ai.atlassian.net')
+
+    Returns:
+        The URL with surrounding whitespace removed
+
+    Raises:
+        ValueError: If the URL is not an absolute http or https URL with a host
+    """
+    url = url.strip()
+    if len(url) > MAX_URL_LENGTH:
+        raise ValueError(f"URL should have at most {MAX_URL_LENGTH} characters")
+    if any(c.isspace() for c in url):
+        raise ValueError(f"Invalid URL (contains whitespace): {url!r}")
+    try:
+        parts = urlsplit(url)
+        parts.port  # raises ValueError on an invalid port
+    except ValueError as e:
+        raise ValueError(f"Invalid URL {url!r}: {e}") from e
+    if parts.scheme not in ("http", "https"):
+        raise ValueError(f"URL scheme should be 'http' or 'https': {url!r}")
+    if not parts.hostname:
+        raise ValueError(f"URL is missing a host: {url!r}")
+    return url
+
+
+@dataclass(frozen=True, slots=True)
+class InstanceConfig:
+    """Connection settings and tuning knobs for a single Jira instance."""
+
+    instance_name: str
+    url: str
+    email: str
+    api_token: str
+    timeout: float = 30.0
+    concurrency: int = 8
+    max_connections: int = 100
+    adaptive_concurrency: bool = True
+    max_concurrency: int = 32
+    breaker_threshold: int = 5
+    breaker_reset: float = 30.0
+    stale_while_revalidate: bool = True
+    stale_timeout: float = 2.0
+    max_transfers: int = 2
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "url", validate_url(self.url))
+        if not self.email:
+            raise ValueError(f"Missing email for instance '{self.instance_name}'")
+        if not self.api_token:
+            raise ValueError(f"Missing API token for instance '{self.instance_name}'")
+        if self.timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if self.concurrency < 1 or self.max_connections < 1:
+            raise ValueError("concurrency and max_connections must be at least 1")
+        if self.max_concurrency < self.concurrency:
+            raise ValueError("max_concurrency must be at least concurrency")
+        if self.breaker_threshold < 0:
+            raise ValueError("breaker_threshold must not be negative")
+        if self.breaker_reset <= 0 or self.stale_timeout <= 0:
+            raise ValueError("breaker_reset and stale_timeout must be positive")
+        if self.max_transfers < 1:
+            raise ValueError("max_transfers must be at least 1")
+
+    @classmethod
+    def from_env(cls, instance_name: str) -> "InstanceConfig":
+        """
+        Load configuration from environment variables.
+
+        Expected environment variables:
+        - JIRA_{INSTANCE}_URL
+        - JIRA_{INSTANCE}_EMAIL
+        - JIRA_{INSTANCE}_TOKEN
+
+        Args:
+            instance_name: Instance identifier (e.g., 'positronic')
+
+        Returns:
+            InstanceConfig object
+
+        Raises:
+            ValueError: If required environment variables are missing or invalid
+        """
+        load_env()
+        instance_upper = instance_name.upper()
+
+        values = {}
+        for field_name, suffix in (("url", "URL"), ("email", "EMAIL"), ("api_token", "TOKEN")):
+            value = os.getenv(f"JIRA_{instance_upper}_{suffix}")
+            if not value:
+                raise ValueError(f"Missing JIRA_{instance_upper}_{suffix} environment variable")
+            values[field_name] = value
+
+        return cls(instance_name=instance_name, **values)
+
+    @classmethod
+    def from_mapping(
+        cls,
+        instance_name: str,
+        data: Mapping[str, Any],
+        defaults: Optional[Mapping[str, Any]] = None,
+    ) -> "InstanceConfig":
+        """
+        Build a config from a config-file table.
+
+        Args:
+            instance_name: Instance identifier
+            data: Instance table (url, email, api_token or api_token_env, tuning overrides)
+            defaults: Tuning defaults applied before the instance's own values (optional)
+
+        Returns:
+            InstanceConfig object
+
+        Raises:
+            ValueError: On unknown keys, values of the wrong type, missing fields
+                or invalid values
+        """
+        where = f"instance '{instance_name}'"
+        if not isinstance(data, Mapping):
+            raise ValueError(f"[instances.{instance_name}] should be a table")
+        merged: Dict[str, Any] = {**(defaults or {}), **data}
+
+        token_env = merged.pop("api_token_env", None)
+        if token_env is not None:
+            _check_type("api_token_env", token_env, str, where)
+        if token_env and not merged.get("api_token"):
+            merged["api_token"] = os.getenv(token_env, "")
+
+        types: Dict[str, Any] = {f.name: f.type for f in fields(cls) if f.name != "instance_name"}
+        unknown = set(merged) - set(types)
+        if unknown:
+            raise ValueError(f"Unknown setting(s) for {where}: {', '.join(sorted(unknown))}")
+        for key, value in merged.items():
+            merged[key] = _check_type(key, value, types[key], where)
+        missing = [name for name in ("url", "email", "api_token") if not merged.get(name)]
+        if missing:
+            raise ValueError(f"Missing {', '.join(missing)} for instance '{instance_name}'")
+
+        return cls(instance_name=instance_name, **merged)
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigFile:
+    """Parsed TOML config file: all instances plus the default instance name."""
+
+    instances: Dict[str, InstanceConfig]
+    default_instance: Optional[str] = None
+
+
+def _read_toml(path: str) -> Dict[str, Any]:
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # Python 3.10
+        try:
+            import tomli as tomllib  # type: ignore[no-redef]
+        except ModuleNotFoundError as e:
+            raise ValueError(
+                "Reading TOML config files on Python 3.10 requires the 'tomli' package"
+            ) from e
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_config_file(path: str) -> ConfigFile:
+    """
+    Load instances and tuning knobs from a TOML config file.
+
+    Args:
+        path: Path to the config file ('~' is expanded)
+
+    Returns:
+        ConfigFile with every instance validated
+
+    Raises:
+        ValueError: If the file is malformed or an instance is invalid
+    """
+    data = _read_toml(os.path.expanduser(path))
+
+    tuning = data.get("tuning", {})
+    if not isinstance(tuning, dict):
+        raise ValueError("[tuning] should be a table")
+    unknown = set(tuning) - set(TUNING_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown [tuning] setting(s): {', '.join(sorted(unknown))}")
+
+    tables = data.get("instances", {})
+    if not isinstance(tables, dict):
+        raise ValueError("[instances] should be a table of instance tables")
+    instances = {
+        name: InstanceConfig.from_mapping(name, table, defaults=tuning)
+        for name, table in tables.items()
+    }
+    default_instance = data.get("default_instance")
+    if default_instance is not None:
+        _check_type("default_instance", default_instance, str, path)
+    if default_instance is not None and default_instance not in instances:
+        raise ValueError(f"default_instance '{default_instance}' is not defined in {path}")
+    return ConfigFile(instances=instances, default_instance=default_instance)
+
+
+def resolve_config_path(config_file: Optional[str] = None) -> Optional[str]:
+    """
+    Pick the config file to use.
+
+    Order: explicit path, JIRA_MCP_CONFIG environment variable, then
+    ~/.config/jira-mcp/config.toml if it exists.
+
+    Args:
+        config_file: Explicit path (optional)
+
+    Returns:
+        Path to a config file, or None to use environment variables only
+    """
+    if config_file:
+        return config_file
+    from_env = os.getenv("JIRA_MCP_CONFIG")
+    if from_env:
+        return from_env
+    default = os.path.expanduser(DEFAULT_CONFIG_PATH)
+    return default if os.path.exists(default) else None
+
+
+def load_instance_config(
+    instance_name: Optional[str] = None,
+    config_file: Optional[str] = None,
+) -> InstanceConfig:
+    """
+    Get configuration for a Jira instance without pydantic.
+
+    Instances defined in the config file take precedence; otherwise the
+    JIRA_{INSTANCE}_* environment variables are used as in get_instance_config.
+
+    Args:
+        instance_name: Instance identifier. If None, uses JIRA_INSTANCE or the
+            config file's default_instance.
+        config_file: Path to a TOML config file (optional)
+
+    Returns:
+        InstanceConfig object
+
+    Raises:
+        ValueError: If no instance can be determined or its settings are invalid
+    """
+    load_env()
+    path = resolve_config_path(config_file)
+    parsed = load_config_file(path) if path else ConfigFile(instances={})
+
+    if instance_name is None:
+        instance_name = os.getenv("JIRA_INSTANCE") or parsed.default_instance
+        if not instance_name:
+            raise ValueError(
+                "No instance specified. Provide --instance argument, set JIRA_INSTANCE "
+                "environment variable, or set default_instance in the config file"
+            )
+
+    if instance_name in parsed.instances:
+        return parsed.instances[instance_name]
+    return InstanceConfig.from_env(instance_name)
@@ -0,0 +1,469 @@
+"""Rank a project's existing issues by similarity to a proposed one, from a local index.
+
+Each project gets a SimilarityIndex: a TF-IDF inverted index over the words of
+every issue's summary (weighted double) and the start of its description, as
+plain text from extract_text_from_adf. A query scores only the issues that share
+a word with it, by cosine similarity, so it answers in milliseconds without
+asking Jira.
+
+The first query for a project starts a background thread that reads its most
+recently updated issues (up to MAX_INDEXED_ISSUES) to build the index. A query
+waits up to BUILD_WAIT seconds for the build and is answered with None if it is
+still running, so a large project never holds up a caller; small projects are
+usually built within the wait. Later queries bring the index up to date the
+way change feeds do (see jira_mcp.changes): at most every REFRESH_INTERVAL
+seconds, they ask only for issues updated since the index's watermark. Issues
+created through the server and webhook events are applied as they happen, and
+while webhooks keep arriving no refresh queries are made at all. Issues deleted
+in Jira without a webhook stay in the index until the server restarts.
+"""
+
+import heapq
+import logging
+import math
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from jira_mcp import changes
+from jira_mcp.adf import extract_text_from_adf
+from jira_mcp.cycle_time import parse_jira_datetime
+from jira_mcp.jira_client import JiraClient
+from jira_mcp.logs import SAMPLED
+
+logger = logging.getLogger(__name__)
+
+# Fields read to index an issue
+INDEX_FIELDS = ["summary", "description", "status", "updated", "project"]
+
+# Issues indexed per project; the least recently updated are dropped first
+MAX_INDEXED_ISSUES = 20000
+
+# Description characters indexed per issue; the opening describes the problem
+MAX_DESCRIPTION_CHARS = 2000
+
+# Seconds a query waits for its project's index to be built before giving up on it
+BUILD_WAIT = 2.0
+
+# Seconds an index is trusted before the next query asks Jira for updates
+REFRESH_INTERVAL = 60.0
+
+# Times a summary's words count relative to the description's
+SUMMARY_WEIGHT = 2
+
+# Default score from which jira_create_issue's duplicate check refuses to create
+DUPLICATE_THRESHOLD = 0.5
+
+# Term frequencies are capped here; a word's weight grows with the log of its count
+MAX_TERM_FREQUENCY = 63
+
+_TF_WEIGHT = (0.0,) + tuple(1 + math.log(tf) for tf in range(1, MAX_TERM_FREQUENCY + 1))
+
+# Project keys as Jira allows them; anything else is refused before it reaches JQL
+_PROJECT_KEY = re.compile(r"[A-Z][A-Z0-9_]*")
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+_STOP_WORDS = frozenset(
+    """
+    a an and are as at be been but by can do does for from has have how i if in into is it
+    its not of on or so that the their then there these this to was we were when where which
+    while will with should would could our you your
+    """.split()
+)
+
+
+def tokenize(text: str) -> Dict[str, int]:
+    """
+    Count the indexable words in a text.
+
+    Words are lowercased runs of letters and digits, without stop words and
+    single characters, and with a plural 's' dropped.
+
+    Returns:
+        Term frequencies, with terms interned
+    """
+    counts: Dict[str, int] = {}
+    for word in _WORD.findall(text.lower()):
+        if len(word) < 2 or word in _STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        word = sys.intern(word)
+        counts[word] = counts.get(word, 0) + 1
+    return counts
+
+
+def issue_terms(summary: str, description: str = "") -> Dict[str, int]:
+    """Term frequencies of an issue, with summary words counted SUMMARY_WEIGHT times."""
+    counts = tokenize(description[:MAX_DESCRIPTION_CHARS])
+    for term, count in tokenize(summary).items():
+        counts[term] = counts.get(term, 0) + count * SUMMARY_WEIGHT
+    return counts
+
+
+class SimilarIssue:
+    """An indexed issue ranked against a query."""
+
+    __slots__ = ("key", "summary", "status", "score", "shared")
+
+    def __init__(self, key: str, summary: str, status: str, score: float, shared: List[str]):
+        self.key = key
+        self.summary = summary
+        self.status = status
+        self.score = score
+        self.shared = shared
+
+
+class _Entry:
+    """What the index keeps per issue besides its postings."""
+
+    __slots__ = ("summary", "status", "updated", "terms", "norm")
+
+    def __init__(self, summary: str, status: str, updated: Optional[str], terms: Tuple[str, ...]):
+        self.summary = summary
+        self.status = status
+        self.updated = updated
+        self.terms = terms
+        self.norm = 0.0
+
+
+class SimilarityIndex:
+    """TF-IDF inverted index over one project's issues."""
+
+    def __init__(self, project_key: str):
+        """
+        Initialize an empty index.
+
+        Args:
+            project_key: Project whose issues are indexed (e.g., 'PROJ')
+        """
+        self.project_key = project_key
+        self.entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # term -> {issue key: term frequency}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.watermark: Optional[datetime] = None
+        self.synced_at: Optional[float] = None
+        self.lock = threading.Lock()
+        # Set once the first build has finished
+        self.ready = threading.Event()
+        # True while a background build is running
+        self.building = False
+        # Document count the stored norms were computed at; idf drifts as issues are added
+        self._norms_at = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _idf(self, term: str) -> float:
+        return math.log((len(self.entries) + 1) / (len(self.postings.get(term, ())) + 1)) + 1
+
+    def _norm(self, key: str, entry: _Entry) -> float:
+        """Length of an issue's TF-IDF vector, computed at the current idf and kept."""
+        if not entry.norm:
+            squares = sum(
+                (_TF_WEIGHT[self.postings[t][key]] * self._idf(t)) ** 2 for t in entry.terms
+            )
+            entry.norm = math.sqrt(squares) or 1.0
+        return entry.norm
+
+    def remove(self, issue_key: str) -> bool:
+        """Drop an issue from the index (caller holds the lock); True if it was indexed."""
+        entry = self.entries.pop(issue_key, None)
+        if entry is None:
+            return False
+        for term in entry.terms:
+            posting = self.postings[term]
+            del posting[issue_key]
+            if not posting:
+                del self.postings[term]
+        return True
+
+    def add(
+        self,
+        issue_key: str,
+        summary: str,
+        description: str = "",
+        status: str = "",
+        updated: Optional[str] = None,
+        oldest: bool = False,
+    ) -> None:
+        """
+        Index an issue, replacing any previous version of it (caller holds the lock).
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+            summary: Issue summary
+            description: Description as plain text
+            status: Status name, shown with matches
+            updated: Jira 'updated' timestamp (advances the watermark)
+            oldest: Place the issue first in line for eviction (used while
+                reading issues newest first)
+        """
+        self.remove(issue_key)
+        counts = issue_terms(summary, description)
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[issue_key] = min(tf, MAX_TERM_FREQUENCY)
+        self.entries[issue_key] = _Entry(summary, status, updated, tuple(counts))
+        if oldest:
+            self.entries.move_to_end(issue_key, last=False)
+
+        if updated:
+            moment = parse_jira_datetime(updated)
+            if self.watermark is None or moment > self.watermark:
+                self.watermark = moment
+        while len(self.entries) > MAX_INDEXED_ISSUES:
+            self.remove(next(iter(self.entries)))
+
+    def add_issue(self, issue: Dict[str, Any], oldest: bool = False) -> None:
+        """Index an issue as returned by the REST API (caller holds the lock)."""
+        fields = issue.get("fields") or {}
+        description = fields.get("description")
+        if isinstance(description, dict):
+            description = extract_text_from_adf(description)
+        self.add(
+            issue["key"],
+            fields.get("summary") or "",
+            description or "",
+            (fields.get("status") or {}).get("name") or "",
+            fields.get("updated"),
+            oldest=oldest,
+        )
+
+    def _refresh_norms(self) -> None:
+        """Forget every norm once the document count has drifted by a tenth since they were kept."""
+        count = len(self.entries)
+        if abs(count - self._norms_at) * 10 <= self._norms_at:
+            return
+        for entry in self.entries.values():
+            entry.norm = 0.0
+        self._norms_at = count
+
+    def query(
+        self, summary: str, description: str = "", limit: int = 5, min_score: float = 0.0
+    ) -> List[SimilarIssue]:
+        """
+        Rank indexed issues by cosine similarity to a proposed issue (caller holds the lock).
+
+        Args:
+            summary: Proposed summary
+            description: Proposed description as plain text
+            limit: Maximum number of issues to return
+            min_score: Leave out issues scoring below this (0 to 1)
+
+        Returns:
+            Best matches first
+        """
+        self._refresh_norms()
+        terms = issue_terms(summary, description)
+        idf = {term: self._idf(term) for term in terms}
+        weights = {
+            term: _TF_WEIGHT[min(tf, MAX_TERM_FREQUENCY)] * idf[term] for term, tf in terms.items()
+        }
+        query_norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+
+        # Accumulate dot products over the postings of the query's terms only
+        scores: Dict[str, float] = {}
+        for term, weight in weights.items():
+            factor = weight * idf[term]
+            for key, tf in self.postings.get(term, {}).items():
+                scores[key] = scores.get(key, 0.0) + factor * _TF_WEIGHT[tf]
+
+        ranked = []
+        for key, dot in scores.items():
+            score = dot / (query_norm * self._norm(key, self.entries[key]))
+            if score >= min_score:
+                ranked.append((score, key))
+
+        matches = []
+        for score, key in heapq.nlargest(limit, ranked):
+            entry = self.entries[key]
+            shared = sorted(
+                (t for t in weights if key in self.postings.get(t, ())),
+                key=lambda t: -weights[t],
+            )
+            matches.append(
+                SimilarIssue(key, entry.summary, entry.status, min(score, 1.0), shared[:5])
+            )
+        return matches
+
+    def start_build(self, client: JiraClient) -> bool:
+        """
+        Start building the index on a background thread (caller holds the lock).
+
+        Nothing is started if the index is built or a build is running.
+
+        Returns:
+            True if the index is built
+        """
+        if self.synced_at is not None:
+            return True
+        if not self.building:
+            self.building = True
+            threading.Thread(
+                target=self._build,
+                args=(client,),
+                name=f"similarity-index-{self.project_key}",
+                daemon=True,
+            ).start()
+        return False
+
+    def _build(self, client: JiraClient) -> None:
+        """Read the project's most recently updated issues into the index."""
+        started = time.time()
+        read = 0
+        logger.info("Building similarity index for %s", self.project_key)
+        try:
+            jql = f'project = "{self.project_key}" ORDER BY updated DESC'
+            for issue in client.iter_issues(jql, fields=INDEX_FIELDS, limit=MAX_INDEXED_ISSUES):
+                with self.lock:
+                    # Reading newest first, so an issue already here came from
+                    # a webhook or a create during the build and is newer
+                    if issue["key"] not in self.entries:
+                        self.add_issue(issue, oldest=True)
+                read += 1
+        except Exception as e:
+            logger.warning("Could not build similarity index for %s: %s", self.project_key, e)
+            with self.lock:
+                self.building = False
+            return
+        with self.lock:
+            self.synced_at = started
+            self.building = False
+        self.ready.set()
+        logger.info("Indexed %d issues of %s", read, self.project_key)
+
+    def refresh(self, client: JiraClient, max_age: float = REFRESH_INTERVAL) -> int:
+        """
+        Fetch issues updated since the watermark of a built index (caller holds the lock).
+
+        Nothing is requested if the index was synced less than max_age seconds
+        ago, or if webhooks have delivered every change since it was. An index
+        that is not built yet is left to start_build.
+
+        Args:
+            client: JiraClient instance
+            max_age: Seconds a sync stays fresh
+
+        Returns:
+            Number of issues read from Jira
+        """
+        now = time.time()
+        if self.synced_at is None or now - self.synced_at < max_age:
+            return 0
+        if (
+            changes.push_active()
+            and changes.push_started is not None
+            and changes.push_started <= self.synced_at
+        ):
+            return 0
+
+        jql = f'project = "{self.project_key}"'
+        if self.watermark is not None:
+            tz = changes.user_timezone(client)
+            start = self.watermark.astimezone(tz).strftime("%Y/%m/%d %H:%M")
+            jql += f' AND updated >= "{start}"'
+        jql += " ORDER BY updated ASC"
+        logger.info("Refreshing similarity index: %s", jql, extra=SAMPLED)
+        read = 0
+        for issue in client.iter_issues(jql, fields=INDEX_FIELDS, limit=MAX_INDEXED_ISSUES):
+            entry = self.entries.get(issue["key"])
+            if entry is None or entry.updated != issue["fields"].get("updated"):
+                self.add_issue(issue)
+            read += 1
+        self.synced_at = now
+        return read
+
+
+_indexes: Dict[str, SimilarityIndex] = {}
+_registry_lock = threading.Lock()
+
+
+def get_index(project_key: str) -> SimilarityIndex:
+    """
+    Return a project's index, creating an empty one on first use.
+
+    Raises:
+        ValueError: If project_key is not a valid Jira project key
+    """
+    project_key = project_key.strip().upper()
+    if not _PROJECT_KEY.fullmatch(project_key):
+        raise ValueError(f"Invalid project key: {project_key!r}")
+    with _registry_lock:
+        index = _indexes.get(project_key)
+        if index is None:
+            index = _indexes[project_key] = SimilarityIndex(project_key)
+        return index
+
+
+def find_similar(
+    client: JiraClient,
+    project_key: str,
+    summary: str,
+    description: Optional[str] = None,
+    limit: int = 5,
+    min_score: float = 0.1,
+    wait: float = BUILD_WAIT,
+) -> Optional[List[SimilarIssue]]:
+    """
+    Rank a project's issues by similarity to a proposed summary and description.
+
+    The first call for a project starts building its index in the background
+    and waits for it up to wait seconds.
+
+    Args:
+        client: JiraClient instance (used only to build or refresh the index)
+        project_key: Project to search (e.g., 'PROJ')
+        summary: Proposed summary
+        description: Proposed description (optional)
+        limit: Maximum number of issues to return
+        min_score: Leave out issues scoring below this (0 to 1)
+        wait: Seconds to wait for an index that is still being built
+
+    Returns:
+        Best matches first, or None if the index is still being built
+    """
+    index = get_index(project_key)
+    with index.lock:
+        built = index.start_build(client)
+    if not built and not index.ready.wait(wait):
+        return None
+    with index.lock:
+        index.refresh(client)
+        return index.query(summary, description or "", limit, min_score)
+
+
+def note_created(
+    project_key: str, issue_key: str, summary: str, description: Optional[str] = None
+) -> None:
+    """Index an issue just created through the server, if its project is indexed."""
+    with _registry_lock:
+        index = _indexes.get(project_key.strip().upper())
+    if index is not None:
+        with index.lock:
+            if index.synced_at is not None or index.building:
+                index.add(issue_key, summary, description or "")
+
+
+def apply_issue_event(issue: Dict[str, Any], deleted: bool = False) -> None:
+    """Apply a webhook's issue created, updated or deleted event to its project's index."""
+    project = ((issue.get("fields") or {}).get("project") or {}).get("key")
+    key = issue.get("key", "")
+    if not key:
+        return
+    with _registry_lock:
+        if deleted:
+            # Deletion payloads may carry only the key
+            indexes = list(_indexes.values())
+        else:
+            indexes = [_indexes[project]] if project in _indexes else []
+    for index in indexes:
+        with index.lock:
+            if deleted:
+                index.remove(key)
+            elif index.synced_at is not None or index.building:
+                index.add_issue(issue)
@@ -0,0 +1,84 @@
+"""Constant-memory streaming statistics."""
+
+import math
+from typing import Dict, Iterator, Optional, Tuple
+
+
+class StreamingHistogram:
+    """
+    Log-bucketed histogram for approximate quantiles in constant memory.
+
+    Values are counted in geometric buckets that grow by ``growth`` (default 5%),
+    so quantile estimates stay within that relative error no matter how many
+    values are observed, and the number of buckets only depends on the value range.
+    """
+
+    def __init__(self, growth: float = 1.05):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            growth: Ratio between consecutive bucket boundaries (must be > 1)
+        """
+        if growth <= 1.0:
+            raise ValueError("growth must be greater than 1")
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """Record a single non-negative observation (negative values count as zero)."""
+        value = max(0.0, float(value))
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        if value <= 0.0:
+            self.zero_count += 1
+            return
+        index = math.floor(math.log(value) / self._log_growth)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Arithmetic mean of all observations, or None if empty."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-th quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g., 0.5 for the median)
+
+        Returns:
+            Approximate value, or None if no observations were recorded
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+
+        seen = self.zero_count
+        if seen >= rank:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                midpoint = (self.growth ** index) * (1.0 + self.growth) / 2.0
+                return min(max(midpoint, self.min or 0.0), self.max or midpoint)
+        return self.max
+
+    def cumulative_buckets(self) -> Iterator[Tuple[float, int]]:
+        """Yield (upper_bound, cumulative_count) pairs in increasing order."""
+        seen = self.zero_count
+        if seen:
+            yield 0.0, seen
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            yield self.growth ** (index + 1), seen
@@ -0,0 +1,259 @@
+"""Lightweight tracing spans for tool calls, client methods and HTTP requests.
+
+Tracing is disabled by default and then costs a single attribute check per span.
+When enabled, finished spans are written to a local JSONL file or, if the
+OpenTelemetry SDK and OTLP exporter are installed, sent to an OTLP collector.
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "jira_mcp_current_span", default=None
+)
+
+
+class Span:
+    """A timed operation with attributes, linked to its parent span."""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "attributes", "start", "end", "status")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.attributes = attributes
+        self.start = time.time()
+        self.end: Optional[float] = None
+        self.status = "ok"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set or overwrite a span attribute."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the span for export."""
+        end = self.end if self.end is not None else time.time()
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": round((end - self.start) * 1000, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Span stand-in used when tracing is disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+class _NoopContext:
+    """Reusable context manager that does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return _NOOP_SPAN
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+_NOOP_CONTEXT = _NoopContext()
+
+
+class _SpanContext:
+    """Context manager that activates a span and exports it when finished."""
+
+    __slots__ = ("_exporter", "_span", "_token")
+
+    def __init__(self, exporter: "JsonlExporter", name: str, attributes: Dict[str, Any]):
+        self._exporter = exporter
+        self._span = Span(name, _current_span.get(), attributes)
+        self._token: Optional[contextvars.Token] = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        span = self._span
+        span.end = time.time()
+        if exc_val is not None:
+            span.status = "error"
+            span.attributes["error"] = str(exc_val)
+        if self._token is not None:
+            _current_span.reset(self._token)
+        self._exporter.export(span)
+
+
+class JsonlExporter:
+    """Append finished spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        """
+        Open the trace file for appending.
+
+        Args:
+            path: Path of the JSONL file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        """Write a finished span."""
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the trace file."""
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    """Creates spans; a no-op unless configured with an exporter or OTLP."""
+
+    def __init__(self) -> None:
+        self._exporter: Optional[JsonlExporter] = None
+        self._otel_tracer: Any = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are being recorded."""
+        return self._exporter is not None or self._otel_tracer is not None
+
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Start a span as a context manager.
+
+        Args:
+            name: Span name (e.g., 'jira.get_issue')
+            attributes: Initial span attributes (optional)
+
+        Returns:
+            Context manager yielding an object with ``set_attribute``
+        """
+        if self._exporter is not None:
+            return _SpanContext(self._exporter, name, dict(attributes or {}))
+        if self._otel_tracer is not None:
+            return self._otel_tracer.start_as_current_span(name, attributes=attributes)
+        return _NOOP_CONTEXT
+
+    def current_span(self) -> Any:
+        """Return the active span, or a no-op span if none is active."""
+        if self._exporter is not None:
+            return _current_span.get() or _NOOP_SPAN
+        if self._otel_tracer is not None:
+            from opentelemetry import trace
+
+            return trace.get_current_span()
+        return _NOOP_SPAN
+
+    def configure(
+        self, jsonl_path: Optional[str] = None, otlp_endpoint: Optional[str] = None
+    ) -> None:
+        """
+        Enable tracing.
+
+        OTLP export is used when an endpoint is given and the OpenTelemetry SDK
+        is installed; otherwise spans go to the JSONL file if one is given.
+        With neither, tracing stays disabled.
+
+        Args:
+            jsonl_path: Path of a JSONL file to append spans to (optional)
+            otlp_endpoint: OTLP/HTTP collector endpoint (optional)
+        """
+        self.shutdown()
+
+        if otlp_endpoint:
+            try:
+                from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+                from opentelemetry.sdk.resources import Resource
+                from opentelemetry.sdk.trace import TracerProvider
+                from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            except ImportError:
+                logger.warning(
+                    "OTLP tracing requested but opentelemetry-sdk/opentelemetry-exporter-otlp "
+                    "are not installed"
+                )
+            else:
+                provider = TracerProvider(resource=Resource.create({"service.name": "jira-mcp"}))
+                provider.add_span_processor(
+                    BatchSpanProcessor(OTLPSpanExporter(endpoint=otlp_endpoint))
+                )
+                self._otel_tracer = provider.get_tracer("jira_mcp")
+                logger.info("Exporting traces to OTLP endpoint %s", otlp_endpoint)
+                return
+
+        if jsonl_path:
+            self._exporter = JsonlExporter(jsonl_path)
+            logger.info("Writing traces to %s", jsonl_path)
+
+    def shutdown(self) -> None:
+        """Disable tracing and release exporter resources."""
+        if self._exporter is not None:
+            self._exporter.close()
+        self._exporter = None
+        self._otel_tracer = None
+
+
+def traced(name: Optional[str] = None, attributes: Sequence[str] = ()) -> Callable[[F], F]:
+    """
+    Decorate a function so each call runs in a span.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+        attributes: Names of parameters to record as span attributes
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+
+            recorded: Dict[str, Any] = {}
+            if attributes:
+                bound = signature.bind_partial(*args, **kwargs).arguments
+                recorded = {key: bound[key] for key in attributes if bound.get(key) is not None}
+            with tracer.span(span_name, recorded):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+# Process-wide tracer
+tracer = Tracer()
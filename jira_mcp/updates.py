@@ -0,0 +1,160 @@
+"""Apply one field patch to many issues, writing only what actually changes.
+
+The current values of the patched fields are read first with a minimal field
+projection (one search page per 100 issues for a JQL selection, one small GET
+per issue for explicit keys). Each issue is then sent only the fields that
+differ, and issues already matching the patch get no request at all, so
+relabeling hundreds of issues costs as many writes as there are issues to fix.
+"""
+
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from jira_mcp.adf import build_update_fields, extract_text_from_adf
+from jira_mcp.jira_client import JiraClient, map_bounded
+
+logger = logging.getLogger(__name__)
+
+# Patchable fields (as accepted by jira_update_issue) and the Jira field each one reads
+PATCH_FIELDS = {
+    "summary": "summary",
+    "description": "description",
+    "priority": "priority",
+    "labels": "labels",
+    "parent": "parent",
+}
+
+# Label edits applied to each issue's current labels
+LABEL_EDITS = ("add_labels", "remove_labels")
+
+
+def projection(patch: Dict[str, Any]) -> List[str]:
+    """
+    Jira fields needed to diff a patch.
+
+    Args:
+        patch: Field values to set, plus optional add_labels/remove_labels
+
+    Returns:
+        Field names to request (only those the patch touches)
+    """
+    fields = [jira for name, jira in PATCH_FIELDS.items() if name in patch]
+    if any(edit in patch for edit in LABEL_EDITS) and "labels" not in fields:
+        fields.append("labels")
+    return fields
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _same(name: str, current: Any, wanted: Any) -> bool:
+    """Whether a current Jira field value already equals a patch value."""
+    if name == "description":
+        if current is None:
+            return not wanted
+        if current == build_update_fields({"description": wanted})["description"]:
+            return True
+        # Same text in a different layout (e.g. written through the Jira UI)
+        return _normalize_text(extract_text_from_adf(current)) == _normalize_text(wanted)
+    if name in ("priority", "parent"):
+        key = "name" if name == "priority" else "key"
+        return (current or {}).get(key) == wanted
+    if name == "labels":
+        return set(current or ()) == set(wanted)
+    return (current or "") == wanted
+
+
+def changed_fields(current: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a patch to the fields that differ from an issue's current values.
+
+    Args:
+        current: The issue's ``fields`` as returned by Jira (at least projection(patch))
+        patch: Field values to set, plus optional add_labels/remove_labels
+
+    Returns:
+        jira_update_issue-style arguments holding only the changes (empty if none)
+    """
+    changes = {
+        name: patch[name]
+        for name, jira in PATCH_FIELDS.items()
+        if name in patch and not _same(name, current.get(jira), patch[name])
+    }
+
+    if any(edit in patch for edit in LABEL_EDITS):
+        labels = list(changes.get("labels", patch.get("labels", current.get("labels") or [])))
+        labels += [label for label in patch.get("add_labels", ()) if label not in labels]
+        labels = [label for label in labels if label not in set(patch.get("remove_labels", ()))]
+        if _same("labels", current.get("labels"), labels):
+            changes.pop("labels", None)
+        else:
+            changes["labels"] = labels
+    return changes
+
+
+def _selection(
+    client: JiraClient,
+    fields: List[str],
+    issue_keys: Optional[List[str]],
+    jql: Optional[str],
+    max_issues: int,
+) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """(key, current fields) for each selected issue; fields are None when still to be fetched."""
+    seen = set()
+    for key in issue_keys or ():
+        if key not in seen:
+            seen.add(key)
+            yield key, None
+    if jql:
+        # Read the whole selection before writing, so updates cannot shift the result pages
+        issues = list(client.iter_issues(jql, fields=fields, limit=max_issues))
+        for issue in issues:
+            if issue["key"] not in seen:
+                seen.add(issue["key"])
+                yield issue["key"], issue.get("fields") or {}
+
+
+def update_issues(
+    client: JiraClient,
+    patch: Dict[str, Any],
+    issue_keys: Optional[List[str]] = None,
+    jql: Optional[str] = None,
+    max_issues: int = 1000,
+    concurrency: Optional[int] = None,
+    dry_run: bool = False,
+) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[BaseException]]]:
+    """
+    Apply a patch to many issues concurrently, skipping those already up to date.
+
+    Args:
+        client: JiraClient instance
+        patch: Field values to set (summary, description, priority, labels, parent),
+            plus optional add_labels/remove_labels
+        issue_keys: Issues to update (optional)
+        jql: JQL selecting further issues to update (optional)
+        max_issues: Maximum number of issues read from the JQL selection
+        concurrency: Maximum number of issues read or written at once
+            (default: the client's configured concurrency)
+        dry_run: Compute the changes without writing them
+
+    Yields:
+        Tuples of (issue key, changes written or empty if none were needed, error),
+        in completion order; error is None on success
+    """
+    fields = projection(patch)
+
+    def apply(selected: Tuple[str, Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+        key, current = selected
+        if current is None:
+            current = client.get_issue(key, fields=fields).get("fields") or {}
+        changes = changed_fields(current, patch)
+        if changes and not dry_run:
+            client.update_issue(key, build_update_fields(changes))
+        return changes
+
+    selection = _selection(client, fields, issue_keys, jql, max_issues)
+    for (key, _), changes, error in map_bounded(
+        apply, selection, concurrency or client.concurrency
+    ):
+        yield key, changes, error
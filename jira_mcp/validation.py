@@ -0,0 +1,151 @@
+"""Compile tool input schemas into fast argument validators.
+
+Only the JSON Schema subset used by the tool definitions is supported:
+``type``, ``properties``, ``required``, ``additionalProperties: false``,
+``items``, ``enum``, ``minimum``, ``maximum`` and ``minLength``. Unknown
+keywords are ignored. Each schema is compiled once into nested closures, so
+validating a call is a handful of dict lookups and isinstance checks.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+# Validates a value at a path, appending human-readable problems to errors
+Check = Callable[[Any, str, List[str]], None]
+
+# Validates tool arguments and returns a list of problems (empty if valid)
+Validator = Callable[[Dict[str, Any]], List[str]]
+
+_TYPES: Dict[str, Tuple[type, ...]] = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    """Compile one schema node into a check function."""
+    checks: List[Check] = []
+
+    expected = schema.get("type")
+    if expected is not None:
+        names = [expected] if isinstance(expected, str) else list(expected)
+        types = tuple(t for name in names for t in _TYPES[name])
+        allows_bool = "boolean" in names
+        label = " or ".join(names)
+
+        def check_type(value: Any, path: str, errors: List[str]) -> None:
+            # bool is a subclass of int, but JSON true/false is not a number
+            if not isinstance(value, types) or (isinstance(value, bool) and not allows_bool):
+                errors.append(f"{path or 'arguments'} must be {label}")
+                raise _Stop
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value: Any, path: str, errors: List[str]) -> None:
+            if value not in allowed:
+                errors.append(f"{path} must be one of {', '.join(map(repr, allowed))}")
+
+        checks.append(check_enum)
+
+    minimum, maximum = schema.get("minimum"), schema.get("maximum")
+    if minimum is not None or maximum is not None:
+
+        def check_range(value: Any, path: str, errors: List[str]) -> None:
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return
+            if minimum is not None and value < minimum:
+                errors.append(f"{path} must be >= {minimum}")
+            if maximum is not None and value > maximum:
+                errors.append(f"{path} must be <= {maximum}")
+
+        checks.append(check_range)
+
+    min_length = schema.get("minLength")
+    if min_length is not None:
+
+        def check_length(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, str) and len(value) < min_length:
+                errors.append(f"{path} must be at least {min_length} character(s)")
+
+        checks.append(check_length)
+
+    if "properties" in schema or "required" in schema:
+        properties = {
+            key: _compile(subschema) for key, subschema in schema.get("properties", {}).items()
+        }
+        required = list(schema.get("required", []))
+        closed = schema.get("additionalProperties") is False
+
+        def check_object(value: Any, path: str, errors: List[str]) -> None:
+            if not isinstance(value, dict):
+                return
+            for key in required:
+                if key not in value:
+                    errors.append(f"{_join(path, key)} is required")
+            for key, item in value.items():
+                check = properties.get(key)
+                if check is not None:
+                    _run(check, item, _join(path, key), errors)
+                elif closed:
+                    errors.append(f"{_join(path, key)} is not allowed")
+
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_check = _compile(schema["items"])
+
+        def check_items(value: Any, path: str, errors: List[str]) -> None:
+            if not isinstance(value, list):
+                return
+            for index, item in enumerate(value):
+                _run(item_check, item, f"{path}[{index}]", errors)
+
+        checks.append(check_items)
+
+    def check_all(value: Any, path: str, errors: List[str]) -> None:
+        for check in checks:
+            check(value, path, errors)
+
+    return check_all
+
+
+class _Stop(Exception):
+    """Raised by a type check to skip the remaining checks for a value."""
+
+
+def _run(check: Check, value: Any, path: str, errors: List[str]) -> None:
+    try:
+        check(value, path, errors)
+    except _Stop:
+        pass
+
+
+def _join(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """
+    Compile a tool input schema into a validator.
+
+    Args:
+        schema: JSON schema of the tool's arguments (an object schema)
+
+    Returns:
+        Function taking the arguments dict and returning a list of problems
+    """
+    check = _compile(schema)
+
+    def validate(arguments: Dict[str, Any]) -> List[str]:
+        errors: List[str] = []
+        _run(check, arguments, "", errors)
+        return errors
+
+    return validate
@@ -0,0 +1,258 @@
+"""Receive Jira webhooks and apply them to the server's in-process issue state.
+
+Register ``http(s)://HOST:PORT/webhook`` in Jira (Settings → System → WebHooks)
+for issue created/updated/deleted, comment created/updated/deleted and issue
+link created/deleted events. Each event is applied to the change feeds (see
+jira_mcp.changes): followed issues are patched or dropped, watermarks advance,
+and the change is queued for the feed's next poll. Issue events also update the
+similar-issue indexes (see jira_mcp.similar).
+
+Jira signs each body with the webhook's secret (HMAC-SHA256) and sends it as
+``X-Hub-Signature: sha256=<hex>``; unsigned or mis-signed bodies are rejected.
+A secret is required: without one, anyone who can reach the port could inject
+issue updates and deletions. Accepting unsigned bodies takes an explicit
+``insecure`` opt-in (``--webhook-insecure``), meant for local testing.
+
+To test without Jira, post a recorded payload signed with the secret:
+
+    BODY=examples/webhooks/issue_updated.json
+    SIG=$(openssl dgst -sha256 -hmac "$SECRET" "$BODY" | awk '{print $NF}')
+    curl -X POST -H 'Content-Type: application/json' -H "X-Hub-Signature: sha256=$SIG" \\
+        --data @"$BODY" http://127.0.0.1:8001/webhook
+"""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+from typing import Any, Dict, List, Optional
+
+from jira_mcp.changes import ChangeFeed, all_feeds, record_push
+from jira_mcp.decoding import decode
+from jira_mcp.records import IssueRecord
+from jira_mcp.similar import apply_issue_event
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PATH = "/webhook"
+
+# Larger bodies are rejected without being read in full
+MAX_BODY_BYTES = 5 * 1024 * 1024
+
+# Jira fields whose changes already show up in the field-level diff
+_TRACKED_FIELDS = {
+    "summary", "status", "issuetype", "priority", "assignee", "reporter", "resolution",
+    "parent", "labels",
+}
+
+
+def verify_signature(body: bytes, signature: Optional[str], secret: str) -> bool:
+    """
+    Check a webhook body against its X-Hub-Signature header.
+
+    Args:
+        body: Raw request body
+        signature: Header value, 'sha256=<hex digest>' (None if absent)
+        secret: Secret configured for the webhook in Jira
+
+    Returns:
+        True if the signature matches
+    """
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len("sha256="):])
+
+
+def _user(payload: Dict[str, Any], *path: str) -> str:
+    obj: Any = payload
+    for key in path:
+        obj = (obj or {}).get(key)
+    obj = obj or {}
+    return obj.get("displayName") or obj.get("accountId") or "unknown user"
+
+
+def _issue_keys_by_id(feeds: List[ChangeFeed], issue_ids: List[str]) -> Dict[str, str]:
+    """Map issue IDs (as sent in link events) to keys, from the feeds' snapshots."""
+    wanted = set(issue_ids)
+    found: Dict[str, str] = {}
+    for feed in feeds:
+        with feed.lock:
+            for record in feed.snapshots.values():
+                if record.id in wanted:
+                    found[record.id] = record.key
+    return found
+
+
+def _evict_cached_issue(issue_key: str) -> None:
+    """Drop the server client's cached responses for an issue the event changed."""
+    from jira_mcp import server
+
+    if server.jira_client is not None and issue_key:
+        server.jira_client.evict_issue(issue_key)
+
+
+def apply_event(payload: Dict[str, Any]) -> int:
+    """
+    Apply one webhook event to every change feed.
+
+    Args:
+        payload: Decoded webhook body
+
+    Returns:
+        Number of feeds the event changed
+    """
+    event = payload.get("webhookEvent", "")
+    feeds = list(all_feeds())
+    applied = 0
+    record_push()
+
+    if event in ("jira:issue_created", "jira:issue_updated"):
+        issue = payload.get("issue") or {}
+        if not issue.get("key"):
+            return 0
+        record = IssueRecord.from_json(issue)
+        _evict_cached_issue(record.key)
+        apply_issue_event(issue)
+        items = (payload.get("changelog") or {}).get("items") or []
+        untracked = [i.get("field") for i in items if i.get("field") not in _TRACKED_FIELDS]
+        note = None
+        if untracked:
+            note = f"{', '.join(untracked)} changed by {_user(payload, 'user')}"
+        for feed in feeds:
+            with feed.lock:
+                # A scoped feed cannot tell whether an issue it does not follow matches its JQL
+                if feed.jql is None or record.key in feed.snapshots:
+                    applied += feed.observe(record, note)
+
+    elif event == "jira:issue_deleted":
+        key = (payload.get("issue") or {}).get("key", "")
+        _evict_cached_issue(key)
+        apply_issue_event(payload.get("issue") or {}, deleted=True)
+        note = f"deleted by {_user(payload, 'user')}"
+        for feed in feeds:
+            with feed.lock:
+                applied += feed.forget(key, note)
+
+    elif event.startswith("comment_"):
+        key = (payload.get("issue") or {}).get("key", "")
+        _evict_cached_issue(key)
+        action = event[len("comment_"):]
+        comment = payload.get("comment") or {}
+        author = _user(comment, "updateAuthor" if comment.get("updateAuthor") else "author")
+        note = f"comment {action} by {author}"
+        for feed in feeds:
+            with feed.lock:
+                applied += feed.note(key, note)
+
+    elif event.startswith("issuelink_"):
+        link = payload.get("issueLink") or {}
+        source, target = str(link.get("sourceIssueId")), str(link.get("destinationIssueId"))
+        keys = _issue_keys_by_id(feeds, [source, target])
+        link_type = (link.get("issueLinkType") or {}).get("name", "link")
+        action = event[len("issuelink_"):]
+        note = (
+            f"{link_type} link {keys.get(source, source)} → {keys.get(target, target)} {action}"
+        )
+        for key in {keys.get(source), keys.get(target)} - {None}:
+            _evict_cached_issue(key)
+        for feed in feeds:
+            with feed.lock:
+                for key in {keys.get(source), keys.get(target)} - {None}:
+                    applied += feed.note(key, note)
+
+    else:
+        logger.debug("Ignoring webhook event '%s'", event)
+        return 0
+
+    logger.info("Webhook %s: applied to %s feed(s)", event, applied)
+    return applied
+
+
+def webhook_routes(secret: Optional[str] = None, insecure: bool = False) -> List[Any]:
+    """
+    Starlette routes receiving webhooks at WEBHOOK_PATH.
+
+    Args:
+        secret: Shared secret for signature checks
+        insecure: Accept unsigned bodies when no secret is given (default: False)
+
+    Returns:
+        List of routes to add to a Starlette application
+
+    Raises:
+        ValueError: If there is no secret and insecure is not set
+    """
+    if not secret and not insecure:
+        raise ValueError("Webhooks need a secret (or an explicit insecure opt-in)")
+    if not secret:
+        logger.warning("Accepting unsigned webhooks: anyone reaching the port can inject events")
+
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    async def read_body(request: Request) -> Optional[bytes]:
+        """The request body, or None as soon as it is known to exceed MAX_BODY_BYTES."""
+        declared = request.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > MAX_BODY_BYTES:
+            return None
+        # Chunked bodies declare no length, so count while reading
+        chunks = []
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                return None
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def receive(request: Request) -> JSONResponse:
+        body = await read_body(request)
+        if body is None:
+            return JSONResponse({"error": "payload too large"}, status_code=413)
+        if secret and not verify_signature(body, request.headers.get("x-hub-signature"), secret):
+            logger.warning("Rejected webhook with a missing or invalid signature")
+            return JSONResponse({"error": "invalid signature"}, status_code=401)
+        try:
+            payload = decode(body)
+        except ValueError:
+            return JSONResponse({"error": "invalid JSON"}, status_code=400)
+        if not isinstance(payload, dict):
+            return JSONResponse({"error": "expected a JSON object"}, status_code=400)
+
+        # Feeds are locked while they poll Jira, so apply off the event loop
+        applied = await asyncio.to_thread(apply_event, payload)
+        return JSONResponse({"event": payload.get("webhookEvent"), "applied": applied})
+
+    return [Route(WEBHOOK_PATH, receive, methods=["POST"])]
+
+
+async def serve_webhooks(
+    host: str, port: int, secret: Optional[str] = None, insecure: bool = False
+) -> None:
+    """
+    Serve the webhook receiver on its own port at http://HOST:PORT/webhook.
+
+    Args:
+        host: Interface to bind
+        port: TCP port to listen on
+        secret: Shared secret for signature checks
+        insecure: Accept unsigned bodies when no secret is given (default: False)
+    """
+    import uvicorn
+    from starlette.applications import Starlette
+
+    app = Starlette(routes=webhook_routes(secret, insecure))
+    logger.info("Receiving Jira webhooks on http://%s:%s%s", host, port, WEBHOOK_PATH)
+    # log_config=None keeps uvicorn off stdout, which carries the stdio transport
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        lifespan="off",
+        log_level="warning",
+        log_config=None,
+        access_log=False,
+    )
+    await uvicorn.Server(config).serve()
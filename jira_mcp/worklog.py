@@ -0,0 +1,212 @@
+"""Bulk worklog logging and time reports aggregated from issue worklogs."""
+
+import heapq
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from jira_mcp.cycle_time import parse_jira_datetime
+from jira_mcp.jira_client import JiraClient, map_bounded
+from jira_mcp.jobs import report_progress
+
+logger = logging.getLogger(__name__)
+
+# Only the embedded worklog page is needed from the search; issues whose
+# embedded page is complete (Jira embeds up to 20) need no extra request
+TIME_REPORT_FIELDS = ["worklog"]
+
+
+def format_started(value: str) -> str:
+    """
+    Convert a user-supplied start time to the format the worklog API requires.
+
+    Args:
+        value: 'YYYY-MM-DD', 'YYYY-MM-DDTHH:MM[:SS]' or any ISO 8601 timestamp;
+            a date alone means 09:00, and values without an offset are UTC
+
+    Returns:
+        Timestamp such as '2024-01-15T09:00:00.000+0000'
+
+    Raises:
+        ValueError: If the value is not a valid date or timestamp
+    """
+    if len(value) == 10:
+        parsed = datetime.combine(date.fromisoformat(value), time(9, 0))
+    else:
+        parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.strftime("%Y-%m-%dT%H:%M:%S.000%z")
+
+
+def log_work(
+    client: JiraClient,
+    entries: Iterable[Dict[str, Any]],
+    concurrency: Optional[int] = None,
+) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[BaseException]]]:
+    """
+    Post many worklogs concurrently.
+
+    Args:
+        client: JiraClient instance
+        entries: Entries with issue_key, time_spent and optional started and comment
+        concurrency: Maximum number of worklogs posted at once
+            (default: the client's configured concurrency)
+
+    Yields:
+        Tuples of (entry, created worklog, error) in completion order; error is None on success
+    """
+
+    def post(entry: Dict[str, Any]) -> Dict[str, Any]:
+        started = entry.get("started")
+        return client.add_worklog(
+            entry["issue_key"],
+            entry["time_spent"],
+            started=format_started(started) if started else None,
+            comment=entry.get("comment"),
+        )
+
+    return map_bounded(post, entries, concurrency or client.concurrency)
+
+
+class TimeReport:
+    """Hours logged per user and per issue, folded one issue at a time."""
+
+    def __init__(self, top_n: int = 10):
+        """
+        Initialize an empty report.
+
+        Args:
+            top_n: Number of issues with the most time logged to keep for display
+        """
+        self.top_n = top_n
+        self.issue_count = 0
+        self.worklog_count = 0
+        self.total_seconds = 0.0
+        self.by_user: Dict[str, float] = {}
+        self.errors: List[str] = []
+        self._top_issues: List[Tuple[float, str]] = []
+
+    def add_issue(self, issue_key: str, by_user: Dict[str, float], worklogs: int) -> None:
+        """Record the worklog totals of a single issue."""
+        self.issue_count += 1
+        if not worklogs:
+            return
+        self.worklog_count += worklogs
+
+        issue_seconds = 0.0
+        for user, seconds in by_user.items():
+            self.by_user[user] = self.by_user.get(user, 0.0) + seconds
+            issue_seconds += seconds
+        self.total_seconds += issue_seconds
+
+        entry = (issue_seconds, issue_key)
+        if len(self._top_issues) < self.top_n:
+            heapq.heappush(self._top_issues, entry)
+        elif self.top_n and issue_seconds > self._top_issues[0][0]:
+            heapq.heapreplace(self._top_issues, entry)
+
+    def add_error(self, issue_key: str, error: BaseException) -> None:
+        """Record an issue whose worklogs could not be fetched."""
+        self.errors.append(f"{issue_key}: {error}")
+
+    @property
+    def top_issues(self) -> List[Tuple[float, str]]:
+        """Issues with the most time logged as (seconds, key), largest first."""
+        return sorted(self._top_issues, reverse=True)
+
+
+def _epoch_ms(day: date) -> int:
+    return int(datetime.combine(day, time(0, 0), tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def issue_worklog_totals(
+    client: JiraClient, issue: Dict[str, Any], since: date, until: date
+) -> Tuple[Dict[str, float], int]:
+    """
+    Sum the time logged on one issue within a date window, by user.
+
+    The worklog page embedded in the search result is used when it is
+    complete; otherwise the issue's worklogs are streamed from the API.
+
+    Args:
+        client: JiraClient used to stream worklogs
+        issue: Issue dictionary from a search with the worklog field
+        since: First day of the window (inclusive)
+        until: Last day of the window (inclusive)
+
+    Returns:
+        Tuple of (seconds logged per user display name, number of worklogs counted)
+    """
+    embedded = (issue.get("fields") or {}).get("worklog") or {}
+    worklogs: Iterable[Dict[str, Any]] = embedded.get("worklogs", [])
+    if embedded.get("total", 0) > len(embedded.get("worklogs", [])):
+        # The API filters by instant, but the window is by calendar day in each
+        # worklog's own offset (up to a day away from UTC), so ask for a day more
+        # on each side and let the check below decide, as for embedded worklogs
+        worklogs = client.iter_worklogs(
+            issue["key"],
+            started_after=_epoch_ms(since - timedelta(days=1)),
+            started_before=_epoch_ms(until + timedelta(days=2)),
+        )
+
+    by_user: Dict[str, float] = {}
+    count = 0
+    for worklog in worklogs:
+        # Window is by the calendar day the work started, in the worklog's own offset
+        started = parse_jira_datetime(worklog["started"]).date()
+        if not since <= started <= until:
+            continue
+        author = worklog.get("author") or {}
+        user = author.get("displayName") or author.get("accountId") or "Unknown"
+        by_user[user] = by_user.get(user, 0.0) + worklog.get("timeSpentSeconds", 0)
+        count += 1
+    return by_user, count
+
+
+def compute_time_report(
+    client: JiraClient,
+    jql: str,
+    since: date,
+    until: date,
+    max_issues: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    top_n: int = 10,
+) -> TimeReport:
+    """
+    Stream issues matching a JQL query and total the time logged in a date window.
+
+    Worklogs are fetched concurrently and folded into per-user and per-issue
+    totals as they arrive; individual worklogs are never accumulated.
+
+    Args:
+        client: JiraClient instance
+        jql: JQL query selecting the issues to include
+        since: First day of the window (inclusive)
+        until: Last day of the window (inclusive)
+        max_issues: Maximum number of issues to scan (optional)
+        concurrency: Maximum number of issues whose worklogs are fetched at once
+            (default: the client's configured concurrency)
+        top_n: Number of issues with the most time logged to keep in the report
+
+    Returns:
+        TimeReport with aggregate totals
+    """
+    report = TimeReport(top_n=top_n)
+    issues = client.iter_issues(jql, fields=TIME_REPORT_FIELDS, limit=max_issues)
+
+    logger.info("Computing time report for %s to %s, JQL: %s", since, until, jql)
+    for issue, result, error in map_bounded(
+        lambda issue: issue_worklog_totals(client, issue, since, until),
+        issues,
+        concurrency or client.concurrency,
+    ):
+        if error is not None:
+            report.add_error(issue.get("key", "?"), error)
+            report_progress(error=f"{issue.get('key', '?')}: {error}")
+            continue
+        by_user, count = result
+        report.add_issue(issue["key"], by_user, count)
+        report_progress()
+
+    return report
@@ -0,0 +1,42 @@
+"""Shared fixtures: a small FakeJira dataset and a JiraClient wired to it."""
+
+import asyncio
+
+import pytest
+
+from benchmarks.fake_jira import FakeJira
+from jira_mcp import server
+from jira_mcp.metrics import registry
+
+
+@pytest.fixture
+def fake() -> FakeJira:
+    """A fresh in-memory Jira with 60 issues in two projects."""
+    return FakeJira(issues=60, projects=2, users=5)
+
+
+@pytest.fixture
+def client(fake):
+    """A JiraClient sending its requests to the fake."""
+    client = fake.client()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def call_tool(client, monkeypatch):
+    """Call a tool through the server's dispatcher, with the fake's client, for its reply text."""
+    monkeypatch.setattr(server, "jira_client", client)
+
+    def call(name, arguments):
+        return asyncio.run(server.handle_tool_call(name, arguments))[0].text
+
+    return call
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Start every test with empty process-wide metrics."""
+    registry.reset()
+    yield
+    registry.reset()
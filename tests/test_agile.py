@@ -0,0 +1,61 @@
+"""Sprint reports: scope, per-assignee work left and the day-by-day burndown."""
+
+from datetime import datetime, timezone
+
+from jira_mcp.agile import BoardColumns, build_sprint_report
+
+COLUMNS = BoardColumns(
+    ["To Do", "In Progress", "Done"],
+    {"1": "To Do", "3": "In Progress", "10001": "Done"},
+    estimation_field="customfield_10016",
+    estimation_name="Story Points",
+)
+SPRINT = {
+    "id": 7,
+    "name": "Sprint 7",
+    "state": "active",
+    "startDate": "2024-03-04T00:00:00.000Z",
+    "endDate": "2024-03-08T00:00:00.000Z",
+}
+NOW = datetime(2024, 3, 6, 12, tzinfo=timezone.utc)
+
+
+def _issue(key, status_id, points, assignee=None, resolved=None):
+    return {
+        "key": key,
+        "fields": {
+            "status": {"id": status_id},
+            "customfield_10016": points,
+            "assignee": {"displayName": assignee} if assignee else None,
+            "resolutiondate": resolved,
+        },
+    }
+
+
+ISSUES = [
+    _issue("PROJ-1", "10001", 3, "Ann", resolved="2024-03-04T15:00:00.000+0000"),
+    _issue("PROJ-2", "10001", 2, "Bob", resolved="2024-03-06T09:00:00.000+0000"),
+    _issue("PROJ-3", "3", 5, "Ann"),
+    _issue("PROJ-4", "1", None),
+]
+
+
+def test_scope_and_work_left_by_assignee():
+    report = build_sprint_report({"id": 1}, SPRINT, COLUMNS, ISSUES, NOW)
+    assert (report.issue_count, report.done_count, report.unestimated) == (4, 2, 1)
+    assert (report.total, report.done, report.remaining) == (10.0, 5.0, 5.0)
+    assert report.by_column == {"To Do": [1, 0.0], "In Progress": [1, 5.0], "Done": [2, 5.0]}
+    assert report.remaining_by_assignee == {"Ann": [1, 5.0], "Unassigned": [1, 0.0]}
+
+
+def test_burndown_burns_points_on_the_day_they_were_resolved():
+    report = build_sprint_report({"id": 1}, SPRINT, COLUMNS, ISSUES, NOW)
+    assert [(day.day, remaining, ideal) for day, remaining, ideal in report.burndown] == [
+        (4, 7.0, 7.5),
+        (5, 7.0, 5.0),
+        (6, 5.0, 2.5),
+    ]
+    assert report.elapsed_days == 2.5
+    assert report.days_left == 1.5
+    # Burning 2 a day, the 5 left take longer than the day and a half to go
+    assert report.projected_remaining == 2.0
@@ -0,0 +1,66 @@
+"""Attachments: streamed transfers, confined to the upload and export directories."""
+
+import os
+
+import pytest
+
+
+@pytest.fixture
+def directories(tmp_path, monkeypatch):
+    """Separate upload and export directories, with a file outside both."""
+    uploads, exports = tmp_path / "uploads", tmp_path / "exports"
+    uploads.mkdir()
+    exports.mkdir()
+    (uploads / "report.txt").write_bytes(b"quarterly numbers\n")
+    (tmp_path / "secret.txt").write_bytes(b"not for Jira\n")
+    monkeypatch.setenv("JIRA_MCP_UPLOAD_DIR", str(uploads))
+    monkeypatch.setenv("JIRA_MCP_EXPORT_DIR", str(exports))
+    return uploads, exports
+
+
+def test_upload_and_download_round_trip(fake, call_tool, directories):
+    _, exports = directories
+    key = next(iter(fake.issues))
+
+    reply = call_tool("jira_attach_file", {"issue_key": key, "file_path": "report.txt"})
+    assert reply.startswith(f"Attached report.txt to {key}")
+    (attachment_id,) = fake.attachments
+
+    reply = call_tool(
+        "jira_download_attachment", {"attachment_id": attachment_id, "path": "copy.txt"}
+    )
+    assert reply.startswith("Downloaded report.txt")
+    assert (exports / "copy.txt").read_bytes() == b"quarterly numbers\n"
+
+
+@pytest.mark.parametrize("file_path", ["../secret.txt", "{tmp}/secret.txt", "link.txt"])
+def test_uploads_outside_the_upload_directory_are_refused(
+    fake, call_tool, directories, tmp_path, file_path
+):
+    uploads, _ = directories
+    os.symlink(tmp_path / "secret.txt", uploads / "link.txt")
+    sent = fake.request_count
+
+    reply = call_tool(
+        "jira_attach_file",
+        {"issue_key": next(iter(fake.issues)), "file_path": file_path.format(tmp=tmp_path)},
+    )
+    assert reply.startswith("Error:")
+    assert "outside the allowed directory" in reply
+    assert fake.request_count == sent
+    assert not fake.attachments
+
+
+@pytest.mark.parametrize("path", ["../stolen.txt", "{tmp}/stolen.txt"])
+def test_downloads_outside_the_export_directory_are_refused(
+    fake, call_tool, directories, tmp_path, path
+):
+    call_tool("jira_attach_file", {"issue_key": next(iter(fake.issues)), "file_path": "report.txt"})
+    (attachment_id,) = fake.attachments
+
+    reply = call_tool(
+        "jira_download_attachment",
+        {"attachment_id": attachment_id, "path": path.format(tmp=tmp_path)},
+    )
+    assert "outside the allowed directory" in reply
+    assert not (tmp_path / "stolen.txt").exists()
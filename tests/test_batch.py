@@ -0,0 +1,167 @@
+"""Batch plans: validation, the dependency graph and `$id.field` references."""
+
+import pytest
+
+from jira_mcp import similar
+from jira_mcp.batch import FAILED, SKIPPED, SUCCEEDED, plan_batch, resolve_references, run_batch
+from jira_mcp.server import TOOL_VALIDATORS
+
+
+@pytest.fixture(autouse=True)
+def no_similarity_indexes(monkeypatch):
+    """Build duplicate-check indexes from this test's fake Jira, not an earlier one's."""
+    monkeypatch.setattr(similar, "_indexes", {})
+
+
+def _run(client, operations):
+    return {op.id: op for op in run_batch(client, plan_batch(operations, TOOL_VALIDATORS))}
+
+
+def _create(op_id, summary, **arguments):
+    return {
+        "id": op_id,
+        "tool": "jira_create_issue",
+        "arguments": {
+            "project_key": "PROJ0", "summary": summary, "issue_type": "Story", **arguments,
+        },
+    }
+
+
+def test_references_pass_results_to_later_operations(fake, client):
+    ran = _run(
+        client,
+        [
+            _create("epic", "Checkout v2", issue_type="Epic"),
+            _create("api", "Checkout API", parent="$epic.key"),
+            _create("ui", "Checkout UI", parent="$epic.key"),
+            {
+                "tool": "jira_link_issues",
+                "arguments": {
+                    "inward_issue": "$api.key",
+                    "outward_issue": "$ui.key",
+                    "link_type": "Blocks",
+                },
+            },
+        ],
+    )
+    assert {op.state for op in ran.values()} == {SUCCEEDED}
+    epic = ran["epic"].result["key"]
+    for story in ("api", "ui"):
+        fields = fake.issues[ran[story].result["key"]]["fields"]
+        assert fields["parent"] == {"key": epic}
+    assert ran["op4"].depends_on == {"api", "ui"}
+    link = fake.links[-1]
+    assert link["inwardIssue"]["key"] == ran["api"].result["key"]
+    assert link["outwardIssue"]["key"] == ran["ui"].result["key"]
+
+
+def test_dependents_of_a_failed_operation_are_skipped(client):
+    ran = _run(
+        client,
+        [
+            {"id": "missing", "tool": "jira_get_issue", "arguments": {"issue_key": "PROJ0-9999"}},
+            {
+                "id": "comment",
+                "tool": "jira_add_comment",
+                "arguments": {"issue_key": "$missing.key", "comment": "hello"},
+            },
+            _create("unrelated", "Carries on"),
+        ],
+    )
+    assert ran["missing"].state == FAILED
+    assert ran["comment"].state == SKIPPED
+    assert "missing" in ran["comment"].error
+    assert ran["unrelated"].state == SUCCEEDED
+
+
+def test_plan_reports_every_problem_before_sending_anything(fake):
+    sent = fake.request_count
+    with pytest.raises(ValueError) as error:
+        plan_batch(
+            [
+                {"id": "a", "tool": "jira_export", "arguments": {}},
+                {"id": "b", "tool": "jira_add_comment", "arguments": {"issue_key": 1}},
+                {"id": "c", "tool": "jira_get_issue", "arguments": {"issue_key": "$nope.key"}},
+                {"id": "c", "tool": "jira_get_issue", "arguments": {"issue_key": "PROJ0-1"}},
+            ],
+            TOOL_VALIDATORS,
+        )
+    message = str(error.value)
+    assert "a: tool 'jira_export' cannot be used in a batch" in message
+    assert "b: issue_key must be string" in message
+    assert "b: comment is required" in message
+    assert "c: depends on unknown operation 'nope'" in message
+    assert "c: duplicate operation id" in message
+    assert fake.request_count == sent
+
+
+def test_plan_rejects_dependency_cycles():
+    with pytest.raises(ValueError, match="dependency cycle"):
+        plan_batch(
+            [
+                {"id": "a", "tool": "jira_get_issue", "arguments": {"issue_key": "$b.key"}},
+                {"id": "b", "tool": "jira_get_issue", "arguments": {"issue_key": "$a.key"}},
+            ],
+            TOOL_VALIDATORS,
+        )
+
+
+def test_referencing_operations_are_validated_after_resolution(client):
+    ran = _run(
+        client,
+        [
+            {"id": "user", "tool": "jira_search_users", "arguments": {"query": "user 1"}},
+            # An integer argument given by a reference to an integer result field
+            {
+                "id": "count",
+                "tool": "jira_search_users",
+                "arguments": {"query": "user", "max_results": "$user.count"},
+            },
+            {
+                "id": "wrong",
+                "tool": "jira_search_users",
+                "arguments": {"query": "user", "max_results": "$user.account_id"},
+            },
+        ],
+    )
+    assert ran["count"].state == SUCCEEDED
+    assert ran["count"].result["count"] == 1
+    assert ran["wrong"].state == FAILED
+    assert "max_results must be integer" in ran["wrong"].error
+
+
+def test_check_duplicates_fails_a_create_that_matches_an_existing_issue(fake, client):
+    existing = next(iter(fake.issues.values()))
+    project = existing["key"].split("-")[0]
+    ran = _run(
+        client,
+        [
+            {
+                "id": "dup",
+                "tool": "jira_create_issue",
+                "arguments": {
+                    "project_key": project,
+                    "summary": existing["fields"]["summary"],
+                    "issue_type": "Task",
+                    "check_duplicates": True,
+                },
+            },
+            {
+                "id": "comment",
+                "tool": "jira_add_comment",
+                "arguments": {"issue_key": "$dup.key", "comment": "created"},
+            },
+        ],
+    )
+    assert ran["dup"].state == FAILED
+    assert existing["key"] in ran["dup"].error
+    assert ran["comment"].state == SKIPPED
+
+
+def test_resolve_references():
+    results = {"epic": {"key": "PROJ-1", "id": 10001}}
+    assert resolve_references("$epic.id", results) == 10001
+    assert resolve_references("Part of $epic.key", results) == "Part of PROJ-1"
+    assert resolve_references({"keys": ["$epic.key", "x"]}, results) == {"keys": ["PROJ-1", "x"]}
+    with pytest.raises(ValueError, match="no field 'url'"):
+        resolve_references("$epic.url", results)
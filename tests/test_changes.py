@@ -0,0 +1,93 @@
+"""Change feeds: snapshots, field diffs and watermark paging against the fake Jira."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from benchmarks.fake_jira import _timestamp
+from jira_mcp import changes
+from jira_mcp.changes import ChangeFeed, get_feed, since_clause
+
+JQL = "project = PROJ0"
+
+
+class Session:
+    """Stands in for an MCP session (only its identity matters)."""
+
+
+def _project_keys(fake, project: str = "PROJ0"):
+    return {key for key in fake.issues if key.startswith(f"{project}-")}
+
+
+def test_first_poll_reports_every_issue_in_scope_as_new(fake, client):
+    feed = ChangeFeed(JQL)
+    reported, more = feed.poll(client, since="-400d", limit=1000)
+    assert not more
+    assert {change.record.key for change in reported} == _project_keys(fake)
+    assert all(change.is_new for change in reported)
+
+
+def test_unchanged_issues_are_not_reported_again(client):
+    feed = ChangeFeed(JQL)
+    feed.poll(client, since="-400d", limit=1000)
+    reported, more = feed.poll(client, limit=1000)
+    assert reported == []
+    assert not more
+
+
+def test_poll_reports_field_level_diffs(fake, client):
+    feed = ChangeFeed(JQL)
+    feed.poll(client, since="-400d", limit=1000)
+    key = sorted(_project_keys(fake))[0]
+    old_status = fake.issues[key]["fields"]["status"]["name"]
+    new_status = "Done" if old_status != "Done" else "To Do"
+    client.transition_issue(key, new_status)
+
+    reported, _ = feed.poll(client, limit=1000)
+    assert [change.record.key for change in reported] == [key]
+    assert ("status", old_status, new_status) in reported[0].changes
+
+
+def test_many_issues_sharing_the_watermark_minute_are_all_drained(fake, client):
+    # More issues share one minute than fit in a poll, so the watermark cannot move past it
+    minute = _timestamp(datetime.now(timezone.utc).replace(second=5, microsecond=0))
+    for key in _project_keys(fake):
+        fake.issues[key]["fields"]["updated"] = minute
+
+    feed = ChangeFeed(JQL)
+    seen = []
+    for _ in range(10):
+        reported, more = feed.poll(client, since="-1d", limit=7)
+        seen.extend(change.record.key for change in reported)
+        if not more:
+            break
+    assert more is False
+    assert len(seen) == len(set(seen)) == len(_project_keys(fake))
+
+
+def test_feeds_are_kept_per_session_and_scope():
+    first, second = Session(), Session()
+    assert get_feed(first, JQL) is get_feed(first, JQL)
+    assert get_feed(first, JQL) is not get_feed(second, JQL)
+    assert get_feed(first, JQL) is not get_feed(first, "project = PROJ1")
+
+
+def test_feeds_of_a_closed_session_are_dropped():
+    session = Session()
+    get_feed(session, JQL)
+    count = len(list(changes.all_feeds()))
+    del session
+    assert len(list(changes.all_feeds())) == count - 1
+
+
+@pytest.mark.parametrize(
+    "since, expected",
+    [("-1h", "-1h"), ("-2d", "-2d"), ("2025-01-31", '"2025-01-31"')],
+)
+def test_since_clause(since, expected):
+    assert since_clause(since) == expected
+
+
+def test_since_clause_rejects_other_values():
+    with pytest.raises(ValueError):
+        since_clause("yesterday")
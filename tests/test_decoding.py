@@ -0,0 +1,81 @@
+"""Response decoding: typed page decoders keep what callers read and drop the rest."""
+
+import json
+
+import pytest
+
+from jira_mcp import decoding
+from jira_mcp.decoding import decode, search_schema
+
+typed_only = pytest.mark.skipif(not decoding.TYPED, reason="typed decoders need msgspec")
+
+AUTHOR = {
+    "accountId": "abc",
+    "displayName": "Ann",
+    "avatarUrls": {"48x48": "https://example.com/a.png"},
+    "self": "https://example.com/user/abc",
+}
+CHANGELOG = {
+    "startAt": 0,
+    "total": 1,
+    "isLast": True,
+    "values": [
+        {
+            "id": "1",
+            "created": "2024-03-01T10:00:00.000+0000",
+            "author": AUTHOR,
+            "items": [{"field": "status", "fromString": "To Do", "toString": "Done", "to": "3"}],
+        }
+    ],
+}
+
+
+@typed_only
+def test_typed_changelog_keeps_read_fields_and_drops_the_rest():
+    page = decode(json.dumps(CHANGELOG).encode(), "changelog")
+    (history,) = page["values"]
+    assert history["author"] == {"accountId": "abc", "displayName": "Ann"}
+    assert history["items"] == [{"field": "status", "fromString": "To Do", "toString": "Done"}]
+    assert history["created"] == "2024-03-01T10:00:00.000+0000"
+    # Keys at their default are omitted, so callers read them with .get() defaults
+    assert (page.get("startAt", 0), page["total"], page["isLast"]) == (0, 1, True)
+
+
+@typed_only
+def test_typed_search_keeps_explicit_nulls():
+    body = {
+        "issues": [
+            {
+                "id": "10001",
+                "key": "PROJ-1",
+                "self": "https://example.com/issue/10001",
+                "fields": {"summary": "Crash", "assignee": None, "status": {"name": "Done"}},
+            }
+        ],
+        "isLast": True,
+    }
+    page = decode(json.dumps(body).encode(), "search")
+    assert page["issues"] == [
+        {
+            "id": "10001",
+            "key": "PROJ-1",
+            "fields": {"summary": "Crash", "assignee": None, "status": {"name": "Done"}},
+        }
+    ]
+
+
+def test_pages_with_unexpected_types_decode_generically():
+    body = json.dumps({"worklogs": [{"started": 20240301, "timeSpentSeconds": "1h"}]}).encode()
+    assert decode(body, "worklog") == json.loads(body)
+
+
+def test_invalid_json_raises_value_error():
+    for schema in (None, "changelog"):
+        with pytest.raises(ValueError):
+            decode(b'{"values": [', schema)
+
+
+def test_searches_for_other_fields_are_decoded_generically():
+    assert search_schema(["customfield_10016"]) is None
+    assert search_schema(["summary", "description"]) is None
+    assert search_schema(["summary", "status"]) == ("search" if decoding.TYPED else None)
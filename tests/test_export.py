@@ -0,0 +1,81 @@
+"""Exports: flattened rows streamed to NDJSON or CSV, written atomically."""
+
+import csv
+import json
+
+import pytest
+
+from jira_mcp.export import export_issues, flatten_value
+
+JQL = "project = PROJ0"
+
+
+def _project_keys(fake, project: str = "PROJ0"):
+    return {key for key in fake.issues if key.startswith(f"{project}-")}
+
+
+def test_flatten_value():
+    assert flatten_value({"displayName": "Ann", "accountId": "abc"}) == "Ann"
+    assert flatten_value([{"name": "High"}, "x", None]) == ["High", "x", None]
+    assert flatten_value({"other": 1}) == '{"other":1}'
+    adf = {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": "Steps"}]}],
+    }
+    assert flatten_value(adf) == "Steps"
+
+
+def test_ndjson_export_writes_one_flattened_row_per_issue(fake, client, tmp_path):
+    path = tmp_path / "issues.ndjson"
+    count = export_issues(client, JQL, str(path), fields=["summary", "status", "labels"])
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert count == len(rows) == len(_project_keys(fake))
+    assert {row["key"] for row in rows} == _project_keys(fake)
+    row = rows[0]
+    fields = fake.issues[row["key"]]["fields"]
+    assert row["status"] == fields["status"]["name"]
+    assert row["labels"] == fields.get("labels", [])
+    assert not (tmp_path / "issues.ndjson.part").exists()
+
+
+def test_csv_export_has_a_header_and_joins_lists(fake, client, tmp_path):
+    key = sorted(_project_keys(fake))[0]
+    fake.issues[key]["fields"]["labels"] = ["a", "b"]
+    path = tmp_path / "issues.csv"
+    export_issues(client, f"key = {key}", str(path), fields=["labels"], fmt="csv")
+
+    with open(path, newline="") as f:
+        assert list(csv.reader(f)) == [["key", "labels"], [key, "a; b"]]
+
+
+def test_existing_files_are_kept_unless_overwrite_is_given(client, tmp_path):
+    path = tmp_path / "issues.ndjson"
+    path.write_text("keep me\n")
+    with pytest.raises(ValueError, match="already exists"):
+        export_issues(client, JQL, str(path))
+    assert path.read_text() == "keep me\n"
+
+    export_issues(client, JQL, str(path), overwrite=True, max_rows=3)
+    assert len(path.read_text().splitlines()) == 3
+
+
+def test_a_failed_export_leaves_no_file(client, tmp_path, monkeypatch):
+    iter_issues = client.iter_issues
+
+    def failing_iter_issues(*args, **kwargs):
+        for count, issue in enumerate(iter_issues(*args, **kwargs)):
+            if count == 5:
+                raise RuntimeError("connection reset")
+            yield issue
+
+    monkeypatch.setattr(client, "iter_issues", failing_iter_issues)
+    with pytest.raises(RuntimeError):
+        export_issues(client, JQL, str(tmp_path / "issues.ndjson"))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unknown_formats_are_rejected(client, tmp_path):
+    with pytest.raises(ValueError, match="Unknown export format"):
+        export_issues(client, JQL, str(tmp_path / "issues.xlsx"), fmt="xlsx")
@@ -0,0 +1,120 @@
+"""Background jobs: outcomes, cancellation, per-session visibility and context."""
+
+import contextvars
+import threading
+import time
+
+import pytest
+
+from jira_mcp.jobs import (
+    CANCELLED,
+    FAILED,
+    FINISHED_STATES,
+    SUCCEEDED,
+    JobManager,
+    report_progress,
+    set_total,
+)
+
+
+class Session:
+    """Stands in for an MCP session (only its identity matters)."""
+
+
+@pytest.fixture
+def jobs():
+    manager = JobManager(max_workers=2)
+    yield manager
+    manager.shutdown()
+
+
+def _wait(job, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while job.state not in FINISHED_STATES:
+        assert time.monotonic() < deadline, f"job still {job.state}"
+        time.sleep(0.005)
+
+
+def test_job_runs_and_keeps_its_result_and_progress(jobs):
+    def work():
+        set_total(3)
+        for i in range(3):
+            report_progress(partial=f"item {i}")
+        return "done"
+
+    job = jobs.submit("jira_export", work)
+    _wait(job)
+    assert job.state == SUCCEEDED
+    assert job.result == "done"
+    assert (job.done, job.total) == (3, 3)
+    assert list(job.partial_results) == ["item 0", "item 1", "item 2"]
+
+
+def test_failed_job_reports_the_error(jobs):
+    def work():
+        raise ValueError("no such project")
+
+    job = jobs.submit("jira_export", work)
+    _wait(job)
+    assert job.state == FAILED
+    assert job.result == "Error: no such project"
+
+
+def test_running_job_stops_at_its_next_checkpoint(jobs):
+    started = threading.Event()
+
+    def work():
+        started.set()
+        for _ in range(1000):
+            report_progress()
+            time.sleep(0.01)
+        return "finished anyway"
+
+    job = jobs.submit("jira_log_work", work)
+    assert started.wait(5)
+    assert jobs.cancel(job.id) is job
+    _wait(job)
+    assert job.state == CANCELLED
+    assert job.done < 1000
+
+
+def test_jobs_are_visible_only_to_the_session_that_started_them(jobs):
+    owner, other = Session(), Session()
+    job = jobs.submit("jira_export", lambda: "ok", session=owner)
+    _wait(job)
+
+    assert jobs.get(job.id, owner) is job
+    assert jobs.list_jobs(owner) == [job]
+    assert jobs.get(job.id, other) is None
+    assert jobs.get(job.id) is None
+    assert jobs.list_jobs(other) == []
+    assert jobs.cancel(job.id, other) is None
+
+
+def test_another_session_cannot_cancel_a_running_job(jobs):
+    owner, other = Session(), Session()
+    release = threading.Event()
+    job = jobs.submit("jira_export", lambda: "ok" if release.wait(5) else "timeout", owner)
+
+    assert jobs.cancel(job.id, other) is None
+    assert not job.cancel_requested
+    release.set()
+    _wait(job)
+    assert job.state == SUCCEEDED
+
+
+def test_job_runs_in_a_copy_of_the_submitting_context(jobs):
+    request_id = contextvars.ContextVar("request_id", default=None)
+    request_id.set("req-1")
+    job = jobs.submit("jira_export", lambda: request_id.get())
+    _wait(job)
+    assert job.result == "req-1"
+
+
+def test_configure_sets_the_concurrency_limit():
+    manager = JobManager()
+    manager.configure(5)
+    assert manager.max_workers == 5
+    manager.configure(0)
+    assert manager.max_workers == 1
+    manager.shutdown()
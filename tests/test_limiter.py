@@ -0,0 +1,118 @@
+"""AIMD steps of the adaptive concurrency limiter, and slot accounting in the client."""
+
+import threading
+
+import pytest
+
+from jira_mcp.limiter import AdaptiveLimiter
+
+
+def _request(limiter: AdaptiveLimiter, status, seconds: float = 0.01) -> None:
+    limiter.acquire()
+    limiter.release("GET /issue/{key}", seconds, status)
+
+
+def test_throttle_halves_the_limit():
+    limiter = AdaptiveLimiter(initial=8)
+    _request(limiter, 429)
+    assert limiter.limit == 4
+    # Sent after the first cut, so it counts again
+    _request(limiter, 503, seconds=0.0)
+    assert limiter.limit == 2
+    assert limiter.stats()["throttle_backoffs"] == 2
+
+
+def test_throttle_never_goes_below_the_minimum():
+    limiter = AdaptiveLimiter(initial=4, minimum=2)
+    for _ in range(5):
+        _request(limiter, 429, seconds=0.0)
+    assert limiter.limit == 2
+
+
+def test_one_wave_of_throttled_requests_cuts_the_limit_once():
+    limiter = AdaptiveLimiter(initial=8)
+    for _ in range(4):
+        limiter.acquire()
+    # Each of these was sent a second ago, before the first cut
+    for _ in range(4):
+        limiter.release("GET /search/jql", 1.0, 429)
+    assert limiter.limit == 4
+    assert limiter.stats()["throttle_backoffs"] == 1
+
+
+def test_latency_spike_cuts_the_limit_by_ten_percent():
+    limiter = AdaptiveLimiter(initial=10)
+    _request(limiter, 200, seconds=0.01)
+    _request(limiter, 200, seconds=0.5)
+    assert limiter.limit == 9
+    assert limiter.stats()["latency_backoffs"] == 1
+
+
+def test_jitter_on_fast_endpoints_is_not_a_spike():
+    limiter = AdaptiveLimiter(initial=10)
+    _request(limiter, 200, seconds=0.001)
+    _request(limiter, 200, seconds=0.01)
+    assert limiter.limit == 10
+
+
+def test_limit_grows_while_saturated_up_to_the_maximum():
+    limiter = AdaptiveLimiter(initial=2, maximum=4)
+    for _ in range(50):
+        slots = int(limiter.limit)
+        for _ in range(slots):
+            limiter.acquire()
+        for _ in range(slots):
+            limiter.release("GET /issue/{key}", 0.01, 200)
+    assert limiter.limit == 4
+
+
+def test_limit_does_not_grow_when_slots_are_idle():
+    limiter = AdaptiveLimiter(initial=4)
+    for _ in range(20):
+        _request(limiter, 200)
+    assert limiter.limit == 4
+
+
+def test_server_errors_leave_the_limit_alone():
+    limiter = AdaptiveLimiter(initial=4)
+    _request(limiter, 500)
+    _request(limiter, None)
+    assert limiter.limit == 4
+
+
+def test_acquire_waits_for_a_free_slot():
+    limiter = AdaptiveLimiter(initial=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def second():
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=second)
+    thread.start()
+    assert not acquired.wait(0.05)
+    limiter.release("GET /issue/{key}", 0.01, 200)
+    assert acquired.wait(1)
+    thread.join()
+    assert limiter.stats()["waits"] == 1
+
+
+def test_disabled_limiter_never_blocks():
+    limiter = AdaptiveLimiter(initial=1, enabled=False)
+    for _ in range(10):
+        limiter.acquire()
+    assert limiter.in_flight == 10
+
+
+def test_client_gives_the_slot_back_when_the_transport_raises(fake, monkeypatch):
+    client = fake.client()
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("transport bug")
+
+    monkeypatch.setattr(client.client, "request", broken)
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            client.get_issue(next(iter(fake.issues)))
+    assert client.limiter.in_flight == 0
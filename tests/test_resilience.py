@@ -0,0 +1,92 @@
+"""Circuit breaker transitions, on their own and in front of the fake Jira."""
+
+import time
+
+import pytest
+
+from jira_mcp.jira_client import JiraAPIError
+from jira_mcp.resilience import CircuitBreakers, CircuitOpenError
+
+ENDPOINT = "GET /issue/{key}"
+
+
+def _fail(breakers: CircuitBreakers, times: int) -> None:
+    for _ in range(times):
+        breakers.check(ENDPOINT)
+        breakers.record(ENDPOINT, False)
+
+
+def test_breaker_opens_after_threshold_consecutive_failures():
+    breakers = CircuitBreakers(threshold=3, reset_timeout=60)
+    _fail(breakers, 2)
+    breakers.check(ENDPOINT)
+    breakers.record(ENDPOINT, False)
+    with pytest.raises(CircuitOpenError):
+        breakers.check(ENDPOINT)
+
+
+def test_success_resets_the_failure_count():
+    breakers = CircuitBreakers(threshold=3, reset_timeout=60)
+    _fail(breakers, 2)
+    breakers.record(ENDPOINT, True)
+    _fail(breakers, 2)
+    breakers.check(ENDPOINT)
+
+
+def test_breakers_are_per_endpoint():
+    breakers = CircuitBreakers(threshold=1, reset_timeout=60)
+    _fail(breakers, 1)
+    breakers.check("POST /search/jql")
+
+
+def test_half_open_breaker_lets_one_probe_through():
+    breakers = CircuitBreakers(threshold=1, reset_timeout=0.05)
+    _fail(breakers, 1)
+    time.sleep(0.06)
+    breakers.check(ENDPOINT)
+    with pytest.raises(CircuitOpenError):
+        breakers.check(ENDPOINT)
+
+
+def test_successful_probe_closes_the_breaker():
+    breakers = CircuitBreakers(threshold=1, reset_timeout=0.05)
+    _fail(breakers, 1)
+    time.sleep(0.06)
+    breakers.check(ENDPOINT)
+    breakers.record(ENDPOINT, True)
+    breakers.check(ENDPOINT)
+    breakers.check(ENDPOINT)
+    assert "all closed" in breakers.format_summary()
+
+
+def test_failed_probe_reopens_the_breaker():
+    breakers = CircuitBreakers(threshold=1, reset_timeout=0.05)
+    _fail(breakers, 1)
+    time.sleep(0.06)
+    breakers.check(ENDPOINT)
+    breakers.record(ENDPOINT, False)
+    with pytest.raises(CircuitOpenError):
+        breakers.check(ENDPOINT)
+    assert "1 trip(s)" in breakers.format_summary()
+
+
+def test_threshold_zero_disables_breakers():
+    breakers = CircuitBreakers(threshold=0)
+    _fail(breakers, 10)
+    breakers.check(ENDPOINT)
+    assert breakers.format_summary() == "Circuit breakers: disabled"
+
+
+def test_client_fails_fast_during_an_outage(fake):
+    client = fake.client(breaker_threshold=2, breaker_reset=60)
+    key = next(iter(fake.issues))
+    fake.unavailable = True
+    for _ in range(2):
+        with pytest.raises(JiraAPIError):
+            client.get_issue(key)
+    sent = fake.request_count
+
+    with pytest.raises(CircuitOpenError):
+        client.get_issue(key)
+    assert fake.request_count == sent
+    client.close()
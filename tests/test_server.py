@@ -0,0 +1,40 @@
+"""Tool dispatch: arguments are validated before any request reaches Jira."""
+
+import pytest
+
+from jira_mcp.server import BACKGROUND_TOOLS
+
+
+@pytest.mark.parametrize(
+    "name, arguments, problem",
+    [
+        ("jira_get_issue", {}, "issue_key is required"),
+        ("jira_get_issue", {"issue_key": 7}, "issue_key must be string"),
+        ("jira_search", {"jql": "project = PROJ0", "max_results": "ten"}, "must be integer"),
+        ("jira_get_issue", {"issue_key": "PROJ0-1", "background": True}, "background"),
+    ],
+)
+def test_invalid_calls_are_rejected_before_any_request(fake, call_tool, name, arguments, problem):
+    sent = fake.request_count
+    reply = call_tool(name, arguments)
+    assert reply.startswith(f"Error: Invalid arguments for {name}:")
+    assert problem in reply
+    assert fake.request_count == sent
+
+
+def test_unknown_tools_are_rejected(fake, call_tool):
+    sent = fake.request_count
+    assert call_tool("jira_delete_everything", {}) == "Unknown tool: jira_delete_everything"
+    assert fake.request_count == sent
+
+
+def test_valid_calls_reach_jira(fake, call_tool):
+    key = next(iter(fake.issues))
+    sent = fake.request_count
+    assert key in call_tool("jira_get_issue", {"issue_key": key})
+    assert fake.request_count > sent
+
+
+def test_only_bulk_tools_run_in_the_background():
+    assert {"jira_export", "jira_batch", "jira_update_issues"} <= BACKGROUND_TOOLS
+    assert not {"jira_get_issue", "jira_create_issue", "jira_job_status"} & BACKGROUND_TOOLS
@@ -0,0 +1,56 @@
+"""Config files: instances, tuning defaults and the checks on their values."""
+
+import pytest
+
+from jira_mcp.settings import load_config_file
+
+INSTANCE = """
+[instances.acme]
+url = "https://acme.atlassian.net"
+email = "me@acme.test"
+api_token = "token"
+"""
+
+
+def _load(tmp_path, text):
+    path = tmp_path / "config.toml"
+    path.write_text(text)
+    return load_config_file(str(path))
+
+
+def test_instance_values_override_tuning_defaults(tmp_path):
+    parsed = _load(
+        tmp_path,
+        'default_instance = "acme"\n[tuning]\ntimeout = 10\nconcurrency = 4\n'
+        + INSTANCE
+        + "concurrency = 6\nadaptive_concurrency = false\n",
+    )
+    config = parsed.instances["acme"]
+    assert parsed.default_instance == "acme"
+    assert (config.timeout, config.concurrency, config.adaptive_concurrency) == (10.0, 6, False)
+    assert isinstance(config.timeout, float)
+
+
+@pytest.mark.parametrize(
+    "extra, message",
+    [
+        ('timeout = "30"', "timeout for instance 'acme' should be a number, not str"),
+        ("concurrency = 2.5", "concurrency for instance 'acme' should be an integer, not float"),
+        ("concurrency = true", "concurrency for instance 'acme' should be an integer, not bool"),
+        ('adaptive_concurrency = "no"', "should be true or false, not str"),
+        ("api_token_env = 1", "api_token_env for instance 'acme' should be a string, not int"),
+    ],
+)
+def test_values_of_the_wrong_type_are_rejected_by_name(tmp_path, extra, message):
+    with pytest.raises(ValueError, match=message):
+        _load(tmp_path, INSTANCE + extra + "\n")
+
+
+def test_tuning_defaults_of_the_wrong_type_are_rejected_by_name(tmp_path):
+    with pytest.raises(ValueError, match="max_transfers for instance 'acme' should be an integer"):
+        _load(tmp_path, '[tuning]\nmax_transfers = "2"\n' + INSTANCE)
+
+
+def test_unknown_settings_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown setting"):
+        _load(tmp_path, INSTANCE + "retries = 3\n")
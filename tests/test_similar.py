@@ -0,0 +1,52 @@
+"""Similarity index: ranking, background builds and project key checks."""
+
+import threading
+
+import pytest
+
+from jira_mcp import similar
+from jira_mcp.similar import find_similar, get_index, note_created
+
+
+@pytest.fixture(autouse=True)
+def no_similarity_indexes(monkeypatch):
+    """Build indexes from this test's fake Jira, not an earlier one's."""
+    monkeypatch.setattr(similar, "_indexes", {})
+
+
+def test_issue_with_the_same_summary_ranks_first(fake, client):
+    issue = next(issue for key, issue in fake.issues.items() if key.startswith("PROJ0-"))
+    matches = find_similar(client, "proj0", issue["fields"]["summary"])
+    assert matches
+    assert matches[0].key == issue["key"]
+    assert matches[0].score >= similar.DUPLICATE_THRESHOLD
+    assert len(get_index("PROJ0")) == sum(key.startswith("PROJ0-") for key in fake.issues)
+
+
+def test_build_runs_in_the_background_without_holding_up_queries(fake, client, monkeypatch):
+    release = threading.Event()
+    iter_issues = client.iter_issues
+
+    def slow_iter_issues(*args, **kwargs):
+        assert release.wait(5)
+        yield from iter_issues(*args, **kwargs)
+
+    monkeypatch.setattr(client, "iter_issues", slow_iter_issues)
+    assert find_similar(client, "PROJ0", "Checkout crashes on empty cart", wait=0) is None
+
+    # Created while the build runs; the build must not replace or drop it
+    note_created("PROJ0", "PROJ0-999", "Checkout crashes on empty cart")
+    release.set()
+    assert get_index("PROJ0").ready.wait(5)
+
+    matches = find_similar(client, "PROJ0", "Checkout crashes on empty cart", wait=0)
+    assert matches[0].key == "PROJ0-999"
+    assert len(get_index("PROJ0")) == 1 + sum(key.startswith("PROJ0-") for key in fake.issues)
+
+
+@pytest.mark.parametrize("project_key", ['PROJ0" OR project = "PROJ1', "PROJ\\", "1ABC", ""])
+def test_invalid_project_keys_never_reach_jql(fake, client, project_key):
+    sent = fake.request_count
+    with pytest.raises(ValueError, match="Invalid project key"):
+        find_similar(client, project_key, "anything")
+    assert fake.request_count == sent
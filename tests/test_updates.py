@@ -0,0 +1,103 @@
+"""Bulk updates: diffing a patch against current values and writing only the changes."""
+
+from jira_mcp.updates import changed_fields, projection, update_issues
+
+JQL = "project = PROJ1"
+
+
+def _adf(*paragraphs):
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+            for text in paragraphs
+        ],
+    }
+
+
+def _writes(client, run):
+    """Run an update and return (its results by key, number of PUT requests it sent)."""
+
+    def puts():
+        return sum(
+            stats.count for (method, _), stats in client.metrics.requests.items() if method == "PUT"
+        )
+
+    before = puts()
+    results = {key: (changes, error) for key, changes, error in run()}
+    return results, puts() - before
+
+
+def test_projection_requests_only_patched_fields():
+    assert projection({"summary": "x"}) == ["summary"]
+    assert projection({"add_labels": ["a"], "priority": "High"}) == ["priority", "labels"]
+
+
+def test_changed_fields_drops_values_already_set():
+    current = {
+        "summary": "Fix login",
+        "priority": {"name": "High"},
+        "labels": ["b", "a"],
+        "parent": {"key": "PROJ-1"},
+    }
+    patch = {"summary": "Fix login", "priority": "High", "labels": ["a", "b"], "parent": "PROJ-1"}
+    assert changed_fields(current, patch) == {}
+    assert changed_fields(current, {**patch, "priority": "Low"}) == {"priority": "Low"}
+
+
+def test_description_with_the_same_text_in_another_layout_is_unchanged():
+    current = {"description": _adf("Steps to", "reproduce  the crash")}
+    assert changed_fields(current, {"description": "Steps to reproduce the crash"}) == {}
+    assert changed_fields(current, {"description": "Other text"}) == {"description": "Other text"}
+    assert changed_fields({"description": None}, {"description": ""}) == {}
+
+
+def test_label_edits_apply_to_current_labels():
+    current = {"labels": ["backend", "old"]}
+    patch = {"add_labels": ["urgent", "backend"], "remove_labels": ["old"]}
+    assert changed_fields(current, patch) == {"labels": ["backend", "urgent"]}
+    assert changed_fields({"labels": ["backend", "urgent"]}, patch) == {}
+
+
+def test_update_writes_only_issues_that_differ(fake, client):
+    keys = sorted(key for key in fake.issues if key.startswith("PROJ1-"))
+    fake.issues[keys[0]]["fields"]["labels"] = ["triaged"]
+
+    def run():
+        return update_issues(client, {"add_labels": ["triaged"]}, jql=JQL)
+
+    results, writes = _writes(client, run)
+    assert set(results) == set(keys)
+    assert results[keys[0]] == ({}, None)
+    assert writes == len(keys) - 1
+    assert all("triaged" in fake.issues[key]["fields"]["labels"] for key in keys)
+
+    # Everything is up to date now, so a second run only reads
+    results, writes = _writes(client, run)
+    assert writes == 0
+    assert all(changes == {} for changes, _ in results.values())
+
+
+def test_dry_run_reports_changes_without_writing(fake, client):
+    key = next(key for key in fake.issues if key.startswith("PROJ1-"))
+    results, writes = _writes(
+        client,
+        lambda: update_issues(client, {"summary": "Renamed"}, issue_keys=[key], dry_run=True),
+    )
+    assert results == {key: ({"summary": "Renamed"}, None)}
+    assert writes == 0
+    assert fake.issues[key]["fields"]["summary"] != "Renamed"
+
+
+def test_errors_are_reported_per_issue(fake, client):
+    key = next(iter(fake.issues))
+    results = {
+        key: error
+        for key, _, error in update_issues(
+            client, {"summary": "Renamed"}, issue_keys=[key, "PROJ1-9999"]
+        )
+    }
+    assert results[key] is None
+    assert results["PROJ1-9999"] is not None
+    assert fake.issues[key]["fields"]["summary"] == "Renamed"
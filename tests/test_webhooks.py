@@ -0,0 +1,143 @@
+"""Webhook receiver: signature checks and applying pushed events to change feeds."""
+
+import copy
+import hashlib
+import hmac
+import json
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from jira_mcp import changes, webhooks
+from jira_mcp.changes import get_feed
+from jira_mcp.webhooks import WEBHOOK_PATH, verify_signature, webhook_routes
+
+SECRET = "s3cret"
+JQL = "project = PROJ0"
+
+
+class Session:
+    """Stands in for an MCP session (only its identity matters)."""
+
+
+def _sign(body: bytes, secret: str = SECRET) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def no_push_history(monkeypatch):
+    """Keep pushed events from leaking into other tests' feeds."""
+    monkeypatch.setattr(changes, "push_started", None)
+    monkeypatch.setattr(changes, "last_push", None)
+
+
+@pytest.fixture
+def receiver():
+    return TestClient(Starlette(routes=webhook_routes(SECRET)))
+
+
+@pytest.fixture
+def followed(fake, client):
+    """A session's feed following PROJ0, and the key of one issue it has a snapshot of."""
+    session = Session()
+    feed = get_feed(session, JQL)
+    feed.poll(client, since="-400d", limit=1000)
+    key = next(iter(feed.snapshots))
+    yield feed, key
+    del session
+
+
+def _updated_event(fake, key: str, status: str) -> bytes:
+    issue = copy.deepcopy(fake.issues[key])
+    issue["fields"]["status"] = {"name": status, "statusCategory": {"key": "done"}}
+    issue["fields"]["updated"] = "2099-01-01T00:00:00.000+0000"
+    return json.dumps({"webhookEvent": "jira:issue_updated", "issue": issue}).encode()
+
+
+def test_verify_signature():
+    body = b'{"webhookEvent": "jira:issue_deleted"}'
+    assert verify_signature(body, _sign(body), SECRET)
+    assert not verify_signature(body, _sign(body, "other"), SECRET)
+    assert not verify_signature(body + b" ", _sign(body), SECRET)
+    assert not verify_signature(body, None, SECRET)
+    assert not verify_signature(body, _sign(body)[len("sha256="):], SECRET)
+
+
+def test_routes_need_a_secret_unless_insecure_is_explicit():
+    with pytest.raises(ValueError):
+        webhook_routes()
+    assert webhook_routes(insecure=True)
+
+
+def test_unsigned_and_badly_signed_events_are_rejected(fake, receiver, followed):
+    feed, key = followed
+    body = _updated_event(fake, key, "Done")
+
+    assert receiver.post(WEBHOOK_PATH, content=body).status_code == 401
+    response = receiver.post(
+        WEBHOOK_PATH, content=body, headers={"X-Hub-Signature": _sign(body, "guess")}
+    )
+    assert response.status_code == 401
+    assert not feed.pending
+    assert changes.last_push is None
+
+
+def test_signed_update_is_applied_to_feeds_following_the_issue(fake, receiver, followed):
+    feed, key = followed
+    old_status = feed.snapshots[key].status
+    new_status = "Done" if old_status != "Done" else "To Do"
+    body = _updated_event(fake, key, new_status)
+
+    response = receiver.post(WEBHOOK_PATH, content=body, headers={"X-Hub-Signature": _sign(body)})
+    assert response.status_code == 200
+    assert response.json() == {"event": "jira:issue_updated", "applied": 1}
+
+    with feed.lock:
+        reported = feed.drain()
+    assert [change.record.key for change in reported] == [key]
+    assert ("status", old_status, new_status) in reported[0].changes
+
+
+def test_signed_delete_removes_the_snapshot(receiver, followed):
+    feed, key = followed
+    body = json.dumps({"webhookEvent": "jira:issue_deleted", "issue": {"key": key}}).encode()
+
+    response = receiver.post(WEBHOOK_PATH, content=body, headers={"X-Hub-Signature": _sign(body)})
+    assert response.json()["applied"] == 1
+    assert key not in feed.snapshots
+    with feed.lock:
+        (change,) = feed.drain()
+    assert change.is_deleted
+
+
+def test_malformed_bodies_are_rejected(receiver):
+    for body in (b"not json", b"[1, 2]"):
+        response = receiver.post(
+            WEBHOOK_PATH, content=body, headers={"X-Hub-Signature": _sign(body)}
+        )
+        assert response.status_code == 400
+
+
+def test_issue_events_do_not_reach_scoped_feeds_that_do_not_follow_the_issue(fake, receiver):
+    session = Session()
+    feed = get_feed(session, JQL)
+    body = _updated_event(fake, next(iter(fake.issues)), "Done")
+
+    response = receiver.post(WEBHOOK_PATH, content=body, headers={"X-Hub-Signature": _sign(body)})
+    assert response.json()["applied"] == 0
+    assert not feed.pending
+
+
+def test_oversized_bodies_are_rejected(receiver, monkeypatch):
+    monkeypatch.setattr(webhooks, "MAX_BODY_BYTES", 1000)
+    body = json.dumps({"webhookEvent": "jira:issue_deleted", "pad": "x" * 2000}).encode()
+
+    def chunks():
+        for start in range(0, len(body), 100):
+            yield body[start:start + 100]
+
+    headers = {"X-Hub-Signature": _sign(body)}
+    assert receiver.post(WEBHOOK_PATH, content=body, headers=headers).status_code == 413
+    # A chunked body declares no length and is cut off once it passes the limit
+    assert receiver.post(WEBHOOK_PATH, content=chunks(), headers=headers).status_code == 413
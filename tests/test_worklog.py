@@ -0,0 +1,59 @@
+"""Time report totals: the same worklogs count the same whether embedded or streamed."""
+
+from datetime import date
+
+import pytest
+
+from jira_mcp.worklog import compute_time_report, issue_worklog_totals
+
+DAY = date(2024, 3, 1)
+
+
+def _worklog(started: str, seconds: int = 3600, user: str = "Ann"):
+    return {"author": {"displayName": user}, "started": started, "timeSpentSeconds": seconds}
+
+
+# Started on March 1st in the worklog's own offset, but on another day in UTC
+EDGE_WORKLOGS = [
+    _worklog("2024-03-01T23:30:00.000-0800"),  # 2024-03-02 07:30 UTC
+    _worklog("2024-03-01T00:30:00.000+1000"),  # 2024-02-29 14:30 UTC
+    _worklog("2024-03-02T00:30:00.000+0000"),  # the next day: not counted
+    _worklog("2024-02-29T23:30:00.000+0000"),  # the day before: not counted
+]
+
+
+@pytest.fixture
+def issue_key(fake):
+    """An issue with the edge worklogs plus enough others that its embedded page is incomplete."""
+    key = next(iter(fake.issues))
+    filler = [_worklog("2024-01-10T09:00:00.000+0000", user="Bob") for _ in range(25)]
+    fake.worklogs[key] = filler + EDGE_WORKLOGS
+    return key
+
+
+def test_streamed_worklogs_use_each_worklogs_own_calendar_day(fake, client, issue_key):
+    issue = client.get_issue(issue_key, fields=["worklog"])
+    embedded = issue["fields"]["worklog"]
+    assert embedded["total"] > len(embedded["worklogs"])
+
+    by_user, count = issue_worklog_totals(client, issue, DAY, DAY)
+    assert (by_user, count) == ({"Ann": 7200.0}, 2)
+
+
+def test_streamed_and_embedded_worklogs_give_the_same_totals(fake, client, issue_key):
+    fetched = client.get_issue(issue_key, fields=["worklog"])
+    streamed = issue_worklog_totals(client, fetched, DAY, DAY)
+    issue = {
+        "key": issue_key,
+        "fields": {"worklog": {"total": len(EDGE_WORKLOGS), "worklogs": EDGE_WORKLOGS}},
+    }
+    assert issue_worklog_totals(client, issue, DAY, DAY) == streamed
+
+
+def test_time_report_totals_by_user_and_issue(fake, client, issue_key):
+    # Everything but the worklog started on March 2nd
+    report = compute_time_report(client, f"key = {issue_key}", date(2024, 1, 1), DAY)
+    assert report.issue_count == 1
+    assert report.worklog_count == 28
+    assert report.by_user == {"Bob": 25 * 3600.0, "Ann": 3 * 3600.0}
+    assert report.top_issues == [(28 * 3600.0, issue_key)]